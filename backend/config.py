@@ -8,12 +8,87 @@ class Settings(BaseSettings):
     everos_mode: str = "mock"  # mock | cloud
     everos_base_url: str = "https://api.evermind.ai"
     everos_api_key: str = ""
+    everos_http2: bool = True  # used only when the h2 package is installed
+    everos_max_connections: int = 100
+    everos_max_keepalive_connections: int = 20
+    everos_keepalive_expiry: float = 30.0  # seconds
+    everos_connect_timeout: float = 5.0  # seconds
+    everos_timeout: float = 30.0  # seconds
+    everos_ingest_concurrency: int = 8  # parallel store_message calls per meeting
+    everos_rate_limit: float = 50.0  # requests/second; 0 disables
+    everos_rate_burst: int = 100
+    everos_call_deadline: float = 10.0  # seconds per call, retries included
+    # Batch store_message calls into one POST (needs an EverOS that accepts
+    # a "messages" list); each group is flushed once per batch
+    everos_batch_ingest: bool = False
+    everos_batch_max_size: int = 50  # messages per request
+    everos_batch_max_delay: float = 0.05  # seconds to wait for a batch to fill
+    everos_search_cache_enabled: bool = True
+    everos_search_cache_max_entries: int = 1024
+    everos_search_cache_ttl: float = 60.0  # seconds; writes also invalidate
+    search_everos_deadline: float = 6.0  # seconds; then serve local results only
+    search_fusion_deadline: float = 1.5  # seconds before slow methods are dropped
+    mock_vector_dim: int = 128  # local embedding size in mock mode
+    mock_hybrid_alpha: float = 0.5  # vector weight in mock hybrid fusion
 
     # OpenAI
     openai_api_key: str = ""
     openai_base_url: str = ""
+    openai_rate_limit: float = 8.0  # requests/second; 0 disables
+    openai_rate_burst: int = 16
+    openai_call_deadline: float = 90.0  # seconds per completion, retries included
+    openai_stream_deadline: float = 15.0  # seconds until a stream starts
     llm_model_analysis: str = "gpt-4o"
     llm_model_stream: str = "gpt-4o-mini"
+    llm_combined_analysis: bool = False  # one LLM call for summary + commitments
+    llm_chunk_tokens: int = 3000  # longer notes are analyzed in chunks this size
+    # LLM scheduling: live briefings (interactive) ahead of analysis (batch)
+    llm_max_concurrency: int = 8  # in-flight requests per model
+    llm_model_concurrency: dict[str, int] = {}  # per-model overrides
+    llm_tpm_limit: int = 0  # tokens per minute per model; 0 disables
+    llm_model_tpm: dict[str, int] = {}  # per-model overrides
+    llm_interactive_reserved: int = 2  # slots batch requests never take
+    llm_interactive_target_ms: float = 1500.0  # above this, one batch at a time
+    llm_cache_enabled: bool = True
+    llm_cache_max_entries: int = 512  # in-memory LRU tier
+    llm_cache_ttl: float = 86400.0  # seconds
+    llm_cache_path: str = ""  # SQLite file for the disk tier; empty disables it
+    llm_cache_max_disk_bytes: int = 64 * 1024 * 1024
+
+    # Upstream calls (EverOS and OpenAI): retry and circuit breaker
+    upstream_max_retries: int = 3  # on 429, 5xx, timeouts, connection errors
+    upstream_retry_base: float = 0.25  # seconds; full jitter, doubled per attempt
+    upstream_retry_max: float = 8.0  # seconds
+    upstream_breaker_threshold: int = 5  # consecutive failures before opening
+    upstream_breaker_reset: float = 15.0  # seconds open before a half-open probe
+
+    # Briefings
+    briefing_cache_enabled: bool = True  # replay precomputed briefings
+    briefing_cache_max_entries: int = 256
+    briefing_regen_delay: float = 2.0  # seconds; debounces bursts of changes
+    briefing_regen_concurrency: int = 2
+    briefing_prewarm_interval: float = 3600.0  # seconds; 0 disables pre-warm
+    briefing_max_age: float = 86400.0  # seconds a briefing is replayed; 0 = forever
+    briefing_batch_concurrency: int = 3  # generations per batch request
+    briefing_batch_max_contacts: int = 20
+    sse_coalesce_ms: float = 40.0  # batch token deltas per event; 0 disables
+    sse_coalesce_bytes: int = 512  # flush early once this many bytes buffer
+    # Estimated-token budgets for each section of the briefing prompt
+    briefing_memories_token_budget: int = 1500
+    briefing_profile_token_budget: int = 300
+    briefing_commitments_token_budget: int = 600
+
+    # Storage
+    storage_backend: str = "memory"  # memory | sqlite
+    storage_path: str = "meetingmind.db"
+
+    # Background jobs
+    job_workers: int = 4  # concurrent meeting-processing jobs
+    job_max_attempts: int = 3
+    job_retry_backoff: float = 2.0  # seconds, doubled per attempt
+    job_max_pending: int = 1000  # submissions beyond this get HTTP 503
+    job_journal_path: str = "meetingmind_jobs.db"  # empty keeps it in memory
+    job_lease_seconds: float = 60.0  # claim on a running job; renewed by heartbeat
 
     # Security
     cors_origins: list[str] = ["http://localhost:3000"]
@@ -4,14 +4,41 @@ from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 
 from backend.config import settings
-from backend.routers import briefings, commitments, meetings, search
+from backend.routers import briefings, commitments, jobs, meetings, search
+from backend.routers.pagination import NEXT_CURSOR_HEADER
+from backend.services import metrics
+from backend.services.briefing_store import get_briefing_store
+from backend.services.everos_client import get_client
+from backend.services.governor import governor_stats
+from backend.services.ingest_batcher import BatchingIngestClient
+from backend.services.job_queue import get_job_queue
+from backend.services.llm_cache import get_llm_cache
+from backend.services.llm_scheduler import get_llm_scheduler
+from backend.services.local_search import get_local_search
+from backend.services.meeting_processor import process_meeting_job
+from backend.services.overdue_tracker import get_overdue_tracker
+from backend.services.search_cache import CachedEverOSClient
 
 
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     print(f"Starting {settings.app_name} (EverOS mode: {settings.everos_mode})")
+    everos = get_client()
+    await everos.open()
+    await get_local_search().load()
+    queue = get_job_queue()
+    queue.register("process_meeting", process_meeting_job)
+    await queue.start()
+    tracker = get_overdue_tracker()
+    await tracker.start()
+    briefing_store = get_briefing_store()
+    await briefing_store.start()
     yield
     print("Shutting down")
+    await briefing_store.stop()
+    await tracker.stop()
+    await queue.stop()
+    await everos.aclose()
 
 
 app = FastAPI(title=settings.app_name, lifespan=lifespan)
@@ -22,17 +49,32 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER],
 )
 
 app.include_router(meetings.router, prefix="/api/meetings", tags=["meetings"])
 app.include_router(briefings.router, prefix="/api/briefings", tags=["briefings"])
 app.include_router(commitments.router, prefix="/api/commitments", tags=["commitments"])
 app.include_router(search.router, prefix="/api/search", tags=["search"])
+app.include_router(jobs.router, prefix="/api/jobs", tags=["jobs"])
 
 
 @app.get("/health")
 async def health():
+    everos = get_client()
+    batcher = getattr(everos, "inner", everos)
     return {
         "status": "ok",
         "everos_mode": settings.everos_mode,
+        "llm_cache": get_llm_cache().stats(),
+        "search_cache": (
+            everos.stats() if isinstance(everos, CachedEverOSClient) else None
+        ),
+        "ingest_batching": (
+            batcher.stats() if isinstance(batcher, BatchingIngestClient) else None
+        ),
+        "briefings": get_briefing_store().stats(),
+        "upstreams": governor_stats(),
+        "llm_scheduler": get_llm_scheduler().stats(),
+        "metrics": metrics.snapshot(),
     }
@@ -20,6 +20,24 @@ class MeetingStatus(str, Enum):
     FAILED = "failed"
 
 
+class StageStatus(str, Enum):
+    PENDING = "pending"
+    RUNNING = "running"
+    COMPLETED = "completed"
+    FAILED = "failed"
+
+
+class StageReport(BaseModel):
+    status: StageStatus = StageStatus.PENDING
+    duration_ms: float | None = None
+    error: str | None = None
+    attempts: int = 0  # runs so far, counting retries
+
+
+# Independent processing stages run concurrently by process_meeting
+MEETING_STAGES = ("storage", "summary", "commitments")
+
+
 class Meeting(BaseModel):
     id: str
     title: str
@@ -28,6 +46,9 @@ class Meeting(BaseModel):
     notes: str
     summary: str | None = None
     status: MeetingStatus = MeetingStatus.PROCESSING
+    storage_errors: list[str] = []  # participants whose EverOS store failed
+    stored_participants: list[str] = []  # already in EverOS; skipped on retry
+    stages: dict[str, StageReport] = {}
     created_at: datetime
 
 
@@ -91,6 +112,7 @@ class SearchResult(BaseModel):
     participants: list[str]
     memory_type: str  # episodic_memory, foresight, event_log, etc.
     relevance_score: float | None = None
+    meeting_id: str | None = None  # EverOS group_id, when known
 
 
 # --- EverOS memory types ---
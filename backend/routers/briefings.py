@@ -1,14 +1,68 @@
-from fastapi import APIRouter
+from fastapi import APIRouter, HTTPException, Query
 from sse_starlette.sse import EventSourceResponse
 
-from backend.services.briefing_generator import stream_briefing
+from backend.config import settings
+from backend.services.briefing_generator import (
+    stream_batch_briefings,
+    stream_briefing,
+    unique_contacts,
+)
+from backend.services.briefing_store import get_briefing_store
+from backend.storage import meetings_store
 
 router = APIRouter()
 
 
+@router.post("/prewarm")
+async def prewarm_briefings():
+    """Queue background briefings for contacts in the next day's meetings."""
+    return {"scheduled": await get_briefing_store().prewarm()}
+
+
+@router.get("/batch")
+async def generate_batch_briefings(
+    contacts: str | None = None,
+    meeting_id: str | None = None,
+    coalesce_ms: float | None = Query(None, ge=0, le=1000),
+    coalesce_bytes: int | None = Query(None, ge=0, le=65536),
+):
+    """Stream briefings for several contacts over one SSE connection.
+
+    Pass ``contacts`` as a comma-separated list, or ``meeting_id`` to brief
+    that meeting's participants. Events are tagged with their ``contact``.
+    """
+    names = (contacts or "").split(",")
+    if meeting_id:
+        meeting = await meetings_store.get(meeting_id)
+        if not meeting:
+            raise HTTPException(status_code=404, detail="Meeting not found")
+        names += meeting.participants
+    names = unique_contacts(names)
+    if not names:
+        raise HTTPException(status_code=400, detail="No contacts given")
+    if len(names) > settings.briefing_batch_max_contacts:
+        raise HTTPException(
+            status_code=400,
+            detail=f"At most {settings.briefing_batch_max_contacts} contacts per batch",
+        )
+    return EventSourceResponse(
+        stream_batch_briefings(names, coalesce_ms, coalesce_bytes),
+        media_type="text/event-stream",
+    )
+
+
 @router.get("/{contact_name}")
-async def generate_briefing(contact_name: str):
+async def generate_briefing(
+    contact_name: str,
+    coalesce_ms: float | None = Query(None, ge=0, le=1000),
+    coalesce_bytes: int | None = Query(None, ge=0, le=65536),
+):
+    """Stream a briefing over SSE.
+
+    ``coalesce_ms``/``coalesce_bytes`` override how token deltas are batched
+    into events for this request; ``coalesce_ms=0`` sends every delta.
+    """
     return EventSourceResponse(
-        stream_briefing(contact_name),
+        stream_briefing(contact_name, coalesce_ms, coalesce_bytes),
         media_type="text/event-stream",
     )
@@ -1,59 +1,59 @@
 from datetime import datetime, timezone
+from typing import Literal
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Query
 
 from backend.models.schemas import Commitment, CommitmentStatus, CommitmentUpdate
+from backend.routers.pagination import page_response, parse_fields
+from backend.services.events import COMMITMENT_UPDATED, publish
+from backend.services.overdue_tracker import get_overdue_tracker
+from backend.storage import commitments_store
 
 router = APIRouter()
 
-# In-memory store (shared with meeting processor)
-commitments_store: dict[str, Commitment] = {}
-
-
-def _apply_overdue(c: Commitment) -> Commitment:
-    """Mark pending commitments past due_date as overdue."""
-    if (
-        c.status == CommitmentStatus.PENDING
-        and c.due_date
-        and c.due_date.replace(tzinfo=timezone.utc) < datetime.now(timezone.utc)
-    ):
-        c.status = CommitmentStatus.OVERDUE
-    return c
-
 
 @router.get("", response_model=list[Commitment])
 async def list_commitments(
     status: CommitmentStatus | None = None,
     contact: str | None = None,
+    limit: int | None = Query(None, ge=1, le=500),
+    cursor: str | None = None,
+    order: Literal["asc", "desc"] = "asc",
+    fields: str | None = None,
 ):
-    results = [_apply_overdue(c) for c in commitments_store.values()]
-    if status:
-        results = [c for c in results if c.status == status]
-    if contact:
-        contact_lower = contact.lower()
-        results = [
-            c
-            for c in results
-            if contact_lower in c.owner.lower()
-            or contact_lower in c.recipient.lower()
-        ]
-    return sorted(results, key=lambda c: (c.due_date or c.created_at).isoformat())
+    """List commitments by due date (creation time when undated).
+
+    Pagination and projection work as for ``GET /api/meetings``. Read-only:
+    overdue status is maintained by the OverdueTracker.
+    """
+    projection = parse_fields(fields, Commitment)
+    try:
+        page = await commitments_store.page(
+            status=status,
+            contact=contact,
+            limit=limit,
+            cursor=cursor,
+            descending=order == "desc",
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return page_response(page, projection)
 
 
 @router.patch("/{commitment_id}", response_model=Commitment)
 async def update_commitment(commitment_id: str, update: CommitmentUpdate):
-    commitment = commitments_store.get(commitment_id)
+    commitment = await commitments_store.get(commitment_id)
     if not commitment:
         raise HTTPException(status_code=404, detail="Commitment not found")
 
     if update.status is not None:
         commitment.status = update.status
         if update.status == CommitmentStatus.COMPLETED:
-            from datetime import datetime, timezone
-
             commitment.completed_at = datetime.now(timezone.utc)
     if update.due_date is not None:
         commitment.due_date = update.due_date
 
-    commitments_store[commitment_id] = commitment
+    await commitments_store.save(commitment)
+    get_overdue_tracker().track(commitment)
+    await publish(COMMITMENT_UPDATED, commitment)
     return commitment
@@ -0,0 +1,11 @@
+from fastapi import APIRouter
+
+from backend.services.job_queue import get_job_queue
+
+router = APIRouter()
+
+
+@router.get("/stats")
+async def job_stats():
+    """Queue depth, worker utilisation and retry/failure counters."""
+    return get_job_queue().stats()
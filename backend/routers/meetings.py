@@ -1,7 +1,9 @@
 import uuid
 from datetime import datetime, timezone
 
-from fastapi import APIRouter, BackgroundTasks
+from typing import Literal
+
+from fastapi import APIRouter, HTTPException, Query
 
 from backend.models.schemas import (
     Meeting,
@@ -9,21 +11,17 @@ from backend.models.schemas import (
     MeetingResponse,
     MeetingStatus,
 )
-from backend.services.meeting_processor import process_meeting
+from backend.routers.pagination import page_response, parse_fields
+from backend.services.job_queue import QueueFull, get_job_queue
+from backend.storage import meetings_store
 
 router = APIRouter()
 
-# In-memory store (sufficient for hackathon demo)
-meetings_store: dict[str, Meeting] = {}
-
 
 @router.post("", response_model=MeetingResponse, status_code=201)
-async def create_meeting(
-    meeting: MeetingInput,
-    background_tasks: BackgroundTasks,
-):
+async def create_meeting(meeting: MeetingInput):
     meeting_id = str(uuid.uuid4())
-    meetings_store[meeting_id] = Meeting(
+    record = Meeting(
         id=meeting_id,
         title=meeting.title,
         participants=meeting.participants,
@@ -32,27 +30,50 @@ async def create_meeting(
         status=MeetingStatus.PROCESSING,
         created_at=datetime.now(timezone.utc),
     )
-    background_tasks.add_task(process_meeting, meeting_id, meetings_store)
+    await meetings_store.save(record)
+    try:
+        await get_job_queue().submit(
+            "process_meeting",
+            {"meeting_id": meeting_id, "meeting": record.model_dump(mode="json")},
+        )
+    except QueueFull:
+        await meetings_store.delete(meeting_id)
+        raise HTTPException(
+            status_code=503, detail="Meeting queue is full, retry later"
+        )
     return MeetingResponse(meeting_id=meeting_id, status=MeetingStatus.PROCESSING)
 
 
 @router.get("", response_model=list[Meeting])
-async def list_meetings(participant: str | None = None):
-    results = list(meetings_store.values())
-    if participant:
-        p_lower = participant.lower()
-        results = [
-            m for m in results
-            if any(p_lower in p.lower() for p in m.participants)
-        ]
-    return sorted(results, key=lambda m: m.meeting_date, reverse=True)
+async def list_meetings(
+    participant: str | None = None,
+    limit: int | None = Query(None, ge=1, le=500),
+    cursor: str | None = None,
+    order: Literal["asc", "desc"] = "desc",
+    fields: str | None = None,
+):
+    """List meetings by meeting date.
+
+    With ``limit`` the response is one page and the ``X-Next-Cursor`` header
+    carries the cursor for the next one. ``fields`` projects each item onto
+    a comma-separated subset, e.g. to leave ``notes`` out of list views.
+    """
+    projection = parse_fields(fields, Meeting)
+    try:
+        page = await meetings_store.page(
+            participant=participant,
+            limit=limit,
+            cursor=cursor,
+            descending=order == "desc",
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    return page_response(page, projection)
 
 
 @router.get("/{meeting_id}", response_model=Meeting)
 async def get_meeting(meeting_id: str):
-    from fastapi import HTTPException
-
-    meeting = meetings_store.get(meeting_id)
+    meeting = await meetings_store.get(meeting_id)
     if not meeting:
         raise HTTPException(status_code=404, detail="Meeting not found")
     return meeting
@@ -0,0 +1,34 @@
+"""Shared helpers for cursor-paginated, projectable list endpoints."""
+
+from fastapi import HTTPException
+from fastapi.responses import JSONResponse
+from pydantic import BaseModel
+
+from backend.storage.base import Page
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def parse_fields(fields: str | None, model: type[BaseModel]) -> set[str] | None:
+    """Turn ``?fields=a,b`` into a projection set (``id`` is always kept)."""
+    if not fields:
+        return None
+    requested = {f.strip() for f in fields.split(",") if f.strip()}
+    unknown = requested - set(model.model_fields)
+    if unknown:
+        raise HTTPException(
+            status_code=400, detail=f"Unknown fields: {', '.join(sorted(unknown))}"
+        )
+    return requested | {"id"}
+
+
+def page_response(page: Page, fields: set[str] | None) -> JSONResponse:
+    """Serialize one page, exposing the next cursor in a response header.
+
+    The body stays a plain JSON array so existing clients keep working.
+    """
+    headers = {NEXT_CURSOR_HEADER: page.next_cursor} if page.next_cursor else {}
+    return JSONResponse(
+        [item.model_dump(mode="json", include=fields) for item in page.items],
+        headers=headers,
+    )
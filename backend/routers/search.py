@@ -1,11 +1,20 @@
+import asyncio
+import json
+import time
+
 from fastapi import APIRouter
+from sse_starlette.sse import EventSourceResponse
 
 from backend.config import settings
 from backend.models.schemas import SearchRequest, SearchResult
 from backend.services.everos_client import get_client
+from backend.services.local_search import get_local_search
 
 router = APIRouter()
 
+FUSION_METHODS = ("keyword", "vector", "hybrid")
+RRF_K = 60  # standard reciprocal rank fusion damping constant
+
 
 def _normalize_user_id(name: str) -> str:
     return name.lower().replace(" ", "_")
@@ -18,20 +27,189 @@ async def search_memories(
     retrieve_method: str = "hybrid",
     memory_types: str | None = None,
 ):
+    """Search EverOS, merged with hits from the local meetings index.
+
+    Unscoped queries in cloud mode (which EverOS rejects) and EverOS
+    failures or timeouts past ``search_everos_deadline`` are answered from
+    the local index alone.
+    """
     client = get_client()
     user_id = _normalize_user_id(contact) if contact else None
+    types_list = memory_types.split(",") if memory_types else None
+    local = get_local_search().search(query, contact, types_list, top_k=15)
     # Cloud API requires user_id or group_ids
     if settings.everos_mode == "cloud" and not user_id:
-        return []
-    types_list = memory_types.split(",") if memory_types else None
-    results = await client.search(
-        query=query,
-        user_id=user_id,
-        retrieve_method=retrieve_method,
-        memory_types=types_list,
-        top_k=15,
+        return local
+    if retrieve_method == "fusion":
+        search = _fusion_search(
+            client,
+            query=query,
+            user_id=user_id,
+            memory_types=types_list,
+            top_k=15,
+            local=local,
+        )
+    else:
+        search = _search_and_format(
+            client,
+            local,
+            query=query,
+            user_id=user_id,
+            retrieve_method=retrieve_method,
+            memory_types=types_list,
+            top_k=15,
+        )
+    try:
+        return await asyncio.wait_for(search, settings.search_everos_deadline)
+    except Exception as e:
+        print(f"EverOS search unavailable ({e!r}); serving local results")
+        return local
+
+
+async def _search_and_format(
+    client, local: list[SearchResult], **kwargs
+) -> list[SearchResult]:
+    return await _format_results(await client.search(**kwargs), local=local)
+
+
+async def _fusion_search(
+    client, top_k: int, local: list[SearchResult] | None = None, **kwargs
+) -> list[SearchResult]:
+    """Run FUSION_METHODS concurrently and merge them with reciprocal rank fusion.
+
+    Methods still running at ``search_fusion_deadline`` are dropped and the
+    results of the finished ones are returned (waiting past the deadline
+    only if none has succeeded yet). ``relevance_score`` is the RRF score
+    relative to the best fused result, like every other search score.
+    """
+    tasks = {
+        asyncio.ensure_future(
+            client.search(retrieve_method=method, top_k=top_k, **kwargs)
+        ): method
+        for method in FUSION_METHODS
+    }
+    pending = set(tasks)
+    succeeded: list[dict] = []
+    deadline = settings.search_fusion_deadline
+    return_when = asyncio.ALL_COMPLETED
+    try:
+        while pending and not succeeded:
+            done, pending = await asyncio.wait(
+                pending, timeout=deadline, return_when=return_when
+            )
+            # Past the deadline: take the first method to finish.
+            deadline, return_when = None, asyncio.FIRST_COMPLETED
+            for task in done:
+                if task.exception() is not None:
+                    print(f"Fusion search: {tasks[task]} failed: {task.exception()}")
+                else:
+                    succeeded.append(task.result())
+    finally:
+        # Also reached when the caller's deadline cancels us mid-wait.
+        for task in tasks:
+            if not task.done():
+                task.cancel()
+    if pending:
+        print(f"Fusion search: dropped {', '.join(tasks[t] for t in pending)}")
+
+    fused: dict[str, list] = {}  # dedup key -> [score, mem_type, item]
+    for raw in succeeded:
+        ranked_keys: list[str] = []
+        for mem_type, item in _flatten_memories(raw):
+            key = _content(item)[:200]
+            if key not in fused:
+                fused[key] = [0.0, mem_type, item]
+            if key not in ranked_keys:  # best rank only, per method
+                ranked_keys.append(key)
+        for rank, key in enumerate(ranked_keys):
+            fused[key][0] += 1 / (RRF_K + rank + 1)
+    ranked = sorted(fused.values(), key=lambda e: e[0], reverse=True)[:top_k]
+    return await _format_pairs(
+        [(mem_type, item, score) for score, mem_type, item in ranked], local=local
     )
-    return _format_results(results)
+
+
+@router.get("/stream")
+async def stream_search(
+    query: str,
+    contact: str | None = None,
+    retrieve_method: str = "hybrid",
+    memory_types: str | None = None,
+):
+    """Progressive variant of ``GET /api/search`` over SSE.
+
+    Local index hits are sent first. A quick keyword search runs alongside
+    the requested method (all three fused methods for ``fusion``). Each
+    method's results are sent as a ``results`` event as soon as it returns,
+    minus anything already sent, followed by a final ``done`` event.
+    """
+    client = get_client()
+    user_id = _normalize_user_id(contact) if contact else None
+    types_list = memory_types.split(",") if memory_types else None
+    methods = ["keyword"]
+    for method in FUSION_METHODS if retrieve_method == "fusion" else [retrieve_method]:
+        if method not in methods:
+            methods.append(method)
+    if settings.everos_mode == "cloud" and not user_id:
+        methods = []
+
+    async def events():
+        start = time.perf_counter()
+        seen: set[str] = set()
+        local = await _format_results(
+            {}, seen, get_local_search().search(query, contact, types_list, top_k=15)
+        )
+        yield json.dumps(
+            {
+                "type": "results",
+                "method": "local",
+                "elapsed_ms": round((time.perf_counter() - start) * 1000, 1),
+                "results": [r.model_dump(mode="json") for r in local],
+            }
+        )
+        tasks = {
+            asyncio.ensure_future(
+                client.search(
+                    query=query,
+                    user_id=user_id,
+                    retrieve_method=method,
+                    memory_types=types_list,
+                    top_k=15,
+                )
+            ): method
+            for method in methods
+        }
+        sent = 0
+        try:
+            pending = set(tasks)
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    method = tasks[task]
+                    if task.exception() is not None:
+                        print(f"Streaming search: {method} failed: {task.exception()}")
+                        yield json.dumps({"type": "error", "method": method})
+                        continue
+                    results = await _format_results(task.result(), seen)
+                    sent += len(results)
+                    elapsed_ms = (time.perf_counter() - start) * 1000
+                    yield json.dumps(
+                        {
+                            "type": "results",
+                            "method": method,
+                            "elapsed_ms": round(elapsed_ms, 1),
+                            "results": [r.model_dump(mode="json") for r in results],
+                        }
+                    )
+        finally:
+            for task in tasks:
+                task.cancel()
+        total = sent + len(local)
+        yield json.dumps({"type": "done", "methods": methods, "total": total})
+
+    return EventSourceResponse(events(), media_type="text/event-stream")
 
 
 @router.get("/profiles/{contact_name}", response_model=list[SearchResult])
@@ -46,7 +224,7 @@ async def get_contact_profiles(contact_name: str):
         memory_types=["profile"],
         top_k=10,
     )
-    return _format_results(results)
+    return await _format_results(results)
 
 
 def _flatten_memories(raw_results: dict) -> list[tuple[str, dict]]:
@@ -69,11 +247,13 @@ def _flatten_memories(raw_results: dict) -> list[tuple[str, dict]]:
     return pairs
 
 
-def _enrich_from_local(group_id: str, participants: list[str]) -> tuple[str, list[str]]:
+async def _enrich_from_local(
+    group_id: str, participants: list[str]
+) -> tuple[str, list[str]]:
     """Look up meeting title and map user_ids to display names from local store."""
     from backend.routers.meetings import meetings_store
 
-    meeting = meetings_store.get(group_id)
+    meeting = await meetings_store.get(group_id)
     title = meeting.title if meeting else group_id
     if meeting:
         participants = list(meeting.participants)
@@ -82,11 +262,45 @@ def _enrich_from_local(group_id: str, participants: list[str]) -> tuple[str, lis
     return title, participants
 
 
-def _format_results(raw_results: dict) -> list[SearchResult]:
-    formatted = []
-    seen = set()
-    for mem_type, item in _flatten_memories(raw_results):
-        content = item.get("summary", item.get("episode", ""))
+def _content(item: dict) -> str:
+    return item.get("summary", item.get("episode", ""))
+
+
+async def _format_results(
+    raw_results: dict,
+    seen: set[str] | None = None,
+    local: list[SearchResult] | None = None,
+) -> list[SearchResult]:
+    return await _format_pairs(
+        [
+            (mem_type, item, item.get("score"))
+            for mem_type, item in _flatten_memories(raw_results)
+        ],
+        seen,
+        local,
+    )
+
+
+async def _format_pairs(
+    pairs: list[tuple[str, dict, float | None]],
+    seen: set[str] | None = None,
+    local: list[SearchResult] | None = None,
+) -> list[SearchResult]:
+    """Build SearchResults, skipping content already in ``seen`` (updated).
+
+    EverOS scores are rescaled relative to the top EverOS hit (1.0), the
+    scale ``local`` index hits use, and when every hit is scored the two
+    lists are merged by score. Otherwise local hits follow the EverOS hits.
+    Duplicates keep their first (best-ranked) occurrence; a local meeting
+    hit (its summary) and an EverOS hit of the same meeting (its notes)
+    count as duplicates too.
+    """
+    if seen is None:
+        seen = set()
+    scores = [s for _, _, s in pairs if isinstance(s, (int, float))]
+    best = max(scores, default=0.0)
+    remote = []
+    for mem_type, item, score in pairs:
         group_id = item.get("group_id") or ""
         meeting_title = item.get("group_name") or group_id or "Unknown meeting"
         participants = item.get("participants", [])
@@ -95,21 +309,41 @@ def _format_results(raw_results: dict) -> list[SearchResult]:
             participants = [sender] if sender else []
         # Enrich with local meeting data or cloud subject field
         if not item.get("group_name") and group_id:
-            meeting_title, participants = _enrich_from_local(group_id, participants)
+            meeting_title, participants = await _enrich_from_local(
+                group_id, participants
+            )
         if meeting_title == group_id and item.get("subject"):
             meeting_title = item["subject"]
-        dedup_key = content[:200]
-        if dedup_key in seen:
-            continue
-        seen.add(dedup_key)
-        formatted.append(
+        remote.append(
             SearchResult(
-                content=content,
+                content=_content(item),
                 meeting_title=meeting_title,
                 meeting_date=item.get("timestamp", "2026-01-01T00:00:00"),
                 participants=participants,
                 memory_type=mem_type,
-                relevance_score=None,
+                relevance_score=round(score / best, 4)
+                if isinstance(score, (int, float)) and best > 0
+                else None,
+                meeting_id=group_id or None,
             )
         )
+    results = remote + list(local or ())
+    if all(r.relevance_score is not None for r in results):
+        # Stable: on equal scores EverOS hits stay ahead of local ones.
+        results.sort(key=lambda r: r.relevance_score, reverse=True)
+    local_ids = {id(r) for r in local or ()}
+    formatted = []
+    for result in results:
+        dedup_key = result.content[:200]
+        if dedup_key in seen:
+            continue
+        # A meeting found both locally and in EverOS: whichever side ranked
+        # first hides the other side's hits (EverOS may hold several).
+        if result.meeting_id and result.memory_type == "episodic_memory":
+            is_local = id(result) in local_ids
+            if f"{'everos' if is_local else 'local'}:{result.meeting_id}" in seen:
+                continue
+            seen.add(f"{'local' if is_local else 'everos'}:{result.meeting_id}")
+        seen.add(dedup_key)
+        formatted.append(result)
     return formatted
@@ -1,81 +1,343 @@
+import asyncio
 import json
+import time
+from datetime import datetime, timezone
 from typing import AsyncGenerator
 
+from backend.config import settings
+from backend.models.schemas import Commitment, CommitmentStatus
+from backend.services import metrics
+from backend.services.briefing_store import get_briefing_store
+from backend.services.context_builder import ContextItem, memory_score, pack
 from backend.services.everos_client import get_client
 from backend.services.llm_client import stream_briefing_text
+from backend.services.llm_scheduler import BATCH
+from backend.services.stream_coalescer import coalesce, replay_chunks
 
 
-async def stream_briefing(contact_name: str) -> AsyncGenerator[str, None]:
-    """Orchestrate briefing generation: retrieve memories, then stream LLM output."""
-    # 1. Retrieve episodic memories via agentic retrieval (deeper context)
-    client = get_client()
-    user_id = contact_name.lower().replace(" ", "_")
-    memories_raw = await client.search(
-        query=f"{contact_name} discussions commitments decisions",
-        user_id=user_id,
-        retrieve_method="agentic",
-        top_k=15,
-    )
+async def stream_briefing(
+    contact_name: str,
+    coalesce_ms: float | None = None,
+    coalesce_bytes: int | None = None,
+) -> AsyncGenerator[str, None]:
+    """SSE payloads for one contact's briefing (see ``briefing_events``)."""
+    async for event in briefing_events(contact_name, coalesce_ms, coalesce_bytes):
+        yield json.dumps(event)
 
-    # 1b. Retrieve profile memories (communication style, preferences)
-    profile_raw = await client.search(
-        query=f"{contact_name} preferences habits communication style",
-        user_id=user_id,
-        retrieve_method="hybrid",
-        memory_types=["profile"],
-        top_k=5,
-    )
 
-    # 2. Get local commitments (pending + overdue)
-    from backend.routers.commitments import commitments_store, _apply_overdue
+def unique_contacts(contact_names: list[str]) -> list[str]:
+    """Contact names de-duplicated case-insensitively, first spelling kept."""
+    unique: dict[str, str] = {}
+    for name in contact_names:
+        if name.strip():
+            unique.setdefault(name.strip().lower(), name.strip())
+    return list(unique.values())
+
+
+async def stream_batch_briefings(
+    contact_names: list[str],
+    coalesce_ms: float | None = None,
+    coalesce_bytes: int | None = None,
+) -> AsyncGenerator[str, None]:
+    """Multiplex briefings for several contacts over one SSE stream.
+
+    Contacts are de-duplicated case-insensitively. Open commitments are
+    fetched once for the whole batch and split per contact. At most
+    ``briefing_batch_concurrency`` briefings generate at once. Every event
+    carries a ``contact`` field; a failed contact gets an ``error`` event
+    without affecting the others.
+    """
+    from backend.storage import commitments_store
+
+    contacts = unique_contacts(contact_names)
+    yield json.dumps({"type": "batch", "contacts": contacts})
 
-    contact_lower = contact_name.lower()
-    contact_commitments = [
-        _apply_overdue(c)
-        for c in commitments_store.values()
-        if contact_lower in c.owner.lower() or contact_lower in c.recipient.lower()
-    ]
     open_commitments = [
-        c for c in contact_commitments if c.status.value in ("pending", "overdue")
+        c
+        for status in (CommitmentStatus.PENDING, CommitmentStatus.OVERDUE)
+        for c in await commitments_store.list(status=status)
     ]
+    limit = asyncio.Semaphore(max(1, settings.briefing_batch_concurrency))
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def run(contact: str) -> None:
+        key = contact.lower()
+        commitments = [
+            c
+            for c in open_commitments
+            if key in c.owner.lower() or key in c.recipient.lower()
+        ]
+        try:
+            async with limit:
+                async for event in briefing_events(
+                    contact, coalesce_ms, coalesce_bytes, commitments
+                ):
+                    await queue.put({**event, "contact": contact})
+        except Exception as e:
+            print(f"Batch briefing for '{contact}' failed: {e}")
+            await queue.put({"type": "error", "contact": contact, "message": str(e)})
+        finally:
+            await queue.put(None)
+
+    tasks = [asyncio.create_task(run(c)) for c in contacts]
+    try:
+        remaining = len(tasks)
+        while remaining:
+            event = await queue.get()
+            if event is None:
+                remaining -= 1
+                continue
+            yield json.dumps(event)
+    finally:
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+    yield json.dumps({"type": "batch_done"})
+
+
+async def briefing_events(
+    contact_name: str,
+    coalesce_ms: float | None = None,
+    coalesce_bytes: int | None = None,
+    commitments: list[Commitment] | None = None,
+) -> AsyncGenerator[dict, None]:
+    """Orchestrate briefing generation: retrieve memories, then stream LLM output.
+
+    A precomputed briefing is replayed immediately when one is current.
+    Otherwise a status event goes out before any I/O so the client sees
+    bytes at once, the independent retrievals run concurrently, and the
+    finished briefing is stored for the next request. Time to first token
+    and total latency are recorded and echoed in the final ``done`` event.
+
+    Token deltas are coalesced into one event per ``coalesce_ms`` window or
+    ``coalesce_bytes`` (settings defaults; ``coalesce_ms=0`` disables).
+    ``commitments`` skips the commitments lookup when the caller already
+    has the contact's open commitments.
+    """
+    if coalesce_ms is None:
+        coalesce_ms = settings.sse_coalesce_ms
+    if coalesce_bytes is None:
+        coalesce_bytes = settings.sse_coalesce_bytes
+    start = time.perf_counter()
+    store = get_briefing_store() if settings.briefing_cache_enabled else None
+    cached = store.get(contact_name) if store is not None else None
+    if cached is not None:
+        yield {"type": "status", "stage": "cached"}
+        chunks = replay_chunks(cached.text)
+        if coalesce_ms > 0 and coalesce_bytes > 0:
+            chunks = _join_chunks(chunks, coalesce_bytes)
+        for chunk in chunks:
+            yield {"type": "token", "content": chunk}
+        total_ms = (time.perf_counter() - start) * 1000
+        metrics.latency("briefing_ttft").record(total_ms)
+        metrics.latency("briefing_total").record(total_ms)
+        yield {
+            "type": "done",
+            "cached": True,
+            "generated_at": cached.generated_at,
+            "events": len(chunks),
+            "total_ms": round(total_ms, 1),
+        }
+        return
+
+    version = store.version(contact_name) if store is not None else 0
+    yield {"type": "status", "stage": "retrieving"}
+    memories_text, commitments_text = await build_briefing_context(
+        contact_name, commitments
+    )
+    retrieval_ms = (time.perf_counter() - start) * 1000
+    yield {"type": "status", "stage": "generating"}
+
+    ttft_ms = None
+    parts = []
+    async for chunk in coalesce(
+        stream_briefing_text(contact_name, memories_text, commitments_text),
+        window_ms=coalesce_ms,
+        max_bytes=coalesce_bytes,
+    ):
+        if ttft_ms is None:
+            ttft_ms = (time.perf_counter() - start) * 1000
+            metrics.latency("briefing_ttft").record(ttft_ms)
+        parts.append(chunk)
+        yield {"type": "token", "content": chunk}
+
+    if store is not None:
+        store.put(contact_name, "".join(parts), version)
+    total_ms = (time.perf_counter() - start) * 1000
+    metrics.latency("briefing_total").record(total_ms)
+    yield {
+        "type": "done",
+        "cached": False,
+        "events": len(parts),
+        "retrieval_ms": round(retrieval_ms, 1),
+        "ttft_ms": round(ttft_ms, 1) if ttft_ms is not None else None,
+        "total_ms": round(total_ms, 1),
+    }
+
+
+def _join_chunks(chunks: list[str], max_bytes: int) -> list[str]:
+    joined, buffer, size = [], [], 0
+    for chunk in chunks:
+        buffer.append(chunk)
+        size += len(chunk.encode("utf-8"))
+        if size >= max_bytes:
+            joined.append("".join(buffer))
+            buffer, size = [], 0
+    if buffer:
+        joined.append("".join(buffer))
+    return joined
+
+
+async def generate_briefing_text(contact_name: str) -> str:
+    """Generate a complete briefing without streaming (background use).
 
-    # 3. Format context for LLM
-    episodic_text = _format_memories(memories_raw)
-    profile_text = _format_memories(profile_raw)
+    Runs in the LLM scheduler's batch lane, behind live briefings.
+    """
+    memories_text, commitments_text = await build_briefing_context(contact_name)
+    parts = [
+        chunk
+        async for chunk in stream_briefing_text(
+            contact_name, memories_text, commitments_text, priority=BATCH
+        )
+    ]
+    return "".join(parts)
+
+
+async def build_briefing_context(
+    contact_name: str, commitments: list[Commitment] | None = None
+) -> tuple[str, str]:
+    """Retrieve and format (memories, commitments) prompt context.
+
+    Episodic memories (agentic, deeper context), profile memories
+    (communication style, preferences) and local commitments are
+    independent, so they are fetched concurrently. Pass ``commitments``
+    to reuse already-fetched open commitments.
+    """
+    start = time.perf_counter()
+    client = get_client()
+    user_id = contact_name.lower().replace(" ", "_")
+    memories_raw, profile_raw, open_commitments = await asyncio.gather(
+        _search_or_empty(
+            client,
+            query=f"{contact_name} discussions commitments decisions",
+            user_id=user_id,
+            retrieve_method="agentic",
+            top_k=15,
+        ),
+        _search_or_empty(
+            client,
+            query=f"{contact_name} preferences habits communication style",
+            user_id=user_id,
+            retrieve_method="hybrid",
+            memory_types=["profile"],
+            top_k=5,
+        ),
+        _open_commitments(contact_name, commitments),
+    )
+    metrics.latency("briefing_retrieval").record(
+        (time.perf_counter() - start) * 1000
+    )
+
+    episodic_text = _format_memories(
+        memories_raw, settings.briefing_memories_token_budget
+    )
+    profile_text = _format_memories(
+        profile_raw, settings.briefing_profile_token_budget
+    )
     memories_text = episodic_text
     if profile_text and profile_text != "No previous memories found.":
         memories_text += f"\n\n--- Profile Insights ---\n{profile_text}"
-    commitments_text = _format_commitments(open_commitments)
+    commitments_text = _format_commitments(
+        open_commitments, settings.briefing_commitments_token_budget
+    )
+    return memories_text, commitments_text
 
-    # 4. Stream LLM briefing
-    async for chunk in stream_briefing_text(
-        contact_name, memories_text, commitments_text
-    ):
-        yield json.dumps({"type": "token", "content": chunk})
 
-    yield json.dumps({"type": "done"})
+async def _search_or_empty(client, **kwargs) -> dict:
+    """Search EverOS; when it is down or past its deadline the briefing is
+    built without those memories instead of failing."""
+    try:
+        return await client.search(**kwargs)
+    except Exception as e:
+        print(f"Briefing retrieval failed: {e!r}")
+        return {}
+
+
+async def _open_commitments(
+    contact_name: str, prefetched: list[Commitment] | None
+) -> list[Commitment]:
+    if prefetched is not None:
+        return prefetched
+    from backend.storage import commitments_store
+
+    contact_commitments = await commitments_store.list(contact=contact_name)
+    return [
+        c for c in contact_commitments if c.status.value in ("pending", "overdue")
+    ]
+
 
+def _format_memories(raw: dict, budget: int) -> str:
+    """Pack retrieved memories into ``budget`` tokens, best first.
 
-def _format_memories(raw: dict) -> str:
+    Items are ranked by retrieval relevance (the search score normalized to
+    the best hit, or the result rank when there is no score) blended with
+    recency; near-duplicates, common across agentic sub-queries, are dropped.
+    """
     from backend.routers.search import _flatten_memories
 
-    lines = []
-    for mem_type, item in _flatten_memories(raw):
+    pairs = _flatten_memories(raw)
+    scores = [item.get("score") for _, item in pairs]
+    best = max((s for s in scores if isinstance(s, (int, float))), default=0)
+    now = datetime.now(timezone.utc)
+    items = []
+    for rank, (mem_type, item) in enumerate(pairs):
         summary = item.get("summary", item.get("episode", ""))
         timestamp = item.get("timestamp", "")
-        lines.append(f"[{mem_type}] ({timestamp}) {summary}")
+        score = item.get("score")
+        if isinstance(score, (int, float)) and best > 0:
+            relevance = score / best
+        else:
+            relevance = 1 / (1 + rank)
+        items.append(
+            ContextItem(
+                f"[{mem_type}] ({timestamp}) {summary}",
+                memory_score(relevance, _parse_timestamp(timestamp), now),
+                summary,
+            )
+        )
+    lines = pack(items, budget)
     return "\n".join(lines) if lines else "No previous memories found."
 
 
-def _format_commitments(commitments: list) -> str:
+def _format_commitments(commitments: list, budget: int) -> str:
+    """Pack open commitments into ``budget`` tokens: overdue first, then by
+    nearest due date, undated last."""
     if not commitments:
         return "No pending commitments."
-    lines = []
-    for c in commitments:
+    ordered = sorted(
+        commitments,
+        key=lambda c: (
+            c.status.value != "overdue",
+            c.due_date is None,
+            c.due_date.replace(tzinfo=None) if c.due_date else datetime.min,
+        ),
+    )
+    items = []
+    for rank, c in enumerate(ordered):
         due = f" (due: {c.due_date.strftime('%Y-%m-%d')})" if c.due_date else ""
         status_tag = f" [OVERDUE]" if c.status.value == "overdue" else ""
         direction = "You owe" if c.direction.value == "i_owe" else "They owe you"
-        lines.append(
-            f"- [{direction}] {c.description} (owner: {c.owner} -> {c.recipient}){due}{status_tag}"
+        items.append(
+            ContextItem(
+                f"- [{direction}] {c.description} (owner: {c.owner} -> {c.recipient}){due}{status_tag}",
+                -rank,
+            )
         )
-    return "\n".join(lines)
+    return "\n".join(pack(items, budget))
+
+
+def _parse_timestamp(value: str) -> datetime | None:
+    try:
+        return datetime.fromisoformat(value.replace("Z", "+00:00"))
+    except (ValueError, AttributeError):
+        return None
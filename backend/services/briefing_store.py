@@ -0,0 +1,261 @@
+"""Precomputed contact briefings.
+
+The last generated briefing for each contact is kept and replayed over SSE
+instead of re-running retrieval and generation. A briefing is marked stale
+when something it was built from changes: a meeting involving the contact
+finishes processing, or one of their commitments is patched or goes
+overdue. The generator matches meetings and commitments by substring
+(briefing key "alice" covers "Alice Smith"), so a change to a name
+invalidates every stored key contained in it. Stale briefings are
+regenerated in the background after a short debounce, so a burst of
+changes from one meeting costs one regeneration. Briefings older than
+``max_age`` are treated as missing, which bounds drift from changes no
+event reports.
+
+A periodic pre-warm pass generates briefings for participants of meetings
+scheduled within the next day.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+from datetime import datetime, timedelta, timezone
+from typing import NamedTuple
+
+from backend.config import settings
+from backend.models.schemas import Commitment, Meeting
+from backend.services import events
+
+PREWARM_HORIZON = timedelta(days=1)
+CHANGE_LOG_SIZE = 1024  # recent invalidated names kept to check late puts
+
+
+class Briefing(NamedTuple):
+    contact_name: str
+    text: str
+    generated_at: float
+
+
+def contact_key(name: str) -> str:
+    return name.strip().lower()
+
+
+class BriefingStore:
+    def __init__(
+        self,
+        max_entries: int = 256,
+        regen_delay: float = 2.0,
+        regen_concurrency: int = 2,
+        prewarm_interval: float = 3600.0,
+        max_age: float = 86400.0,
+    ):
+        self.max_entries = max_entries
+        self.max_age = max_age
+        self.regen_delay = regen_delay
+        self.prewarm_interval = prewarm_interval
+        self._entries: OrderedDict[str, Briefing] = OrderedDict()
+        self._stale: set[str] = set()
+        # Invalidated names stamped with a clock bumped on every change. A
+        # generation that started before a change to a name containing its
+        # key is not stored.
+        self._clock = 0
+        self._changes: OrderedDict[str, int] = OrderedDict()
+        self._trimmed = 0  # newest stamp dropped from ``_changes``
+        self._regen_tasks: dict[str, asyncio.Task] = {}
+        self._regen_limit = asyncio.Semaphore(max(1, regen_concurrency))
+        self._prewarm_task: asyncio.Task | None = None
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self.expirations = 0
+        self.regenerations = 0
+
+    async def start(self) -> None:
+        events.subscribe(events.MEETING_PROCESSED, self._on_meeting)
+        events.subscribe(events.COMMITMENT_UPDATED, self._on_commitment)
+        events.subscribe(events.COMMITMENT_OVERDUE, self._on_commitment)
+        if self.prewarm_interval > 0:
+            self._prewarm_task = asyncio.create_task(self._prewarm_loop())
+
+    async def stop(self) -> None:
+        events.unsubscribe(events.MEETING_PROCESSED, self._on_meeting)
+        events.unsubscribe(events.COMMITMENT_UPDATED, self._on_commitment)
+        events.unsubscribe(events.COMMITMENT_OVERDUE, self._on_commitment)
+        tasks = list(self._regen_tasks.values())
+        if self._prewarm_task is not None:
+            tasks.append(self._prewarm_task)
+            self._prewarm_task = None
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._regen_tasks.clear()
+
+    def get(self, contact_name: str) -> Briefing | None:
+        """The stored briefing for a contact, or None if missing, stale or
+        older than ``max_age``."""
+        key = contact_key(contact_name)
+        briefing = self._entries.get(key)
+        if briefing is not None and self._expired(briefing):
+            self.expirations += 1
+            briefing = None
+        if briefing is None or key in self._stale:
+            self.misses += 1
+            return None
+        self._entries.move_to_end(key)
+        self.hits += 1
+        return briefing
+
+    def version(self, contact_name: str) -> int:
+        """Snapshot to pass to ``put`` once generation finishes."""
+        return self._clock
+
+    def put(self, contact_name: str, text: str, version: int) -> bool:
+        """Store a briefing generated from data as of ``version``."""
+        key = contact_key(contact_name)
+        if not text or self._changed_since(key, version):
+            return False
+        self._entries[key] = Briefing(contact_name, text, time.time())
+        self._entries.move_to_end(key)
+        self._stale.discard(key)
+        while len(self._entries) > self.max_entries:
+            old, _ = self._entries.popitem(last=False)
+            self._stale.discard(old)
+        return True
+
+    def invalidate(self, contact_names) -> None:
+        """Mark briefings whose key is contained in any of ``contact_names``
+        stale and schedule their regeneration."""
+        names = {contact_key(n) for n in contact_names if n}
+        if not names:
+            return
+        self._clock += 1
+        for name in names:
+            self._changes[name] = self._clock
+            self._changes.move_to_end(name)
+        while len(self._changes) > CHANGE_LOG_SIZE:
+            _, self._trimmed = self._changes.popitem(last=False)
+        for key, briefing in list(self._entries.items()):
+            if any(key in name for name in names):
+                self._stale.add(key)
+                self.invalidations += 1
+                self.schedule(briefing.contact_name)
+
+    def schedule(self, contact_name: str) -> None:
+        """Regenerate in the background; repeated calls are debounced."""
+        key = contact_key(contact_name)
+        task = self._regen_tasks.get(key)
+        if task is not None:
+            task.cancel()
+        self._regen_tasks[key] = asyncio.create_task(
+            self._regenerate(key, contact_name)
+        )
+
+    async def prewarm(self) -> int:
+        """Schedule briefings for participants of meetings in the next day."""
+        from backend.storage import meetings_store
+
+        now = datetime.now(timezone.utc)
+        horizon = now + PREWARM_HORIZON
+        contacts: dict[str, str] = {}
+        cursor = None
+        while True:
+            page = await meetings_store.page(limit=100, cursor=cursor)
+            for meeting in page.items:
+                when = meeting.meeting_date
+                if when.tzinfo is None:
+                    when = when.replace(tzinfo=timezone.utc)
+                if now <= when <= horizon:
+                    for name in meeting.participants:
+                        contacts.setdefault(contact_key(name), name)
+            oldest = page.items[-1].meeting_date if page.items else None
+            if oldest is not None and oldest.tzinfo is None:
+                oldest = oldest.replace(tzinfo=timezone.utc)
+            # Newest first: stop once the page reaches the past.
+            if not page.next_cursor or oldest is None or oldest < now:
+                break
+            cursor = page.next_cursor
+
+        scheduled = 0
+        for key, name in contacts.items():
+            briefing = self._entries.get(key)
+            if briefing is None or key in self._stale or self._expired(briefing):
+                self.schedule(name)
+                scheduled += 1
+        return scheduled
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "stale": len(self._stale),
+            "hits": self.hits,
+            "misses": self.misses,
+            "invalidations": self.invalidations,
+            "expirations": self.expirations,
+            "regenerations": self.regenerations,
+            "regenerating": len(self._regen_tasks),
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+        }
+
+    async def _regenerate(self, key: str, contact_name: str) -> None:
+        from backend.services.briefing_generator import generate_briefing_text
+
+        try:
+            await asyncio.sleep(self.regen_delay)
+            async with self._regen_limit:
+                version = self.version(contact_name)
+                text = await generate_briefing_text(contact_name)
+                if self.put(contact_name, text, version):
+                    self.regenerations += 1
+        except asyncio.CancelledError:
+            raise
+        except Exception as e:
+            print(f"Briefing regeneration for '{contact_name}' failed: {e}")
+        finally:
+            if self._regen_tasks.get(key) is asyncio.current_task():
+                del self._regen_tasks[key]
+
+    def _expired(self, briefing: Briefing) -> bool:
+        return bool(self.max_age) and time.time() - briefing.generated_at > self.max_age
+
+    def _changed_since(self, key: str, version: int) -> bool:
+        if self._trimmed > version:
+            return True  # the log no longer reaches back to ``version``
+        for name, stamp in reversed(self._changes.items()):
+            if stamp <= version:
+                return False
+            if key in name:
+                return True
+        return False
+
+    async def _prewarm_loop(self) -> None:
+        while True:
+            try:
+                scheduled = await self.prewarm()
+                if scheduled:
+                    print(f"Briefing pre-warm: {scheduled} contact(s) scheduled")
+            except Exception as e:
+                print(f"Briefing pre-warm failed: {e}")
+            await asyncio.sleep(self.prewarm_interval)
+
+    async def _on_meeting(self, meeting: Meeting) -> None:
+        self.invalidate(meeting.participants)
+
+    async def _on_commitment(self, commitment: Commitment) -> None:
+        self.invalidate([commitment.owner, commitment.recipient])
+
+
+_store: BriefingStore | None = None
+
+
+def get_briefing_store() -> BriefingStore:
+    global _store
+    if _store is None:
+        _store = BriefingStore(
+            max_entries=settings.briefing_cache_max_entries,
+            regen_delay=settings.briefing_regen_delay,
+            regen_concurrency=settings.briefing_regen_concurrency,
+            prewarm_interval=settings.briefing_prewarm_interval,
+            max_age=settings.briefing_max_age,
+        )
+    return _store
@@ -0,0 +1,97 @@
+"""Token-budgeted assembly of LLM prompt context.
+
+Each prompt section is a list of candidate lines with an importance score.
+``pack`` drops near-duplicates, then takes the highest-scoring lines that
+fit the section's token budget. Token counts are estimated locally (no
+tokenizer download, no network), erring slightly high so that packed
+prompts stay under the budget for BPE tokenizers.
+"""
+
+import math
+import re
+from datetime import datetime, timezone
+from typing import NamedTuple
+
+from backend.services.search_index import tokenize
+
+PIECE_RE = re.compile(r"\w+|[^\w\s]", re.UNICODE)
+CHARS_PER_TOKEN = 4  # BPE averages ~4 characters per token for English
+RECENCY_HALF_LIFE_DAYS = 30.0
+RELEVANCE_WEIGHT = 0.6  # the remainder weights recency
+
+
+class ContextItem(NamedTuple):
+    text: str
+    score: float
+    dedup_text: str = ""  # compared for near-duplicates instead of ``text``
+
+
+def estimate_tokens(text: str) -> int:
+    """Approximate BPE token count: one per punctuation mark, one per
+    ``CHARS_PER_TOKEN`` characters of each word."""
+    return sum(math.ceil(len(p) / CHARS_PER_TOKEN) for p in PIECE_RE.findall(text))
+
+
+def memory_score(
+    relevance: float, timestamp: datetime | None, now: datetime
+) -> float:
+    """Blend retrieval relevance (0..1) with exponential recency decay."""
+    recency = 0.0
+    if timestamp is not None:
+        if timestamp.tzinfo is None:
+            timestamp = timestamp.replace(tzinfo=timezone.utc)
+        age_days = max((now - timestamp).total_seconds() / 86400, 0.0)
+        recency = 0.5 ** (age_days / RECENCY_HALF_LIFE_DAYS)
+    return RELEVANCE_WEIGHT * relevance + (1 - RELEVANCE_WEIGHT) * recency
+
+
+def is_near_duplicate(a: set[str], b: set[str], threshold: float) -> bool:
+    """Jaccard similarity of two token sets is at least ``threshold``."""
+    if not a or not b:
+        return a == b
+    return len(a & b) / len(a | b) >= threshold
+
+
+def truncate_to_tokens(text: str, budget: int) -> str:
+    if estimate_tokens(text) <= budget:
+        return text
+    words, used = [], 1  # reserve one token for the ellipsis
+    for word in text.split():
+        cost = estimate_tokens(word)
+        if used + cost > budget:
+            break
+        words.append(word)
+        used += cost
+    return " ".join(words) + "…" if words else ""
+
+
+def pack(
+    items: list[ContextItem], budget: int, dedup_threshold: float = 0.85
+) -> list[str]:
+    """Highest-scoring, non-duplicate lines that fit in ``budget`` tokens.
+
+    Lines that do not fit are skipped so that shorter, lower-ranked lines
+    can still use the remaining budget. If even the best line is too long
+    on its own, it is truncated rather than leaving the section empty.
+    """
+    kept: list[str] = []
+    kept_tokens: list[set[str]] = []
+    used = 0
+    for item in sorted(items, key=lambda i: i.score, reverse=True):
+        tokens = set(tokenize(item.dedup_text or item.text))
+        if any(is_near_duplicate(tokens, k, dedup_threshold) for k in kept_tokens):
+            continue
+        cost = estimate_tokens(item.text) + 1  # newline separator
+        if used + cost <= budget:
+            kept.append(item.text)
+        elif not kept:
+            text = truncate_to_tokens(item.text, budget - 1)
+            if not text:
+                continue
+            kept.append(text)
+            cost = estimate_tokens(text) + 1
+        else:
+            continue
+        kept_tokens.append(tokens)
+        used += cost
+    return kept
@@ -0,0 +1,33 @@
+"""Minimal in-process publish/subscribe bus for internal domain events."""
+
+from collections import defaultdict
+from typing import Any, Awaitable, Callable
+
+EventHandler = Callable[[Any], Awaitable[None]]
+
+# Event names
+COMMITMENT_OVERDUE = "commitment.overdue"  # payload: Commitment
+COMMITMENT_UPDATED = "commitment.updated"  # payload: Commitment
+MEETING_PROCESSED = "meeting.processed"  # payload: Meeting
+
+_subscribers: dict[str, list[EventHandler]] = defaultdict(list)
+
+
+def subscribe(event: str, handler: EventHandler) -> None:
+    if handler not in _subscribers[event]:
+        _subscribers[event].append(handler)
+
+
+def unsubscribe(event: str, handler: EventHandler) -> None:
+    if handler in _subscribers[event]:
+        _subscribers[event].remove(handler)
+
+
+async def publish(event: str, payload: Any) -> None:
+    """Deliver ``payload`` to every subscriber; one failing handler never
+    blocks the others or the publisher."""
+    for handler in list(_subscribers[event]):
+        try:
+            await handler(payload)
+        except Exception as e:
+            print(f"Event handler for '{event}' failed: {e}")
@@ -1,12 +1,23 @@
 """EverOS client with Cloud API and Mock mode support."""
 
+import importlib.util
 import json
+import re
 from datetime import datetime, timezone
 from typing import Protocol
 
 import httpx
+import numpy as np
 
 from backend.config import settings
+from backend.services.governor import get_governor
+from backend.services.ingest_batcher import BatchingIngestClient
+from backend.services.search_cache import CachedEverOSClient
+from backend.services.search_index import BM25Index
+from backend.services.vector_index import VectorIndex, top_k_from
+
+HYBRID_CANDIDATES = 2000  # mock hybrid: best-by-cosine docs scored with BM25
+RARE_TERM_DOCS = 2000  # plus docs of the rarest query terms, up to this many
 
 
 class EverOSClient(Protocol):
@@ -38,9 +49,19 @@ class EverOSClient(Protocol):
         limit: int = 40,
     ) -> dict: ...
 
+    async def open(self) -> None: ...
+
+    async def aclose(self) -> None: ...
+
 
 class CloudClient:
-    """EverOS Cloud API client (api.evermind.ai/api/v0)."""
+    """EverOS Cloud API client (api.evermind.ai/api/v0).
+
+    All requests share one pooled, keep-alive ``httpx.AsyncClient`` so that
+    repeated calls reuse TCP/TLS connections instead of handshaking each time,
+    and go through the ``everos`` governor (rate limit, retries, circuit
+    breaker, deadline).
+    """
 
     def __init__(self):
         self.base_url = f"{settings.everos_base_url}/api/v0"
@@ -48,9 +69,39 @@ class CloudClient:
             "Content-Type": "application/json",
             "Authorization": f"Bearer {settings.everos_api_key}",
         }
+        self._http: httpx.AsyncClient | None = None
+        self.governor = get_governor("everos")
 
-    async def store_message(self, **kwargs) -> dict:
-        payload = {
+    async def open(self) -> None:
+        """Create the shared connection pool (called from the app lifespan)."""
+        if self._http is None:
+            self._http = _build_http_client()
+
+    async def aclose(self) -> None:
+        """Close the shared connection pool and drop idle connections."""
+        if self._http is not None:
+            await self._http.aclose()
+            self._http = None
+
+    def _client(self) -> httpx.AsyncClient:
+        # Lazily open for callers outside the lifespan (scripts, shells).
+        if self._http is None:
+            self._http = _build_http_client()
+        return self._http
+
+    async def _request(self, method: str, path: str, **kwargs) -> dict:
+        async def attempt() -> dict:
+            resp = await self._client().request(
+                method, f"{self.base_url}{path}", headers=self.headers, **kwargs
+            )
+            resp.raise_for_status()
+            return resp.json()
+
+        return await self.governor.call(attempt)
+
+    @staticmethod
+    def message_payload(**kwargs) -> dict:
+        return {
             "message_id": kwargs["message_id"],
             "create_time": kwargs["timestamp"],
             "sender": kwargs["sender_id"],
@@ -61,15 +112,15 @@ class CloudClient:
             "role": "user",
             "flush": True,
         }
-        async with httpx.AsyncClient() as client:
-            resp = await client.post(
-                f"{self.base_url}/memories",
-                headers=self.headers,
-                json=payload,
-                timeout=30.0,
-            )
-            resp.raise_for_status()
-            return resp.json()
+
+    async def store_message(self, **kwargs) -> dict:
+        return await self._request(
+            "POST", "/memories", json=self.message_payload(**kwargs)
+        )
+
+    async def store_messages(self, messages: list[dict]) -> dict:
+        """Store several ``message_payload`` dicts in one request."""
+        return await self._request("POST", "/memories", json={"messages": messages})
 
     async def search(self, **kwargs) -> dict:
         payload = {"query": kwargs["query"], "top_k": kwargs.get("top_k", 10)}
@@ -82,16 +133,7 @@ class CloudClient:
         if kwargs.get("memory_types"):
             payload["memory_types"] = kwargs["memory_types"]
 
-        async with httpx.AsyncClient() as client:
-            resp = await client.request(
-                "GET",
-                f"{self.base_url}/memories/search",
-                headers=self.headers,
-                json=payload,
-                timeout=30.0,
-            )
-            resp.raise_for_status()
-            return resp.json()
+        return await self._request("GET", "/memories/search", json=payload)
 
     async def get_memories(self, **kwargs) -> dict:
         params = {
@@ -101,22 +143,53 @@ class CloudClient:
         if kwargs.get("user_id"):
             params["user_id"] = kwargs["user_id"]
 
-        async with httpx.AsyncClient() as client:
-            resp = await client.get(
-                f"{self.base_url}/memories",
-                headers=self.headers,
-                params=params,
-                timeout=30.0,
-            )
-            resp.raise_for_status()
-            return resp.json()
+        return await self._request("GET", "/memories", params=params)
+
+
+def _http2_available() -> bool:
+    return settings.everos_http2 and importlib.util.find_spec("h2") is not None
+
+
+def _build_http_client() -> httpx.AsyncClient:
+    """Build the pooled EverOS transport from Settings."""
+    return httpx.AsyncClient(
+        http2=_http2_available(),
+        limits=httpx.Limits(
+            max_connections=settings.everos_max_connections,
+            max_keepalive_connections=settings.everos_max_keepalive_connections,
+            keepalive_expiry=settings.everos_keepalive_expiry,
+        ),
+        timeout=httpx.Timeout(
+            settings.everos_timeout,
+            connect=settings.everos_connect_timeout,
+        ),
+    )
 
 
 class MockClient:
-    """In-memory mock for development without EverOS."""
+    """In-memory mock for development without EverOS.
+
+    Every ``store_message`` incrementally updates a BM25 keyword index and a
+    local hashed-n-gram vector index, so each ``retrieve_method`` has a real,
+    network-free engine behind it:
+
+    - keyword: BM25
+    - vector: cosine similarity over local embeddings
+    - hybrid: weighted fusion of normalized BM25 and cosine scores
+    - agentic: hybrid over a batch of sub-queries split from the question
+    """
 
     def __init__(self):
         self._memories: list[dict] = []
+        self._keyword_index = BM25Index()
+        self._vector_index = VectorIndex(dim=settings.mock_vector_dim)
+        self._by_sender: dict[str, list[int]] = {}
+
+    async def open(self) -> None:
+        pass
+
+    async def aclose(self) -> None:
+        pass
 
     async def store_message(self, **kwargs) -> dict:
         memory = {
@@ -129,46 +202,87 @@ class MockClient:
             "group_name": kwargs.get("meeting_name", ""),
             "memory_type": "episodic_memory",
         }
+        doc_id = len(self._memories)
         self._memories.append(memory)
+        self._keyword_index.add(
+            doc_id,
+            [
+                (memory["content"], 2.0),
+                (memory["group_name"], 1.0),
+                (memory["sender_name"], 1.0),
+            ],
+        )
+        self._by_sender.setdefault(memory["sender"].lower(), []).append(doc_id)
+        self._vector_index.add(doc_id, f"{memory['group_name']} {memory['content']}")
         return {"status": "ok", "result": {"count": 1, "status_info": "mock"}}
 
     async def search(self, **kwargs) -> dict:
-        query_lower = kwargs["query"].lower()
-        query_words = query_lower.split()
-        user_id = kwargs.get("user_id")
-
-        matches = []
-        for mem in self._memories:
-            score = 0
-            content_lower = mem["content"].lower()
-            group_lower = mem.get("group_name", "").lower()
-            sender_lower = mem.get("sender_name", "").lower()
-            # Match any query word against content, title, or sender
-            for word in query_words:
-                if word in content_lower:
-                    score += 2
-                if word in group_lower:
-                    score += 1
-                if word in sender_lower:
-                    score += 1
-            if user_id and user_id.lower() in sender_lower:
-                score += 1
-            if score > 0:
-                matches.append((score, mem))
-
-        matches.sort(key=lambda x: x[0], reverse=True)
+        query = kwargs["query"]
         top_k = kwargs.get("top_k", 10)
+        method = kwargs.get("retrieve_method") or "hybrid"
+        sender_docs = self._by_sender.get((kwargs.get("user_id") or "").lower(), ())
+
+        if method == "keyword":
+            boosts = {i: 1.0 for i in sender_docs}
+            hits = self._keyword_index.search(query, top_k=top_k, boosts=boosts)
+        elif method == "vector":
+            boosts = {i: 0.05 for i in sender_docs}
+            hits = self._vector_index.search([query], top_k=top_k, boosts=boosts)
+        elif method == "agentic":
+            hits = self._hybrid_search(_expand_query(query), top_k, sender_docs)
+        else:
+            hits = self._hybrid_search([query], top_k, sender_docs)
+        return self._format([(score, self._memories[i]) for i, score in hits])
 
+    def _hybrid_search(
+        self, queries: list[str], top_k: int, sender_docs
+    ) -> list[tuple[int, float]]:
+        """Fuse cosine similarity with max-normalized BM25.
+
+        BM25 is scored only for candidates: the best ``HYBRID_CANDIDATES``
+        documents by cosine plus the documents of the rarest query terms
+        (which carry most of the BM25 weight), up to ``RARE_TERM_DOCS``.
+        That costs a few dict lookups per candidate instead of a keyword
+        search over every posting of the query terms.
+        """
+        if not self._memories:
+            return []
+        alpha = settings.mock_hybrid_alpha
+        sims = self._vector_index.scores(queries)
+        scores = sims[0] if len(queries) == 1 else sims.max(axis=0)
+        scores *= alpha
+        if sender_docs:
+            scores[np.asarray(sender_docs, dtype=np.int64)] += 0.05
+        n = scores.shape[0]
+        pool = min(max(top_k * 10, HYBRID_CANDIDATES), n)
+        candidates = set(np.argpartition(scores, n - pool)[n - pool :].tolist())
+        for q in queries:
+            candidates |= self._keyword_index.rare_term_docs(q, RARE_TERM_DOCS)
+        keyword_hits: dict[int, float] = {}
+        for q in queries:
+            for i, score in self._keyword_index.score_docs(q, candidates).items():
+                keyword_hits[i] = max(keyword_hits.get(i, 0.0), score)
+        if keyword_hits:
+            best = max(keyword_hits.values())
+            ids = np.fromiter(keyword_hits, dtype=np.int64, count=len(keyword_hits))
+            kw = np.fromiter(keyword_hits.values(), dtype=np.float32, count=len(ids))
+            scores[ids] += (1 - alpha) * kw / best
+        ids = np.fromiter(candidates, dtype=np.int64, count=len(candidates))
+        return [(int(ids[j]), score) for j, score in top_k_from(scores[ids], top_k)]
+
+    def _format(self, matches: list[tuple[float, dict]]) -> dict:
         items = [
             {
                 "summary": m["content"][:200],
                 "episode": m["content"],
                 "timestamp": m["timestamp"],
+                "group_id": m["group_id"],
                 "group_name": m["group_name"],
                 "participants": [m["sender_name"]],
                 "memory_type": "episodic_memory",
+                "score": round(score, 4),
             }
-            for _, m in matches[:top_k]
+            for score, m in matches
         ]
 
         return {
@@ -187,6 +301,13 @@ class MockClient:
         }
 
 
+def _expand_query(query: str) -> list[str]:
+    """Split a question into sub-queries, standing in for agentic expansion."""
+    parts = re.split(r"[,;?]|\band\b|\bor\b|\bthen\b", query)
+    subs = [p.strip() for p in parts if len(p.strip()) > 2]
+    return [query] + [p for p in subs if p != query]
+
+
 _instance: EverOSClient | None = None
 
 
@@ -195,6 +316,18 @@ def get_client() -> EverOSClient:
     if _instance is None:
         if settings.everos_mode == "cloud":
             _instance = CloudClient()
+            if settings.everos_batch_ingest:
+                _instance = BatchingIngestClient(
+                    _instance,
+                    max_batch=settings.everos_batch_max_size,
+                    max_delay=settings.everos_batch_max_delay,
+                )
         else:
             _instance = MockClient()
+        if settings.everos_search_cache_enabled:
+            _instance = CachedEverOSClient(
+                _instance,
+                max_entries=settings.everos_search_cache_max_entries,
+                ttl=settings.everos_search_cache_ttl,
+            )
     return _instance
@@ -0,0 +1,311 @@
+"""Outbound call governor for upstream APIs (EverOS, OpenAI).
+
+Every call to an upstream goes through that upstream's ``Governor``:
+
+- a token bucket spaces requests to ``rate`` per second (bursts up to
+  ``burst``), so we slow down before the upstream starts answering 429;
+- 429, 5xx, timeouts and connection errors are retried with full-jitter
+  exponential backoff, honouring ``Retry-After``;
+- a circuit breaker opens after ``failure_threshold`` consecutive failed
+  attempts and rejects calls at once; after ``reset_timeout`` a single
+  probe is let through (half-open) and its outcome closes or re-opens it;
+- each call has a deadline covering throttling, attempts and backoff, and
+  a wait that would end past the deadline fails immediately.
+
+``stats()`` weighs what the governor costs (time spent throttled and
+backing off) against what it saves (calls recovered by a retry, and the
+time rejected calls would have spent failing against a broken upstream).
+"""
+
+import asyncio
+import random
+import time
+from typing import Awaitable, Callable, TypeVar
+
+import httpx
+import openai
+
+from backend.config import settings
+from backend.services import metrics
+
+T = TypeVar("T")
+
+RETRYABLE_STATUS = {408, 429, 500, 502, 503, 504}
+
+
+class UpstreamUnavailable(Exception):
+    """The governor gave up on a call before the upstream could answer it."""
+
+
+class CircuitOpenError(UpstreamUnavailable):
+    pass
+
+
+class DeadlineExceeded(UpstreamUnavailable):
+    pass
+
+
+def status_code(exc: BaseException) -> int | None:
+    if isinstance(exc, httpx.HTTPStatusError):
+        return exc.response.status_code
+    if isinstance(exc, openai.APIStatusError):
+        return exc.status_code
+    return None
+
+
+def is_retryable(exc: BaseException) -> bool:
+    if isinstance(
+        exc, (httpx.TransportError, openai.APIConnectionError, asyncio.TimeoutError)
+    ):
+        return True
+    return status_code(exc) in RETRYABLE_STATUS
+
+
+def retry_after(exc: BaseException) -> float | None:
+    """Seconds from a ``Retry-After`` header, when the error carries one."""
+    response = getattr(exc, "response", None)
+    value = response.headers.get("retry-after") if response is not None else None
+    try:
+        return float(value) if value else None
+    except ValueError:  # HTTP-date form; fall back to our own backoff
+        return None
+
+
+class TokenBucket:
+    def __init__(self, rate: float, burst: float):
+        self.rate = rate
+        self.capacity = max(1.0, burst)
+        self._tokens = self.capacity
+        self._updated = time.monotonic()
+
+    def reserve(self) -> float:
+        """Take a token; return how long to wait before it may be used.
+
+        Tokens may go negative, so concurrent callers queue up behind each
+        other at ``rate`` without a lock.
+        """
+        now = time.monotonic()
+        self._tokens = min(
+            self.capacity, self._tokens + (now - self._updated) * self.rate
+        )
+        self._updated = now
+        self._tokens -= 1
+        return max(0.0, -self._tokens / self.rate)
+
+    def refund(self) -> None:
+        self._tokens = min(self.capacity, self._tokens + 1)
+
+
+class CircuitBreaker:
+    def __init__(self, name: str, failure_threshold: int, reset_timeout: float):
+        self.name = name
+        self.failure_threshold = max(1, failure_threshold)
+        self.reset_timeout = reset_timeout
+        self.failures = 0  # consecutive
+        self._opened_at = 0.0
+        self._probing = False
+
+    @property
+    def state(self) -> str:
+        if self.failures < self.failure_threshold:
+            return "closed"
+        if time.monotonic() - self._opened_at < self.reset_timeout:
+            return "open"
+        return "half_open"
+
+    def allow(self) -> bool:
+        state = self.state
+        if state == "closed":
+            return True
+        if state == "open" or self._probing:
+            return False
+        self._probing = True
+        return True
+
+    def success(self) -> None:
+        if self.failures >= self.failure_threshold:
+            print(f"Upstream {self.name}: circuit closed")
+        self.failures = 0
+        self._probing = False
+
+    def failure(self) -> None:
+        self.failures += 1
+        self._probing = False
+        if self.failures >= self.failure_threshold:
+            if self.failures == self.failure_threshold:
+                print(f"Upstream {self.name}: circuit open ({self.failures} failures)")
+            self._opened_at = time.monotonic()
+
+    def release(self) -> None:
+        """Give up a probe slot without an outcome (e.g. on cancellation)."""
+        self._probing = False
+
+
+class Governor:
+    def __init__(
+        self,
+        name: str,
+        rate: float = 0.0,
+        burst: float = 1.0,
+        deadline: float = 30.0,
+        max_retries: int = 3,
+        retry_base: float = 0.25,
+        retry_max: float = 8.0,
+        failure_threshold: int = 5,
+        reset_timeout: float = 15.0,
+    ):
+        self.name = name
+        self.bucket = TokenBucket(rate, burst) if rate > 0 else None
+        self.breaker = CircuitBreaker(name, failure_threshold, reset_timeout)
+        self.deadline = deadline
+        self.max_retries = max(0, max_retries)
+        self.retry_base = retry_base
+        self.retry_max = retry_max
+        self._wait_ms = metrics.latency(f"{name}_governor_wait")
+        self._failure_s = 0.0  # moving average duration of a failed attempt
+        self.calls = 0
+        self.failures = 0
+        self.retries = 0
+        self.recovered = 0
+        self.throttled = 0
+        self.short_circuited = 0
+        self.deadline_exceeded = 0
+        self.throttled_ms = 0.0
+        self.backoff_ms = 0.0
+        self.saved_ms = 0.0
+
+    async def call(
+        self, fn: Callable[[], Awaitable[T]], deadline: float | None = None
+    ) -> T:
+        """Run ``fn()`` under rate limit, retry, circuit breaker and deadline.
+
+        ``fn`` must start a fresh request each time it is called. Errors
+        that are not worth retrying (4xx other than 408/429) are raised
+        as-is; retryable errors are raised once retries run out.
+        """
+        self.calls += 1
+        expires = time.monotonic() + (deadline or self.deadline)
+        waited = 0.0
+        attempt = 0
+        try:
+            while True:
+                if not self.breaker.allow():
+                    self.short_circuited += 1
+                    self.saved_ms += self._failure_s * 1000
+                    raise CircuitOpenError(f"{self.name} circuit is open")
+                try:
+                    waited += await self._throttle(expires)
+                    started = time.monotonic()
+                    result = await asyncio.wait_for(fn(), expires - started)
+                except UpstreamUnavailable:
+                    self.breaker.release()
+                    raise
+                except Exception as e:
+                    if not is_retryable(e):
+                        self.breaker.success()  # it answered; the caller erred
+                        raise
+                    self._record_failure(time.monotonic() - started)
+                    delay = self._backoff(attempt, e)
+                    out_of_time = time.monotonic() + delay >= expires
+                    if isinstance(e, asyncio.TimeoutError) or (
+                        out_of_time and attempt < self.max_retries
+                    ):
+                        self.deadline_exceeded += 1
+                        raise DeadlineExceeded(
+                            f"{self.name} call missed its deadline"
+                        ) from e
+                    if attempt >= self.max_retries:
+                        raise
+                    self.retries += 1
+                    attempt += 1
+                    waited += delay
+                    self.backoff_ms += delay * 1000
+                    await asyncio.sleep(delay)
+                    continue
+                except BaseException:
+                    self.breaker.release()
+                    raise
+                self.breaker.success()
+                if attempt:
+                    self.recovered += 1
+                return result
+        finally:
+            self._wait_ms.record(waited * 1000)
+
+    async def _throttle(self, expires: float) -> float:
+        if self.bucket is None:
+            return 0.0
+        delay = self.bucket.reserve()
+        if not delay:
+            return 0.0
+        if time.monotonic() + delay >= expires:
+            self.bucket.refund()
+            self.deadline_exceeded += 1
+            raise DeadlineExceeded(f"{self.name} rate limit wait exceeds deadline")
+        self.throttled += 1
+        self.throttled_ms += delay * 1000
+        await asyncio.sleep(delay)
+        return delay
+
+    def _backoff(self, attempt: int, exc: BaseException) -> float:
+        delay = random.uniform(0, min(self.retry_max, self.retry_base * 2**attempt))
+        hint = retry_after(exc)
+        return max(delay, hint) if hint is not None else delay
+
+    def _record_failure(self, duration: float) -> None:
+        self.failures += 1
+        self.breaker.failure()
+        self._failure_s = (
+            duration if not self._failure_s else 0.8 * self._failure_s + 0.2 * duration
+        )
+
+    def stats(self) -> dict:
+        return {
+            "circuit": self.breaker.state,
+            "calls": self.calls,
+            "failures": self.failures,
+            "retries": self.retries,
+            "recovered": self.recovered,
+            "throttled": self.throttled,
+            "short_circuited": self.short_circuited,
+            "deadline_exceeded": self.deadline_exceeded,
+            "throttled_ms": round(self.throttled_ms, 1),
+            "backoff_ms": round(self.backoff_ms, 1),
+            "saved_ms": round(self.saved_ms, 1),
+        }
+
+
+_governors: dict[str, Governor] = {}
+
+
+def get_governor(name: str) -> Governor:
+    """The shared governor for ``"everos"`` or ``"openai"``."""
+    if name not in _governors:
+        rate, burst, deadline = {
+            "everos": (
+                settings.everos_rate_limit,
+                settings.everos_rate_burst,
+                settings.everos_call_deadline,
+            ),
+            "openai": (
+                settings.openai_rate_limit,
+                settings.openai_rate_burst,
+                settings.openai_call_deadline,
+            ),
+        }[name]
+        _governors[name] = Governor(
+            name,
+            rate=rate,
+            burst=burst,
+            deadline=deadline,
+            max_retries=settings.upstream_max_retries,
+            retry_base=settings.upstream_retry_base,
+            retry_max=settings.upstream_retry_max,
+            failure_threshold=settings.upstream_breaker_threshold,
+            reset_timeout=settings.upstream_breaker_reset,
+        )
+    return _governors[name]
+
+
+def governor_stats() -> dict:
+    return {name: g.stats() for name, g in sorted(_governors.items())}
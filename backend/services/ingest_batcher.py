@@ -0,0 +1,104 @@
+"""Batched EverOS message ingestion.
+
+``BatchingIngestClient`` wraps ``CloudClient`` and turns individual
+``store_message`` calls, from any number of meetings, into batched
+``POST /memories`` requests carrying a ``messages`` list. A batch is sent
+once it holds ``max_batch`` messages or ``max_delay`` seconds after its
+first message, whichever comes first. Only the last message of each
+group in a batch keeps ``flush: true``, so EverOS extracts memories once
+per group per batch instead of once per message.
+
+Every caller still awaits its own future: it resolves to a per-message
+result when its batch is accepted, or raises the batch's error once the
+EverOS governor has given up retrying it.
+"""
+
+import asyncio
+
+
+class BatchingIngestClient:
+    def __init__(self, inner, max_batch: int = 50, max_delay: float = 0.05):
+        self.inner = inner
+        self.max_batch = max(1, max_batch)
+        self.max_delay = max_delay
+        self._pending: list[tuple[dict, asyncio.Future]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._sending: set[asyncio.Task] = set()
+        self.batches = 0
+        self.messages = 0
+
+    async def open(self) -> None:
+        await self.inner.open()
+
+    async def aclose(self) -> None:
+        """Send whatever is still queued, then close the inner client."""
+        self._flush()
+        await asyncio.gather(*self._sending, return_exceptions=True)
+        await self.inner.aclose()
+
+    async def search(self, **kwargs) -> dict:
+        return await self.inner.search(**kwargs)
+
+    async def get_memories(self, **kwargs) -> dict:
+        return await self.inner.get_memories(**kwargs)
+
+    async def store_message(self, **kwargs) -> dict:
+        future = asyncio.get_running_loop().create_future()
+        self._pending.append((self.inner.message_payload(**kwargs), future))
+        if len(self._pending) >= self.max_batch:
+            self._flush()
+        elif self._timer is None:
+            self._timer = asyncio.get_running_loop().call_later(
+                self.max_delay, self._flush
+            )
+        return await future
+
+    def stats(self) -> dict:
+        avg = self.messages / self.batches if self.batches else 0.0
+        return {
+            "batches": self.batches,
+            "messages": self.messages,
+            "avg_batch": round(avg, 1),
+        }
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        if not self._pending:
+            return
+        batch, self._pending = self._pending, []
+        task = asyncio.create_task(self._send(batch))
+        self._sending.add(task)
+        task.add_done_callback(self._sending.discard)
+
+    async def _send(self, batch: list[tuple[dict, asyncio.Future]]) -> None:
+        messages = [payload for payload, _ in batch]
+        last_in_group = {m["group_id"]: i for i, m in enumerate(messages)}
+        flush_at = set(last_in_group.values())
+        for i, message in enumerate(messages):
+            message["flush"] = i in flush_at
+
+        try:
+            resp = await self.inner.store_messages(messages)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        self.batches += 1
+        self.messages += len(batch)
+        status_info = resp.get("result", {}).get("status_info")
+        for _, future in batch:
+            if not future.done():
+                future.set_result(
+                    {
+                        "status": resp.get("status", "ok"),
+                        "result": {
+                            "count": 1,
+                            "status_info": status_info,
+                            "batch_size": len(batch),
+                        },
+                    }
+                )
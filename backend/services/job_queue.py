@@ -0,0 +1,367 @@
+"""Durable background job queue with a bounded worker pool.
+
+Jobs are journaled to SQLite before they are queued, so work that was
+queued or in flight when the process stopped is picked up again on the
+next start. A fixed number of workers drain the queue, which caps how many
+LLM and EverOS sessions run at once. Failed jobs are retried with jittered
+exponential backoff up to ``max_attempts``.
+
+Several processes may share one journal. A job is claimed atomically
+(``queued`` -> ``running``) under this process's ``worker_id`` with a
+lease that a heartbeat keeps extending, so only ``running`` jobs whose
+lease expired -- their owner died -- are taken over by another process.
+
+A journal error while running a job (e.g. "database is locked" under
+write contention) never kills a worker: a job that was not claimed yet is
+queued again after ``retry_backoff``, and a claimed one stops being
+heartbeated so its lease expires and it is re-run.
+"""
+
+import asyncio
+import json
+import os
+import random
+import socket
+import sqlite3
+import threading
+import time
+import uuid
+from typing import Awaitable, Callable
+
+from backend.config import settings
+
+JobHandler = Callable[[dict], Awaitable[None]]
+
+BUSY_TIMEOUT = 5.0  # seconds to wait on a journal locked by another process
+
+
+class QueueFull(Exception):
+    """Raised when the number of pending jobs reaches ``max_pending``."""
+
+
+class JobQueue:
+    def __init__(
+        self,
+        path: str = ":memory:",
+        workers: int = 4,
+        max_attempts: int = 3,
+        retry_backoff: float = 2.0,
+        max_pending: int = 1000,
+        lease: float = 60.0,
+    ):
+        self.workers = workers
+        self.max_attempts = max_attempts
+        self.retry_backoff = retry_backoff
+        self.max_pending = max_pending
+        self.lease = lease
+        self.worker_id = f"{socket.gethostname()}:{os.getpid()}:{uuid.uuid4().hex[:8]}"
+        self._handlers: dict[str, JobHandler] = {}
+        self._queue: asyncio.Queue[str] = asyncio.Queue()
+        self._tasks: list[asyncio.Task] = []
+        self._heartbeat: asyncio.Task | None = None
+        self._pending = 0  # queued + retrying + running
+        self._running = 0
+        self._completed = 0
+        self._failed = 0
+        self._retried = 0
+        self._lost = 0  # claims lost to another worker, or expired leases
+        self._errors = 0  # journal errors while running a job
+        self._claims: set[str] = set()  # running here; leases to heartbeat
+        self._wait_ms_total = 0.0
+        self._run_ms_total = 0.0
+
+        self._db = sqlite3.connect(
+            path, timeout=BUSY_TIMEOUT, check_same_thread=False
+        )
+        self._db_lock = threading.Lock()
+        self._db.execute("PRAGMA journal_mode=WAL")
+        self._db.execute(
+            "CREATE TABLE IF NOT EXISTS jobs ("
+            " id TEXT PRIMARY KEY,"
+            " kind TEXT NOT NULL,"
+            " payload TEXT NOT NULL,"
+            " status TEXT NOT NULL,"
+            " attempts INTEGER NOT NULL DEFAULT 0,"
+            " last_error TEXT,"
+            " created_at REAL NOT NULL,"
+            " updated_at REAL NOT NULL,"
+            " worker_id TEXT,"
+            " lease_expires_at REAL)"
+        )
+        columns = {row[1] for row in self._db.execute("PRAGMA table_info(jobs)")}
+        for column, kind in (("worker_id", "TEXT"), ("lease_expires_at", "REAL")):
+            if column not in columns:  # journals from before leases
+                self._db.execute(f"ALTER TABLE jobs ADD COLUMN {column} {kind}")
+        self._db.execute("CREATE INDEX IF NOT EXISTS idx_jobs_status ON jobs (status)")
+        self._db.commit()
+
+    def register(self, kind: str, handler: JobHandler) -> None:
+        self._handlers[kind] = handler
+
+    async def start(self) -> None:
+        """Queue journaled work and start the workers and lease heartbeat.
+
+        Queued jobs are queued here too; if another live process also has
+        them, the atomic claim lets only one of them run each job.
+        """
+        expired = await self._expire_leases()
+        queued = await asyncio.to_thread(
+            self._execute,
+            "SELECT id FROM jobs WHERE status = 'queued' ORDER BY created_at",
+        )
+        for (job_id,) in queued:
+            self._pending += 1
+            self._queue.put_nowait(job_id)
+        if queued:
+            print(
+                f"Job queue: recovered {len(queued)} unfinished job(s), "
+                f"{expired} from expired leases"
+            )
+        self._tasks = [
+            asyncio.create_task(self._worker()) for _ in range(max(1, self.workers))
+        ]
+        self._heartbeat = asyncio.create_task(self._heartbeat_loop())
+
+    async def stop(self) -> None:
+        """Stop the workers; unfinished jobs stay in the journal.
+
+        Leases of interrupted jobs are released so that the next start,
+        of this or another process, can run them at once.
+        """
+        tasks = self._tasks + ([self._heartbeat] if self._heartbeat else [])
+        for task in tasks:
+            task.cancel()
+        await asyncio.gather(*tasks, return_exceptions=True)
+        self._tasks = []
+        self._heartbeat = None
+        await asyncio.to_thread(
+            self._execute,
+            "UPDATE jobs SET status = 'queued', worker_id = NULL,"
+            " lease_expires_at = NULL WHERE status = 'running' AND worker_id = ?",
+            (self.worker_id,),
+        )
+
+    async def submit(self, kind: str, payload: dict) -> str:
+        if kind not in self._handlers:
+            raise ValueError(f"No handler registered for job kind '{kind}'")
+        if self._pending >= self.max_pending:
+            raise QueueFull(f"{self._pending} jobs pending")
+
+        job_id = str(uuid.uuid4())
+        now = time.time()
+        await asyncio.to_thread(
+            self._execute,
+            "INSERT INTO jobs (id, kind, payload, status, created_at, updated_at)"
+            " VALUES (?, ?, ?, 'queued', ?, ?)",
+            (job_id, kind, json.dumps(payload), now, now),
+        )
+        self._pending += 1
+        self._queue.put_nowait(job_id)
+        return job_id
+
+    def stats(self) -> dict:
+        finished = self._completed + self._failed
+        return {
+            "workers": sum(not task.done() for task in self._tasks),
+            "depth": self._queue.qsize(),
+            "pending": self._pending,
+            "running": self._running,
+            "completed": self._completed,
+            "failed": self._failed,
+            "retried": self._retried,
+            "lost": self._lost,
+            "errors": self._errors,
+            "avg_wait_ms": round(self._wait_ms_total / finished, 1) if finished else 0.0,
+            "avg_run_ms": round(self._run_ms_total / finished, 1) if finished else 0.0,
+        }
+
+    async def _worker(self) -> None:
+        while True:
+            job_id = await self._queue.get()
+            try:
+                await self._run(job_id)
+            except Exception as e:
+                self._errors += 1
+                if job_id in self._claims:
+                    # Stop heartbeating it; once the lease expires the job
+                    # is re-queued here or by another process.
+                    print(f"Job {job_id}: journal error ({e}); left to lease expiry")
+                    self._claims.discard(job_id)
+                    self._pending -= 1
+                else:
+                    print(f"Job {job_id}: journal error ({e}); queued again")
+                    asyncio.get_running_loop().call_later(
+                        self.retry_backoff, self._queue.put_nowait, job_id
+                    )
+            finally:
+                self._queue.task_done()
+
+    async def _run(self, job_id: str) -> None:
+        rows = await asyncio.to_thread(
+            self._execute,
+            "SELECT kind, payload, attempts, created_at FROM jobs WHERE id = ?",
+            (job_id,),
+        )
+        if not rows:
+            self._pending -= 1
+            return
+        kind, payload, attempts, created_at = rows[0]
+        now = time.time()
+        claimed = await asyncio.to_thread(
+            self._update,
+            "UPDATE jobs SET status = 'running', worker_id = ?,"
+            " lease_expires_at = ?, updated_at = ? WHERE id = ? AND status = 'queued'",
+            (self.worker_id, now + self.lease, now, job_id),
+        )
+        if not claimed:  # another process runs it, or it already finished
+            self._pending -= 1
+            return
+        self._claims.add(job_id)
+        handler = self._handlers.get(kind)
+        if handler is None:
+            print(f"Job {job_id}: no handler for '{kind}', dropping")
+            await self._finish(job_id, "failed", attempts, "no handler")
+            return
+
+        self._running += 1
+        start = time.time()
+        self._wait_ms_total += (start - created_at) * 1000
+        try:
+            await handler(json.loads(payload))
+        except Exception as e:
+            attempts += 1
+            if attempts < self.max_attempts:
+                delay = self.retry_backoff * 2 ** (attempts - 1)
+                delay *= random.uniform(0.5, 1.5)
+                print(f"Job {job_id} failed ({e}); retry {attempts} in {delay:.1f}s")
+                released = await asyncio.to_thread(
+                    self._update,
+                    "UPDATE jobs SET status = 'queued', attempts = ?, last_error = ?,"
+                    " worker_id = NULL, lease_expires_at = NULL, updated_at = ?"
+                    " WHERE id = ? AND worker_id = ?",
+                    (attempts, str(e), time.time(), job_id, self.worker_id),
+                )
+                if not released:
+                    self._lease_lost(job_id)
+                    return
+                self._claims.discard(job_id)
+                self._retried += 1
+                asyncio.get_running_loop().call_later(
+                    delay, self._queue.put_nowait, job_id
+                )
+            else:
+                print(f"Job {job_id} failed permanently: {e}")
+                await self._finish(job_id, "failed", attempts, str(e))
+        else:
+            await self._finish(job_id, "done", attempts + 1, None)
+        finally:
+            self._running -= 1
+            self._run_ms_total += (time.time() - start) * 1000
+
+    async def _finish(
+        self, job_id: str, status: str, attempts: int, error: str | None
+    ) -> None:
+        if status == "done":
+            # Completed jobs need no recovery; keep the journal small.
+            updated = await asyncio.to_thread(
+                self._update,
+                "DELETE FROM jobs WHERE id = ? AND worker_id = ?",
+                (job_id, self.worker_id),
+            )
+        else:
+            updated = await asyncio.to_thread(
+                self._update,
+                "UPDATE jobs SET status = ?, attempts = ?, last_error = ?,"
+                " updated_at = ? WHERE id = ? AND worker_id = ?",
+                (status, attempts, error, time.time(), job_id, self.worker_id),
+            )
+        if not updated:
+            self._lease_lost(job_id)
+            return
+        self._claims.discard(job_id)
+        self._pending -= 1
+        if status == "done":
+            self._completed += 1
+        else:
+            self._failed += 1
+
+    def _lease_lost(self, job_id: str) -> None:
+        # Our lease expired and another process took the job over; its
+        # outcome is theirs to record.
+        print(f"Job {job_id}: lease lost to another worker")
+        self._claims.discard(job_id)
+        self._pending -= 1
+        self._lost += 1
+
+    async def _heartbeat_loop(self) -> None:
+        """Extend the leases of this process's running jobs, and release
+        jobs whose owner stopped heartbeating."""
+        while True:
+            await asyncio.sleep(self.lease / 3)
+            try:
+                claims = list(self._claims)
+                if claims:
+                    await asyncio.to_thread(
+                        self._execute,
+                        "UPDATE jobs SET lease_expires_at = ?"
+                        " WHERE status = 'running' AND worker_id = ?"
+                        f" AND id IN ({', '.join('?' * len(claims))})",
+                        (time.time() + self.lease, self.worker_id, *claims),
+                    )
+                for job_id in await self._expire_leases(ids=True):
+                    self._pending += 1
+                    self._queue.put_nowait(job_id)
+            except sqlite3.Error as e:
+                print(f"Job queue heartbeat failed: {e}")
+
+    async def _expire_leases(self, ids: bool = False):
+        """Return expired ``running`` jobs to ``queued``; rows without a
+        lease predate leases and count as expired."""
+        expired = await asyncio.to_thread(
+            self._execute,
+            "UPDATE jobs SET status = 'queued', worker_id = NULL,"
+            " lease_expires_at = NULL WHERE status = 'running'"
+            " AND (lease_expires_at IS NULL OR lease_expires_at < ?) RETURNING id",
+            (time.time(),),
+        )
+        if expired:
+            print(f"Job queue: {len(expired)} job(s) with expired leases re-queued")
+        return [job_id for (job_id,) in expired] if ids else len(expired)
+
+    def _execute(self, sql: str, params: tuple = ()) -> list[tuple]:
+        with self._db_lock:
+            try:
+                rows = self._db.execute(sql, params).fetchall()
+                self._db.commit()
+            except sqlite3.Error:
+                self._db.rollback()  # don't leave a half-open write behind
+                raise
+            return rows
+
+    def _update(self, sql: str, params: tuple = ()) -> int:
+        """Run a write and return how many rows it changed."""
+        with self._db_lock:
+            try:
+                count = self._db.execute(sql, params).rowcount
+                self._db.commit()
+            except sqlite3.Error:
+                self._db.rollback()
+                raise
+            return count
+
+
+_queue: JobQueue | None = None
+
+
+def get_job_queue() -> JobQueue:
+    global _queue
+    if _queue is None:
+        _queue = JobQueue(
+            path=settings.job_journal_path or ":memory:",
+            workers=settings.job_workers,
+            max_attempts=settings.job_max_attempts,
+            retry_backoff=settings.job_retry_backoff,
+            max_pending=settings.job_max_pending,
+            lease=settings.job_lease_seconds,
+        )
+    return _queue
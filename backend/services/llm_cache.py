@@ -0,0 +1,167 @@
+"""Content-addressed cache for LLM completions.
+
+Entries are keyed on a hash of model + prompt + temperature. Lookups hit an
+in-memory LRU tier first, then an optional SQLite tier on disk. Both tiers
+expire entries after a TTL; the disk tier also evicts least-recently-used
+rows once its total size exceeds a byte budget.
+"""
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+from backend.config import settings
+
+
+def cache_key(model: str, prompt: str, temperature: float) -> str:
+    raw = json.dumps(
+        {"model": model, "prompt": prompt, "temperature": temperature},
+        sort_keys=True,
+    )
+    return hashlib.sha256(raw.encode("utf-8")).hexdigest()
+
+
+class LLMCache:
+    def __init__(
+        self,
+        max_entries: int = 512,
+        ttl: float = 86400.0,
+        path: str = "",
+        max_disk_bytes: int = 64 * 1024 * 1024,
+    ):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_disk_bytes = max_disk_bytes
+        self._memory: OrderedDict[str, tuple[float, str]] = OrderedDict()
+        self._db: sqlite3.Connection | None = None
+        self._db_lock = threading.Lock()
+        self.hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+        self.evictions = 0
+        if path:
+            self._db = sqlite3.connect(path, check_same_thread=False)
+            self._db.execute(
+                "CREATE TABLE IF NOT EXISTS llm_cache ("
+                " key TEXT PRIMARY KEY,"
+                " value TEXT NOT NULL,"
+                " size INTEGER NOT NULL,"
+                " created_at REAL NOT NULL,"
+                " accessed_at REAL NOT NULL)"
+            )
+            self._db.execute(
+                "CREATE INDEX IF NOT EXISTS idx_llm_cache_accessed"
+                " ON llm_cache (accessed_at)"
+            )
+            self._db.commit()
+
+    async def get(self, key: str) -> str | None:
+        now = time.time()
+        entry = self._memory.get(key)
+        if entry is not None:
+            created_at, value = entry
+            if now - created_at <= self.ttl:
+                self._memory.move_to_end(key)
+                self.hits += 1
+                return value
+            del self._memory[key]
+
+        if self._db is not None:
+            row = await asyncio.to_thread(self._disk_get, key, now)
+            if row is not None:
+                created_at, value = row
+                self._remember(key, value, created_at)
+                self.hits += 1
+                self.disk_hits += 1
+                return value
+
+        self.misses += 1
+        return None
+
+    async def set(self, key: str, value: str) -> None:
+        now = time.time()
+        self._remember(key, value, now)
+        if self._db is not None:
+            await asyncio.to_thread(self._disk_set, key, value, now)
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._memory),
+            "hits": self.hits,
+            "disk_hits": self.disk_hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+        }
+
+    def _remember(self, key: str, value: str, created_at: float) -> None:
+        self._memory[key] = (created_at, value)
+        self._memory.move_to_end(key)
+        while len(self._memory) > self.max_entries:
+            self._memory.popitem(last=False)
+            self.evictions += 1
+
+    def _disk_get(self, key: str, now: float) -> tuple[float, str] | None:
+        with self._db_lock:
+            row = self._db.execute(
+                "SELECT created_at, value FROM llm_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if now - row[0] > self.ttl:
+                self._db.execute("DELETE FROM llm_cache WHERE key = ?", (key,))
+                self._db.commit()
+                return None
+            self._db.execute(
+                "UPDATE llm_cache SET accessed_at = ? WHERE key = ?", (now, key)
+            )
+            self._db.commit()
+            return row[0], row[1]
+
+    def _disk_set(self, key: str, value: str, now: float) -> None:
+        size = len(value.encode("utf-8"))
+        with self._db_lock:
+            self._db.execute(
+                "INSERT OR REPLACE INTO llm_cache"
+                " (key, value, size, created_at, accessed_at)"
+                " VALUES (?, ?, ?, ?, ?)",
+                (key, value, size, now, now),
+            )
+            self._db.execute(
+                "DELETE FROM llm_cache WHERE created_at < ?", (now - self.ttl,)
+            )
+            total = self._db.execute(
+                "SELECT COALESCE(SUM(size), 0) FROM llm_cache"
+            ).fetchone()[0]
+            if total > self.max_disk_bytes:
+                # Drop least recently used rows until back under budget.
+                rows = self._db.execute(
+                    "SELECT key, size FROM llm_cache ORDER BY accessed_at"
+                ).fetchall()
+                for old_key, old_size in rows:
+                    if total <= self.max_disk_bytes:
+                        break
+                    self._db.execute("DELETE FROM llm_cache WHERE key = ?", (old_key,))
+                    total -= old_size
+                    self.evictions += 1
+            self._db.commit()
+
+
+_cache: LLMCache | None = None
+
+
+def get_llm_cache() -> LLMCache:
+    global _cache
+    if _cache is None:
+        _cache = LLMCache(
+            max_entries=settings.llm_cache_max_entries,
+            ttl=settings.llm_cache_ttl,
+            path=settings.llm_cache_path,
+            max_disk_bytes=settings.llm_cache_max_disk_bytes,
+        )
+    return _cache
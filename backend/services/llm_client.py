@@ -1,9 +1,18 @@
+import asyncio
 import json
 from typing import AsyncGenerator
 
+import openai
 from openai import AsyncOpenAI
 
 from backend.config import settings
+from backend.services import metrics
+from backend.services.context_builder import estimate_tokens
+from backend.services.governor import get_governor
+from backend.services.llm_cache import cache_key, get_llm_cache
+from backend.services.llm_scheduler import BATCH, INTERACTIVE, get_llm_scheduler
+from backend.services.note_chunks import merge_commitments, split_notes
+from backend.services.stream_coalescer import replay_chunks
 
 _client: AsyncOpenAI | None = None
 
@@ -11,7 +20,8 @@ _client: AsyncOpenAI | None = None
 def _get_openai() -> AsyncOpenAI:
     global _client
     if _client is None:
-        kwargs: dict = {"api_key": settings.openai_api_key}
+        # Retries are the openai governor's job, not the SDK's.
+        kwargs: dict = {"api_key": settings.openai_api_key, "max_retries": 0}
         if settings.openai_base_url:
             kwargs["base_url"] = settings.openai_base_url
         _client = AsyncOpenAI(**kwargs)
@@ -69,28 +79,140 @@ Participants: {participants}
 Return ONLY the summary text, no formatting."""
 
 
+COMBINE_SUMMARIES_PROMPT = """\
+Below are summaries of consecutive parts of one meeting, in order. Combine them into a single summary of 2-3 sentences. Focus on key decisions, outcomes, and next steps. Be specific with names and numbers.
+
+Participants: {participants}
+
+<summaries>
+{summaries}
+</summaries>
+
+Return ONLY the summary text, no formatting."""
+
+
+ANALYZE_MEETING_PROMPT = """\
+You are a meeting analyst. Summarize the meeting notes below and extract commitments (action items, promises, deadlines).
+
+Today's date: {today}
+Participants: {participants}
+
+Return a JSON object with exactly two keys:
+- "summary": 2-3 sentences focused on key decisions, outcomes, and next steps. Be specific with names and numbers.
+- "commitments": an array where each commitment has:
+  - description: What was promised (concise, one sentence)
+  - owner: Exact participant name who made the promise
+  - recipient: Exact participant name who receives the promise (or "Team" if general)
+  - due_date: ISO 8601 date if mentioned (use year {year}), null otherwise
+  - direction: "i_owe" if {first_participant} is the owner, "owed_to_me" otherwise
+  Use [] if no commitments were made.
+
+<meeting>
+{notes}
+</meeting>
+
+Return ONLY the JSON object, no other text."""
+
+
 def _has_real_api_key() -> bool:
     key = settings.openai_api_key
     return bool(key and key.startswith("sk-") and "your" not in key)
 
 
+async def _complete(
+    model: str,
+    prompt: str,
+    temperature: float,
+    max_tokens: int,
+    priority: int = BATCH,
+    **kwargs,
+) -> str:
+    """Run a single-turn chat completion through the response cache.
+
+    Completions are background analysis, so they default to the batch lane.
+    """
+    key = cache_key(model, prompt, temperature)
+    if settings.llm_cache_enabled:
+        cached = await get_llm_cache().get(key)
+        if cached is not None:
+            return cached
+
+    client = _get_openai()
+    reserve = estimate_tokens(prompt) + max_tokens
+    async with get_llm_scheduler().slot(model, priority, reserve) as lease:
+        response = await get_governor("openai").call(
+            lambda: client.chat.completions.create(
+                model=model,
+                messages=[{"role": "user", "content": prompt}],
+                temperature=temperature,
+                max_tokens=max_tokens,
+                **kwargs,
+            )
+        )
+        if response.usage is not None:
+            lease.record_tokens(response.usage.total_tokens)
+    text = response.choices[0].message.content or ""
+    if settings.llm_cache_enabled and text:
+        await get_llm_cache().set(key, text)
+    return text
+
+
 async def summarize_meeting(notes: str, participants: list[str]) -> str:
-    """Generate a concise meeting summary."""
+    """Generate a concise meeting summary.
+
+    Long notes are summarized per chunk concurrently, then the partial
+    summaries are combined (see ``_combine_summaries``).
+    """
     if not _has_real_api_key():
         return _mock_summarize(participants)
 
-    client = _get_openai()
+    chunks = split_notes(notes, settings.llm_chunk_tokens)
+    partials = await asyncio.gather(
+        *(_summarize_chunk(chunk, participants) for chunk in chunks)
+    )
+    return await _combine_summaries(list(partials), participants)
+
+
+async def _summarize_chunk(notes: str, participants: list[str]) -> str:
     prompt = SUMMARIZE_PROMPT.format(
         participants=", ".join(participants),
         notes=notes,
     )
-    response = await client.chat.completions.create(
-        model=settings.llm_model_stream,
-        messages=[{"role": "user", "content": prompt}],
-        temperature=0.3,
-        max_tokens=200,
+    text = await _complete(
+        settings.llm_model_stream, prompt, temperature=0.3, max_tokens=200
+    )
+    return text.strip()
+
+
+async def _combine_summaries(summaries: list[str], participants: list[str]) -> str:
+    """Reduce chunk summaries to one, a level at a time.
+
+    While the summaries do not fit one chunk, groups that do are combined
+    concurrently; the last level produces the meeting summary.
+    """
+    while len(summaries) > 1:
+        groups = split_notes("\n\n".join(summaries), settings.llm_chunk_tokens)
+        if len(groups) >= len(summaries):  # budget too small to group; finish
+            groups = ["\n\n".join(summaries)]
+        summaries = list(
+            await asyncio.gather(
+                *(_combine_chunk(group, participants) for group in groups)
+            )
+        )
+        if len(groups) == 1:
+            break
+    return summaries[0] if summaries else ""
+
+
+async def _combine_chunk(summaries: str, participants: list[str]) -> str:
+    prompt = COMBINE_SUMMARIES_PROMPT.format(
+        participants=", ".join(participants),
+        summaries=summaries,
     )
-    return (response.choices[0].message.content or "").strip()
+    text = await _complete(
+        settings.llm_model_stream, prompt, temperature=0.3, max_tokens=200
+    )
+    return text.strip()
 
 
 def _mock_summarize(participants: list[str]) -> str:
@@ -99,11 +221,22 @@ def _mock_summarize(participants: list[str]) -> str:
 
 
 async def extract_commitments(notes: str, participants: list[str]) -> list[dict]:
-    """Extract commitments from meeting notes using LLM."""
+    """Extract commitments from meeting notes using LLM.
+
+    Long notes are split into chunks that are extracted concurrently, and
+    commitments found in more than one chunk are merged.
+    """
     if not _has_real_api_key():
         return _mock_extract_commitments(notes, participants)
 
-    client = _get_openai()
+    chunks = split_notes(notes, settings.llm_chunk_tokens)
+    results = await asyncio.gather(
+        *(_extract_chunk(chunk, participants) for chunk in chunks)
+    )
+    return results[0] if len(results) == 1 else merge_commitments(list(results))
+
+
+async def _extract_chunk(notes: str, participants: list[str]) -> list[dict]:
     from datetime import date
 
     today = date.today()
@@ -115,61 +248,174 @@ async def extract_commitments(notes: str, participants: list[str]) -> list[dict]
         year=today.year,
     )
 
-    response = await client.chat.completions.create(
-        model=settings.llm_model_analysis,
-        messages=[{"role": "user", "content": prompt}],
-        temperature=0.3,
-        max_tokens=2000,
+    text = await _complete(
+        settings.llm_model_analysis, prompt, temperature=0.3, max_tokens=2000
     )
+    text = _strip_code_fences(text or "[]")
+
+    try:
+        return json.loads(text)
+    except json.JSONDecodeError:
+        print(f"LLM returned invalid JSON: {text[:200]}")
+        return []
 
-    text = response.choices[0].message.content or "[]"
-    # Strip markdown code fences if present
+
+async def analyze_meeting(notes: str, participants: list[str]) -> tuple[str, list[dict]]:
+    """Summarize and extract commitments in one LLM call per chunk.
+
+    Long notes are analyzed chunk by chunk concurrently; the chunk
+    summaries are then combined and the commitments merged.
+    """
+    if not _has_real_api_key():
+        return _mock_analyze_meeting(notes, participants)
+
+    chunks = split_notes(notes, settings.llm_chunk_tokens)
+    results = await asyncio.gather(
+        *(_analyze_chunk(chunk, participants) for chunk in chunks)
+    )
+    if len(results) == 1:
+        return results[0]
+    summary = await _combine_summaries([s for s, _ in results], participants)
+    return summary, merge_commitments([c for _, c in results])
+
+
+async def _analyze_chunk(
+    notes: str, participants: list[str]
+) -> tuple[str, list[dict]]:
+    """Falls back to separate summarize/extract calls when the combined
+    response cannot be parsed, or the combined request itself is rejected
+    (e.g. ``response_format`` unsupported by the model)."""
+    from datetime import date
+
+    today = date.today()
+    prompt = ANALYZE_MEETING_PROMPT.format(
+        participants=", ".join(participants),
+        first_participant=participants[0] if participants else "User",
+        notes=notes,
+        today=today.isoformat(),
+        year=today.year,
+    )
+
+    try:
+        text = await _complete(
+            settings.llm_model_analysis,
+            prompt,
+            temperature=0.3,
+            max_tokens=2200,
+            response_format={"type": "json_object"},
+        )
+    except (openai.BadRequestError, openai.UnprocessableEntityError) as e:
+        print(f"Combined analysis rejected ({e}), falling back to separate calls")
+    else:
+        parsed = _parse_analysis(text)
+        if parsed is not None:
+            return parsed
+        print("Combined analysis unparseable, falling back to separate calls")
+
+    summary, commitments = await asyncio.gather(
+        _summarize_chunk(notes, participants),
+        _extract_chunk(notes, participants),
+    )
+    return summary, commitments
+
+
+def _strip_code_fences(text: str) -> str:
+    """Strip markdown code fences if present."""
     text = text.strip()
     if text.startswith("```"):
         text = text.split("\n", 1)[1] if "\n" in text else text[3:]
     if text.endswith("```"):
         text = text[:-3]
-    text = text.strip()
+    return text.strip()
 
+
+def _parse_analysis(text: str) -> tuple[str, list[dict]] | None:
+    """Parse a combined analysis response; return None if it is unusable."""
+    text = _strip_code_fences(text)
+    # Tolerate prose around the object by taking the outermost braces.
+    start, end = text.find("{"), text.rfind("}")
+    if start == -1 or end <= start:
+        return None
     try:
-        return json.loads(text)
+        data = json.loads(text[start : end + 1])
     except json.JSONDecodeError:
-        print(f"LLM returned invalid JSON: {text[:200]}")
-        return []
+        return None
+    if not isinstance(data, dict):
+        return None
+
+    summary = data.get("summary")
+    commitments = data.get("commitments", [])
+    if not isinstance(summary, str) or not summary.strip():
+        return None
+    if isinstance(commitments, dict):
+        commitments = [commitments]
+    if not isinstance(commitments, list):
+        return None
+    return summary.strip(), [c for c in commitments if isinstance(c, dict)]
 
 
 async def stream_briefing_text(
     contact_name: str,
     memories_text: str,
     commitments_text: str,
+    priority: int = INTERACTIVE,
 ) -> AsyncGenerator[str, None]:
-    """Stream briefing generation via LLM."""
-    if not _has_real_api_key():
-        async for chunk in _mock_stream_briefing(contact_name):
-            yield chunk
-        return
+    """Stream briefing generation via LLM.
 
-    client = _get_openai()
+    The scheduler slot is held for the whole stream; pass ``BATCH`` for
+    briefings nobody is waiting on.
+    """
     prompt = BRIEFING_PROMPT.format(
         contact_name=contact_name,
         memories=memories_text,
         commitments=commitments_text,
     )
+    prompt_tokens = estimate_tokens(prompt)
+    metrics.sample("briefing_prompt_tokens", "tokens").record(prompt_tokens)
+    if not _has_real_api_key():
+        async for chunk in _mock_stream_briefing(contact_name):
+            yield chunk
+        return
 
-    stream = await client.chat.completions.create(
-        model=settings.llm_model_stream,
-        messages=[{"role": "user", "content": prompt}],
-        temperature=0.4,
-        max_tokens=800,
-        stream=True,
-    )
+    # Replay a cached completion as a token stream
+    key = cache_key(settings.llm_model_stream, prompt, 0.4)
+    if settings.llm_cache_enabled:
+        cached = await get_llm_cache().get(key)
+        if cached is not None:
+            for chunk in replay_chunks(cached):
+                yield chunk
+            return
 
-    async for chunk in stream:
-        if not chunk.choices:
-            continue
-        delta = chunk.choices[0].delta
-        if delta.content:
-            yield delta.content
+    client = _get_openai()
+    parts = []
+    async with get_llm_scheduler().slot(
+        settings.llm_model_stream, priority, prompt_tokens + 800
+    ) as lease:
+        # Only opening the stream is governed; a stream that breaks midway
+        # is not retried, since its tokens have already been sent.
+        stream = await get_governor("openai").call(
+            lambda: client.chat.completions.create(
+                model=settings.llm_model_stream,
+                messages=[{"role": "user", "content": prompt}],
+                temperature=0.4,
+                max_tokens=800,
+                stream=True,
+            ),
+            deadline=settings.openai_stream_deadline,
+        )
+        async for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta
+            if delta.content:
+                lease.first_token()
+                parts.append(delta.content)
+                yield delta.content
+        lease.record_tokens(prompt_tokens + estimate_tokens("".join(parts)))
+
+    # Only cache streams that ran to completion
+    if settings.llm_cache_enabled and parts:
+        await get_llm_cache().set(key, "".join(parts))
 
 
 def _mock_extract_commitments(notes: str, participants: list[str]) -> list[dict]:
@@ -201,6 +447,20 @@ def _mock_extract_commitments(notes: str, participants: list[str]) -> list[dict]
     ]
 
 
+def _mock_analyze_meeting(notes: str, participants: list[str]) -> tuple[str, list[dict]]:
+    """Offline combined analysis, routed through the real response parser."""
+    text = json.dumps(
+        {
+            "summary": _mock_summarize(participants),
+            "commitments": _mock_extract_commitments(notes, participants),
+        }
+    )
+    parsed = _parse_analysis(f"```json\n{text}\n```")
+    if parsed is None:
+        raise RuntimeError("Mock analysis does not match the analysis format")
+    return parsed
+
+
 async def _mock_stream_briefing(contact_name: str) -> AsyncGenerator[str, None]:
     """Fallback mock streaming for development."""
     import asyncio
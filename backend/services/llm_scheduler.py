@@ -0,0 +1,257 @@
+"""Priority scheduling of LLM requests per model.
+
+Live briefing streams (interactive lane) and meeting analysis or
+background briefing regeneration (batch lane) share the same OpenAI
+quota. Each model gets a ``ModelScheduler`` that admits requests under:
+
+- a concurrency cap, with ``interactive_reserved`` slots batch work may
+  never take;
+- a tokens-per-minute budget over a sliding 60s window, charged with an
+  estimate at admission and corrected with actual usage on release;
+- strict lane priority: batch requests are deferred while any
+  interactive request is queued, and held to one in flight while recent
+  interactive latency (queue wait plus time to first token) is above
+  ``target_ms``.
+
+In-flight requests are never cancelled; deferring new batch work is
+enough because analysis calls are short next to a briefing session.
+"""
+
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, NamedTuple
+
+from backend.config import settings
+from backend.services import metrics
+
+INTERACTIVE = 0
+BATCH = 1
+LANES = {INTERACTIVE: "interactive", BATCH: "batch"}
+
+TPM_WINDOW = 60.0  # seconds
+DEGRADED_HOLD = 30.0  # seconds an interactive latency sample stays relevant
+LATENCY_ALPHA = 0.3  # EWMA weight of the newest interactive sample
+
+
+class _Waiter(NamedTuple):
+    tokens: int
+    future: asyncio.Future
+
+
+class Lease:
+    """An admitted request; report its first token and real token usage."""
+
+    def __init__(self, scheduler: "ModelScheduler", priority: int, tokens: int):
+        self._scheduler = scheduler
+        self.priority = priority
+        self.usage = [time.monotonic(), tokens]  # entry in the TPM window
+        self.wait_ms = 0.0
+        self._first_token_seen = False
+
+    def first_token(self) -> None:
+        if not self._first_token_seen:
+            self._first_token_seen = True
+            self._scheduler._observe(self)
+
+    def record_tokens(self, tokens: int) -> None:
+        self._scheduler._recharge(self, tokens)
+
+
+class ModelScheduler:
+    def __init__(
+        self,
+        model: str,
+        max_concurrency: int = 8,
+        tpm: int = 0,
+        interactive_reserved: int = 2,
+        target_ms: float = 1500.0,
+    ):
+        self.model = model
+        self.max_concurrency = max(1, max_concurrency)
+        self.tpm = tpm
+        self.interactive_reserved = min(
+            max(0, interactive_reserved), self.max_concurrency - 1
+        )
+        self.target_ms = target_ms
+        self.in_flight = {INTERACTIVE: 0, BATCH: 0}
+        self._queues: dict[int, deque[_Waiter]] = {
+            INTERACTIVE: deque(),
+            BATCH: deque(),
+        }
+        self._window: deque[list] = deque()  # [admitted_at, tokens]
+        self._tokens_used = 0
+        self._timer: asyncio.TimerHandle | None = None
+        self._latency_ms = 0.0
+        self._latency_at = 0.0
+        self.admitted = {INTERACTIVE: 0, BATCH: 0}
+        self.deferred = 0  # batch requests held back for the interactive lane
+        self.tpm_waits = 0
+
+    @property
+    def degraded(self) -> bool:
+        return (
+            self._latency_ms > self.target_ms
+            and time.monotonic() - self._latency_at < DEGRADED_HOLD
+        )
+
+    @asynccontextmanager
+    async def slot(self, priority: int, tokens: int) -> AsyncIterator[Lease]:
+        lease = await self._acquire(priority, tokens)
+        try:
+            yield lease
+        finally:
+            self._release(lease)
+
+    async def _acquire(self, priority: int, tokens: int) -> Lease:
+        start = time.monotonic()
+        queued_ahead = any(self._queues[p] for p in LANES if p <= priority)
+        if not queued_ahead and self._admissible(priority, tokens):
+            lease = self._admit(priority, tokens)
+        else:
+            if priority == BATCH and (self._queues[INTERACTIVE] or self.degraded):
+                self.deferred += 1
+            waiter = _Waiter(tokens, asyncio.get_running_loop().create_future())
+            self._queues[priority].append(waiter)
+            self._dispatch()  # arms the TPM timer when tokens are what's short
+            try:
+                lease = await waiter.future
+            except asyncio.CancelledError:
+                if waiter.future.done() and not waiter.future.cancelled():
+                    self._release(waiter.future.result())
+                else:
+                    self._queues[priority].remove(waiter)
+                    self._dispatch()
+                raise
+        lease.wait_ms = (time.monotonic() - start) * 1000
+        metrics.latency(f"llm_wait_{LANES[priority]}").record(lease.wait_ms)
+        return lease
+
+    def _admissible(self, priority: int, tokens: int) -> bool:
+        if sum(self.in_flight.values()) >= self.max_concurrency:
+            return False
+        if priority == BATCH:
+            if self._queues[INTERACTIVE]:
+                return False
+            limit = self.max_concurrency - self.interactive_reserved
+            if self.degraded:
+                limit = 1
+            if self.in_flight[BATCH] >= limit:
+                return False
+        if self.tpm:
+            self._expire_window()
+            # An oversized request still runs once the window is empty.
+            if self._tokens_used and self._tokens_used + tokens > self.tpm:
+                return False
+        return True
+
+    def _admit(self, priority: int, tokens: int) -> Lease:
+        lease = Lease(self, priority, tokens)
+        self.in_flight[priority] += 1
+        self.admitted[priority] += 1
+        self._window.append(lease.usage)
+        self._tokens_used += tokens
+        return lease
+
+    def _release(self, lease: Lease) -> None:
+        self.in_flight[lease.priority] -= 1
+        if lease.priority == INTERACTIVE and not lease._first_token_seen:
+            self._observe(lease)
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        tpm_blocked = False
+        for priority in LANES:
+            queue = self._queues[priority]
+            while queue:
+                waiter = queue[0]
+                if waiter.future.done():
+                    queue.popleft()
+                    continue
+                if not self._admissible(priority, waiter.tokens):
+                    tpm_blocked = tpm_blocked or self._tpm_blocked(waiter.tokens)
+                    break
+                queue.popleft()
+                waiter.future.set_result(self._admit(priority, waiter.tokens))
+        if tpm_blocked and self._timer is None and self._window:
+            self.tpm_waits += 1
+            delay = max(self._window[0][0] + TPM_WINDOW - time.monotonic(), 0.01)
+            self._timer = asyncio.get_running_loop().call_later(delay, self._on_timer)
+
+    def _on_timer(self) -> None:
+        self._timer = None
+        self._dispatch()
+
+    def _tpm_blocked(self, tokens: int) -> bool:
+        return bool(self.tpm and self._tokens_used + tokens > self.tpm)
+
+    def _expire_window(self) -> None:
+        cutoff = time.monotonic() - TPM_WINDOW
+        while self._window and self._window[0][0] < cutoff:
+            self._tokens_used -= self._window.popleft()[1]
+
+    def _recharge(self, lease: Lease, tokens: int) -> None:
+        # Only adjust usage that is still inside the window.
+        if self._window and lease.usage[0] >= self._window[0][0]:
+            self._tokens_used += tokens - lease.usage[1]
+        lease.usage[1] = tokens
+
+    def _observe(self, lease: Lease) -> None:
+        if lease.priority != INTERACTIVE:
+            return
+        now = time.monotonic()
+        sample = lease.wait_ms + (now - lease.usage[0]) * 1000
+        if now - self._latency_at < DEGRADED_HOLD:
+            sample = LATENCY_ALPHA * sample + (1 - LATENCY_ALPHA) * self._latency_ms
+        self._latency_ms = sample
+        self._latency_at = now
+
+    def stats(self) -> dict:
+        if self.tpm:
+            self._expire_window()
+        return {
+            "in_flight": {LANES[p]: n for p, n in self.in_flight.items()},
+            "queued": {LANES[p]: len(q) for p, q in self._queues.items()},
+            "admitted": {LANES[p]: n for p, n in self.admitted.items()},
+            "deferred_batch": self.deferred,
+            "tokens_last_minute": self._tokens_used,
+            "tpm_waits": self.tpm_waits,
+            "interactive_latency_ms": round(self._latency_ms, 1),
+            "degraded": self.degraded,
+        }
+
+
+class LLMScheduler:
+    def __init__(self):
+        self._models: dict[str, ModelScheduler] = {}
+
+    def model(self, name: str) -> ModelScheduler:
+        if name not in self._models:
+            self._models[name] = ModelScheduler(
+                name,
+                max_concurrency=settings.llm_model_concurrency.get(
+                    name, settings.llm_max_concurrency
+                ),
+                tpm=settings.llm_model_tpm.get(name, settings.llm_tpm_limit),
+                interactive_reserved=settings.llm_interactive_reserved,
+                target_ms=settings.llm_interactive_target_ms,
+            )
+        return self._models[name]
+
+    def slot(self, model: str, priority: int, tokens: int):
+        """``async with`` a lease on ``model`` in the ``priority`` lane."""
+        return self.model(model).slot(priority, tokens)
+
+    def stats(self) -> dict:
+        return {name: m.stats() for name, m in sorted(self._models.items())}
+
+
+_scheduler: LLMScheduler | None = None
+
+
+def get_llm_scheduler() -> LLMScheduler:
+    global _scheduler
+    if _scheduler is None:
+        _scheduler = LLMScheduler()
+    return _scheduler
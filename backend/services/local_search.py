@@ -0,0 +1,124 @@
+"""Local full-text index over stored meetings and commitments.
+
+Search normally goes to EverOS, but EverOS only knows what was ingested
+for a participant and the cloud API refuses unscoped queries. This BM25
+index over meeting titles, summaries and notes and over commitment
+descriptions lets search answer unscoped queries and serve degraded
+results when EverOS is slow or down. ``process_meeting`` keeps it current;
+``load`` rebuilds it from storage at startup.
+"""
+
+from typing import NamedTuple
+
+from backend.models.schemas import Commitment, Meeting, SearchResult
+from backend.services.search_index import BM25Index
+
+NOTES_PREVIEW_CHARS = 500
+
+
+class LocalDoc(NamedTuple):
+    result: SearchResult
+    contacts: tuple[str, ...]  # lowercased names, for contact filtering
+
+
+class LocalSearchIndex:
+    def __init__(self):
+        self._index = BM25Index()
+        self._docs: dict[int, LocalDoc] = {}
+        self._ids: dict[tuple[str, str], int] = {}  # (kind, record id) -> doc
+
+    def __len__(self) -> int:
+        return len(self._docs)
+
+    async def load(self) -> None:
+        from backend.storage import commitments_store, meetings_store
+
+        for meeting in await meetings_store.list():
+            self.add_meeting(meeting)
+        self.add_commitments(await commitments_store.list())
+        print(f"Local search index: {len(self)} document(s)")
+
+    def add_meeting(self, meeting: Meeting) -> None:
+        content = meeting.summary or meeting.notes[:NOTES_PREVIEW_CHARS]
+        self._put(
+            ("meeting", meeting.id),
+            [(meeting.title, 1.0), (meeting.summary or "", 2.0), (meeting.notes, 1.0)],
+            LocalDoc(
+                SearchResult(
+                    content=content,
+                    meeting_title=meeting.title,
+                    meeting_date=meeting.meeting_date,
+                    participants=list(meeting.participants),
+                    memory_type="episodic_memory",
+                    meeting_id=meeting.id,
+                ),
+                tuple(p.lower() for p in meeting.participants),
+            ),
+        )
+
+    def add_commitments(self, commitments: list[Commitment]) -> None:
+        for c in commitments:
+            self._put(
+                ("commitment", c.id),
+                [(c.description, 2.0), (c.meeting_title, 1.0)],
+                LocalDoc(
+                    SearchResult(
+                        content=c.description,
+                        meeting_title=c.meeting_title,
+                        meeting_date=c.created_at,
+                        participants=[c.owner, c.recipient],
+                        memory_type="commitment",
+                        meeting_id=c.meeting_id,
+                    ),
+                    (c.owner.lower(), c.recipient.lower()),
+                ),
+            )
+
+    def search(
+        self,
+        query: str,
+        contact: str | None = None,
+        memory_types: list[str] | None = None,
+        top_k: int = 10,
+    ) -> list[SearchResult]:
+        """Best matches, scored relative to the top hit (1.0).
+
+        ``contact`` keeps documents with a participant name containing it
+        (case-insensitive), like the storage contact filters.
+        """
+        contact = contact.lower() if contact else None
+        # Over-fetch so filtering still leaves up to top_k results.
+        hits = self._index.search(query, top_k=top_k * 4)
+        results = []
+        best = hits[0][1] if hits else 0.0
+        for doc_id, score in hits:
+            doc = self._docs[doc_id]
+            if contact and not any(contact in name for name in doc.contacts):
+                continue
+            if memory_types and doc.result.memory_type not in memory_types:
+                continue
+            results.append(
+                doc.result.model_copy(
+                    update={"relevance_score": round(score / best, 4)}
+                )
+            )
+            if len(results) == top_k:
+                break
+        return results
+
+    def _put(
+        self, key: tuple[str, str], fields: list[tuple[str, float]], doc: LocalDoc
+    ) -> None:
+        doc_id = self._ids.setdefault(key, len(self._ids))
+        self._index.add(doc_id, fields)
+        self._docs[doc_id] = doc
+
+
+_index: LocalSearchIndex | None = None
+
+
+def get_local_search() -> LocalSearchIndex:
+    global _index
+    if _index is None:
+        _index = LocalSearchIndex()
+    return _index
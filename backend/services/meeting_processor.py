@@ -1,79 +1,202 @@
+import asyncio
 import json
+import time
 import uuid
 from datetime import datetime, timezone
 
+from backend.config import settings
 from backend.models.schemas import (
     Commitment,
     CommitmentDirection,
     CommitmentStatus,
+    MEETING_STAGES,
+    Meeting,
     MeetingStatus,
+    StageReport,
+    StageStatus,
 )
+from backend.services.events import MEETING_PROCESSED, publish
+from backend.services.local_search import get_local_search
+from backend.storage.base import MeetingRepository
 
 
-async def process_meeting(meeting_id: str, meetings_store: dict) -> None:
-    """Background task: extract commitments and store memories."""
-    meeting = meetings_store.get(meeting_id)
+async def process_meeting(
+    meeting_id: str, meetings_store: MeetingRepository
+) -> None:
+    """Background task: extract commitments and store memories.
+
+    EverOS storage, summarization and commitment extraction are independent,
+    so they run as concurrent stages. Each stage records its own status and
+    timing on ``meeting.stages``, and its result is published as soon as
+    that stage finishes. Stages that already completed are skipped, so a
+    retried meeting only re-runs what failed.
+    """
+    meeting = await meetings_store.get(meeting_id)
     if not meeting:
         return
 
+    meeting.status = MeetingStatus.PROCESSING
+    for name in MEETING_STAGES:
+        meeting.stages.setdefault(name, StageReport())
+
+    # In combined mode both LLM stages share one analyze_meeting call.
+    analysis = None
+    if settings.llm_combined_analysis and not all(
+        meeting.stages[name].status == StageStatus.COMPLETED
+        for name in ("summary", "commitments")
+    ):
+        from backend.services.llm_client import analyze_meeting
+
+        analysis = asyncio.ensure_future(
+            analyze_meeting(meeting.notes, meeting.participants)
+        )
+    ok = await asyncio.gather(
+        _run_stage(meetings_store, meeting, "storage", lambda: _storage_stage(meeting)),
+        _run_stage(
+            meetings_store, meeting, "summary", lambda: _summary_stage(meeting, analysis)
+        ),
+        _run_stage(
+            meetings_store,
+            meeting,
+            "commitments",
+            lambda: _commitments_stage(meeting, analysis),
+        ),
+    )
+
+    meeting.status = MeetingStatus.COMPLETED if all(ok) else MeetingStatus.FAILED
+    await meetings_store.save(meeting)
+    get_local_search().add_meeting(meeting)
+    await publish(MEETING_PROCESSED, meeting)
+
+
+async def process_meeting_job(payload: dict) -> None:
+    """Job queue handler for ``process_meeting``.
+
+    The payload carries the full meeting so journaled jobs can be replayed
+    after a restart. Raises when a stage failed so the queue retries it.
+    """
+    from backend.routers.meetings import meetings_store
+
+    meeting_id = payload["meeting_id"]
+    if await meetings_store.get(meeting_id) is None:
+        await meetings_store.save(Meeting.model_validate(payload["meeting"]))
+    await process_meeting(meeting_id, meetings_store)
+
+    meeting = await meetings_store.get(meeting_id)
+    if meeting.status == MeetingStatus.FAILED:
+        failed = [n for n, r in meeting.stages.items() if r.status == StageStatus.FAILED]
+        raise RuntimeError(f"stages failed: {', '.join(failed)}")
+
+
+async def _run_stage(
+    meetings_store: MeetingRepository, meeting: Meeting, name: str, stage
+) -> bool:
+    """Run one pipeline stage, recording status, duration and error.
+
+    The meeting is saved when the stage finishes so its result is visible
+    before the other stages complete.
+    """
+    report = meeting.stages[name]
+    if report.status == StageStatus.COMPLETED:
+        return True
+    report.status = StageStatus.RUNNING
+    report.error = None
+    report.attempts += 1
+    start = time.perf_counter()
     try:
-        # 1. Store in EverOS
-        from backend.services.everos_client import get_client
-
-        client = get_client()
-        # Use current time as timestamp; EverOS rejects future dates.
-        # Meeting date is preserved in the notes content itself.
-        now = datetime.now(timezone.utc)
-        store_time = min(
-            meeting.meeting_date.replace(tzinfo=timezone.utc)
-            if meeting.meeting_date.tzinfo is None
-            else meeting.meeting_date,
-            now,
-        ).isoformat()
-        for i, participant in enumerate(meeting.participants):
-            await client.store_message(
-                message_id=f"{meeting_id}_{i}",
-                timestamp=store_time,
-                sender_id=participant.lower().replace(" ", "_"),
-                content=meeting.notes,
-                meeting_id=meeting_id,
-                meeting_name=meeting.title,
-                sender_name=participant,
-            )
+        await stage()
+        report.status = StageStatus.COMPLETED
+        return True
+    except Exception as e:
+        print(f"Meeting {meeting.id} stage '{name}' failed: {e}")
+        report.status = StageStatus.FAILED
+        report.error = str(e)
+        return False
+    finally:
+        report.duration_ms = round((time.perf_counter() - start) * 1000, 1)
+        await meetings_store.save(meeting)
+
 
-        # 2. Generate summary + extract commitments via LLM
-        from backend.services.llm_client import extract_commitments, summarize_meeting
+async def _storage_stage(meeting: Meeting) -> None:
+    from backend.services.everos_client import get_client
+
+    client = get_client()
+    # Use current time as timestamp; EverOS rejects future dates.
+    # Meeting date is preserved in the notes content itself.
+    now = datetime.now(timezone.utc)
+    store_time = min(
+        meeting.meeting_date.replace(tzinfo=timezone.utc)
+        if meeting.meeting_date.tzinfo is None
+        else meeting.meeting_date,
+        now,
+    ).isoformat()
+    meeting.storage_errors = await _store_participant_messages(
+        client, meeting, store_time
+    )
+    if not meeting.storage_errors:
+        return
+    failed = (
+        f"EverOS store failed for {len(meeting.storage_errors)} of "
+        f"{len(meeting.participants)} participants"
+    )
+    # Let the job queue retry the participants that failed; on the last
+    # attempt keep them in storage_errors instead of failing the meeting.
+    report = meeting.stages["storage"]
+    if report.attempts < settings.job_max_attempts:
+        raise RuntimeError(failed)
+    print(f"Meeting {meeting.id}: {failed}, giving up on them")
+    report.error = failed
 
+
+async def _summary_stage(meeting: Meeting, analysis: asyncio.Future | None) -> None:
+    from backend.services.llm_client import summarize_meeting
+
+    if analysis is not None:
+        meeting.summary, _ = await analysis
+    else:
         meeting.summary = await summarize_meeting(meeting.notes, meeting.participants)
-        raw_commitments = await extract_commitments(meeting.notes, meeting.participants)
 
-        # 3. Store commitments
-        from backend.routers.commitments import commitments_store
 
-        first_p_lower = (
-            meeting.participants[0].lower().strip() if meeting.participants else ""
+async def _commitments_stage(
+    meeting: Meeting, analysis: asyncio.Future | None
+) -> None:
+    from backend.services.llm_client import extract_commitments
+    from backend.services.overdue_tracker import get_overdue_tracker
+    from backend.storage import commitments_store
+
+    if analysis is not None:
+        _, raw_commitments = await analysis
+    else:
+        raw_commitments = await extract_commitments(
+            meeting.notes, meeting.participants
         )
-        for rc in raw_commitments:
-            cid = str(uuid.uuid4())
-            owner_lower = rc.get("owner", "").lower().strip()
-            # Use LLM-provided direction if available, otherwise infer
-            raw_dir = rc.get("direction", "")
-            if raw_dir == "i_owe":
-                direction = CommitmentDirection.I_OWE
-            elif raw_dir == "owed_to_me":
-                direction = CommitmentDirection.OWED_TO_ME
-            elif owner_lower == first_p_lower or owner_lower in {"me", "i", "user"}:
-                direction = CommitmentDirection.I_OWE
-            else:
-                direction = CommitmentDirection.OWED_TO_ME
-            due_date = None
-            if rc.get("due_date"):
-                try:
-                    due_date = datetime.fromisoformat(rc["due_date"])
-                except (ValueError, TypeError):
-                    pass
-
-            commitments_store[cid] = Commitment(
+
+    first_p_lower = (
+        meeting.participants[0].lower().strip() if meeting.participants else ""
+    )
+    commitments = []
+    for rc in raw_commitments:
+        cid = str(uuid.uuid4())
+        owner_lower = rc.get("owner", "").lower().strip()
+        # Use LLM-provided direction if available, otherwise infer
+        raw_dir = rc.get("direction", "")
+        if raw_dir == "i_owe":
+            direction = CommitmentDirection.I_OWE
+        elif raw_dir == "owed_to_me":
+            direction = CommitmentDirection.OWED_TO_ME
+        elif owner_lower == first_p_lower or owner_lower in {"me", "i", "user"}:
+            direction = CommitmentDirection.I_OWE
+        else:
+            direction = CommitmentDirection.OWED_TO_ME
+        due_date = None
+        if rc.get("due_date"):
+            try:
+                due_date = datetime.fromisoformat(rc["due_date"])
+            except (ValueError, TypeError):
+                pass
+
+        commitments.append(
+            Commitment(
                 id=cid,
                 description=rc.get("description", ""),
                 owner=rc.get("owner", "Unknown"),
@@ -81,16 +204,51 @@ async def process_meeting(meeting_id: str, meetings_store: dict) -> None:
                 direction=direction,
                 due_date=due_date,
                 status=CommitmentStatus.PENDING,
-                meeting_id=meeting_id,
+                meeting_id=meeting.id,
                 meeting_title=meeting.title,
                 created_at=datetime.now(timezone.utc),
             )
+        )
+    await commitments_store.save_many(commitments)
+    get_local_search().add_commitments(commitments)
+    tracker = get_overdue_tracker()
+    for c in commitments:
+        tracker.track(c)
 
-        # 4. Mark meeting as completed
-        meeting.status = MeetingStatus.COMPLETED
-        meetings_store[meeting_id] = meeting
 
-    except Exception as e:
-        print(f"Meeting processing failed: {e}")
-        meeting.status = MeetingStatus.FAILED
-        meetings_store[meeting_id] = meeting
+async def _store_participant_messages(
+    client, meeting: Meeting, store_time: str
+) -> list[str]:
+    """Store one message per participant concurrently; return per-participant errors.
+
+    Fan-out is bounded by ``everos_ingest_concurrency``. Transient failures
+    are retried by the EverOS governor; a participant that still fails is
+    recorded, and the rest are added to ``meeting.stored_participants`` so a
+    retry of the stage only stores the participants that failed.
+    """
+    semaphore = asyncio.Semaphore(max(1, settings.everos_ingest_concurrency))
+
+    async def store_one(i: int, participant: str) -> str | None:
+        if participant in meeting.stored_participants:
+            return None
+        async with semaphore:
+            try:
+                await client.store_message(
+                    message_id=f"{meeting.id}_{i}",
+                    timestamp=store_time,
+                    sender_id=participant.lower().replace(" ", "_"),
+                    content=meeting.notes,
+                    meeting_id=meeting.id,
+                    meeting_name=meeting.title,
+                    sender_name=participant,
+                )
+                meeting.stored_participants.append(participant)
+                return None
+            except Exception as e:
+                print(f"EverOS store failed for {participant}: {e}")
+                return f"{participant}: {e}"
+
+    results = await asyncio.gather(
+        *(store_one(i, p) for i, p in enumerate(meeting.participants))
+    )
+    return [r for r in results if r]
@@ -0,0 +1,50 @@
+"""In-process metrics.
+
+Each named series keeps a bounded window of recent samples and reports
+count and percentiles; ``snapshot()`` is what ``/health`` exposes.
+"""
+
+from collections import deque
+
+
+class SampleStats:
+    def __init__(self, unit: str = "ms", window: int = 500):
+        self.unit = unit
+        self._samples: deque[float] = deque(maxlen=window)
+        self.count = 0
+
+    def record(self, value: float) -> None:
+        self._samples.append(value)
+        self.count += 1
+
+    def summary(self) -> dict:
+        samples = sorted(self._samples)
+        if not samples:
+            return {"count": 0}
+
+        def pct(p: float) -> float:
+            return round(samples[min(len(samples) - 1, int(len(samples) * p))], 1)
+
+        return {
+            "count": self.count,
+            f"p50_{self.unit}": pct(0.5),
+            f"p95_{self.unit}": pct(0.95),
+            f"max_{self.unit}": round(samples[-1], 1),
+        }
+
+
+_series: dict[str, SampleStats] = {}
+
+
+def sample(name: str, unit: str) -> SampleStats:
+    if name not in _series:
+        _series[name] = SampleStats(unit)
+    return _series[name]
+
+
+def latency(name: str) -> SampleStats:
+    return sample(name, "ms")
+
+
+def snapshot() -> dict:
+    return {name: stats.summary() for name, stats in sorted(_series.items())}
@@ -0,0 +1,106 @@
+"""Chunking of long meeting notes for map-reduce analysis.
+
+Notes up to 50,000 characters do not fit one prompt well: a single call
+is slow, and its output gets cut off at ``max_tokens``. ``split_notes``
+cuts the notes at speaker turns and paragraph breaks into chunks of at
+most ``max_tokens`` estimated tokens, so each chunk can be analyzed
+concurrently. ``merge_commitments`` joins the per-chunk results and
+drops commitments that several chunks extracted.
+"""
+
+import re
+
+from backend.services.context_builder import estimate_tokens, is_near_duplicate
+from backend.services.search_index import tokenize
+
+# "Alice:", "Bob Smith (PM):", "[00:12:31] Alice:" at the start of a line
+SPEAKER_RE = re.compile(r"^\s*(\[[\d:.]+\]\s*)?[A-Z][\w .'()-]{0,40}:\s")
+SENTENCE_RE = re.compile(r"(?<=[.!?])\s+")
+COMMITMENT_DEDUP_THRESHOLD = 0.6
+
+
+def split_notes(notes: str, max_tokens: int) -> list[str]:
+    """Consecutive chunks of at most ``max_tokens`` estimated tokens.
+
+    Units are speaker turns or paragraphs, packed greedily in order. A
+    unit too long on its own is split at sentence boundaries, and a
+    sentence too long on its own at word boundaries.
+    """
+    if estimate_tokens(notes) <= max_tokens:
+        return [notes]
+    chunks: list[str] = []
+    current: list[str] = []
+    used = 0
+    for unit in _units(notes):
+        for piece in _fit(unit, max_tokens):
+            cost = estimate_tokens(piece) + 1
+            if current and used + cost > max_tokens:
+                chunks.append("\n".join(current))
+                current, used = [], 0
+            current.append(piece)
+            used += cost
+    if current:
+        chunks.append("\n".join(current))
+    return chunks
+
+
+def merge_commitments(per_chunk: list[list[dict]]) -> list[dict]:
+    """Concatenate chunk results in order without near-duplicates.
+
+    Two commitments are duplicates when they have the same owner and
+    similar descriptions; the first one is kept unless only the later
+    one has a due date.
+    """
+    merged: list[dict] = []
+    keys: list[tuple[str, set[str]]] = []
+    for commitments in per_chunk:
+        for c in commitments:
+            owner = str(c.get("owner") or "").lower().strip()
+            tokens = set(tokenize(str(c.get("description") or "")))
+            for i, (seen_owner, seen_tokens) in enumerate(keys):
+                if seen_owner == owner and is_near_duplicate(
+                    tokens, seen_tokens, COMMITMENT_DEDUP_THRESHOLD
+                ):
+                    if c.get("due_date") and not merged[i].get("due_date"):
+                        merged[i] = c
+                    break
+            else:
+                merged.append(c)
+                keys.append((owner, tokens))
+    return merged
+
+
+def _units(notes: str) -> list[str]:
+    units: list[str] = []
+    lines: list[str] = []
+    for line in notes.splitlines():
+        if lines and (not line.strip() or SPEAKER_RE.match(line)):
+            units.append("\n".join(lines))
+            lines = []
+        if line.strip():
+            lines.append(line)
+    if lines:
+        units.append("\n".join(lines))
+    return units
+
+
+def _fit(unit: str, max_tokens: int) -> list[str]:
+    if estimate_tokens(unit) <= max_tokens:
+        return [unit]
+    pieces: list[str] = []
+    for sentence in SENTENCE_RE.split(unit):
+        if estimate_tokens(sentence) <= max_tokens:
+            pieces.append(sentence)
+            continue
+        words: list[str] = []
+        used = 0
+        for word in sentence.split():
+            cost = estimate_tokens(word)
+            if words and used + cost > max_tokens:
+                pieces.append(" ".join(words))
+                words, used = [], 0
+            words.append(word)
+            used += cost
+        if words:
+            pieces.append(" ".join(words))
+    return pieces
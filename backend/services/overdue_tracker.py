@@ -0,0 +1,122 @@
+"""Flip commitments to overdue at the moment their due date passes.
+
+Pending commitments with a due date sit in a min-heap keyed on due time.
+A single background task sleeps until the earliest deadline, flips the
+status once, saves it and publishes ``COMMITMENT_OVERDUE``. Reads never
+have to re-check due dates.
+
+Heap entries are never removed in place: when a commitment's due date or
+status changes it is simply pushed again, and stale entries are discarded
+when popped by re-checking the stored commitment.
+
+The heap only knows commitments this process created or loaded at start,
+so every wake also asks the store for pending commitments already past due
+(``list_due``); with a shared SQLite database that picks up commitments
+other workers created. A storage error on one commitment is logged and the
+flip retried after ``RETRY_DELAY``; it never stops the timer task.
+"""
+
+import asyncio
+import heapq
+from datetime import datetime, timedelta, timezone
+
+from backend.models.schemas import Commitment, CommitmentStatus
+from backend.services.events import COMMITMENT_OVERDUE, publish
+from backend.storage.base import CommitmentRepository
+
+MAX_SLEEP = 300.0  # re-check at least this often (seconds) to absorb clock jumps
+RETRY_DELAY = 5.0  # seconds before retrying a flip that failed to save
+
+
+def _due_at(c: Commitment) -> datetime | None:
+    # Same interpretation as before: due dates are treated as UTC.
+    return c.due_date.replace(tzinfo=timezone.utc) if c.due_date else None
+
+
+class OverdueTracker:
+    def __init__(self, store: CommitmentRepository):
+        self.store = store
+        # (when to check, commitment id, due date it was scheduled for)
+        self._heap: list[tuple[datetime, str, datetime]] = []
+        self._wake: asyncio.Event | None = None
+        self._task: asyncio.Task | None = None
+        self.flipped = 0
+        self.errors = 0
+
+    async def start(self) -> None:
+        """Load pending commitments, expire the ones already past due and
+        start the timer task."""
+        self._wake = asyncio.Event()
+        for c in await self.store.list(status=CommitmentStatus.PENDING):
+            self.track(c)
+        self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+            self._task = None
+
+    def track(self, c: Commitment) -> None:
+        """Schedule (or reschedule) ``c``; call after insert or patch."""
+        due = _due_at(c)
+        if c.status != CommitmentStatus.PENDING or due is None:
+            return
+        self._push(due, c.id, due)
+
+    def _push(self, when: datetime, cid: str, due: datetime) -> None:
+        earliest = self._heap[0][0] if self._heap else None
+        heapq.heappush(self._heap, (when, cid, due))
+        if self._wake is not None and (earliest is None or when < earliest):
+            self._wake.set()
+
+    async def _run(self) -> None:
+        while True:
+            now = datetime.now(timezone.utc)
+            try:
+                for c in await self.store.list_due(now):
+                    self.track(c)
+            except Exception as e:
+                self.errors += 1
+                print(f"Overdue sweep failed: {e}")
+            while self._heap and self._heap[0][0] <= now:
+                _, cid, due = heapq.heappop(self._heap)
+                try:
+                    await self._expire(cid, due)
+                except Exception as e:
+                    self.errors += 1
+                    print(f"Overdue flip for commitment {cid} failed: {e}")
+                    retry_at = now + timedelta(seconds=RETRY_DELAY)
+                    heapq.heappush(self._heap, (retry_at, cid, due))
+
+            timeout = MAX_SLEEP
+            if self._heap:
+                timeout = min(timeout, (self._heap[0][0] - now).total_seconds())
+            self._wake.clear()
+            try:
+                await asyncio.wait_for(self._wake.wait(), timeout=max(timeout, 0))
+            except asyncio.TimeoutError:
+                pass
+
+    async def _expire(self, cid: str, due: datetime) -> None:
+        c = await self.store.get(cid)
+        # Skip stale heap entries (completed, rescheduled or deleted).
+        if c is None or c.status != CommitmentStatus.PENDING or _due_at(c) != due:
+            return
+        # Save a copy so a failed save leaves the stored object untouched.
+        overdue = c.model_copy(update={"status": CommitmentStatus.OVERDUE})
+        await self.store.save(overdue)
+        self.flipped += 1
+        await publish(COMMITMENT_OVERDUE, overdue)
+
+
+_tracker: OverdueTracker | None = None
+
+
+def get_overdue_tracker() -> OverdueTracker:
+    global _tracker
+    if _tracker is None:
+        from backend.storage import commitments_store
+
+        _tracker = OverdueTracker(commitments_store)
+    return _tracker
@@ -0,0 +1,151 @@
+"""Read-through cache for EverOS searches.
+
+``CachedEverOSClient`` wraps any ``EverOSClient`` and memoizes ``search``
+results keyed on (query, user_id, group_id, method, memory types, top_k).
+Entries expire after a TTL and the least recently used are evicted past
+``max_entries``. Concurrent identical searches share a single upstream call,
+which is cancelled once every caller waiting on it has been cancelled (e.g.
+the methods a fusion search drops at its deadline).
+
+Storing a message invalidates exactly the entries that could now be stale:
+searches scoped to the sender, searches scoped to the message's meeting, and
+unscoped searches. Cached results are shared between callers and must be
+treated as read-only.
+"""
+
+import asyncio
+import time
+from collections import OrderedDict
+
+SearchKey = tuple
+
+
+def search_key(**kwargs) -> SearchKey:
+    types = kwargs.get("memory_types")
+    return (
+        kwargs["query"],
+        kwargs.get("user_id"),
+        kwargs.get("group_id"),
+        kwargs.get("retrieve_method") or "hybrid",
+        tuple(sorted(types)) if types else None,
+        kwargs.get("top_k", 10),
+    )
+
+
+class CachedEverOSClient:
+    def __init__(self, inner, max_entries: int = 1024, ttl: float = 60.0):
+        self.inner = inner
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries: OrderedDict[SearchKey, tuple[float, dict]] = OrderedDict()
+        self._inflight: dict[SearchKey, asyncio.Task] = {}
+        self._waiters: dict[asyncio.Task, int] = {}  # callers per fetch
+        # In-flight searches that a write made stale; their results are
+        # returned to the waiting callers but not cached. Only ever holds
+        # keys of ``_inflight``, so it stays as small as that.
+        self._invalidated: set[SearchKey] = set()
+        self.hits = 0
+        self.misses = 0
+        self.coalesced = 0
+        self.invalidations = 0
+
+    async def open(self) -> None:
+        await self.inner.open()
+
+    async def aclose(self) -> None:
+        await self.inner.aclose()
+
+    async def store_message(self, **kwargs) -> dict:
+        result = await self.inner.store_message(**kwargs)
+        self.invalidate(user_id=kwargs["sender_id"], group_id=kwargs["meeting_id"])
+        return result
+
+    async def get_memories(self, **kwargs) -> dict:
+        return await self.inner.get_memories(**kwargs)
+
+    async def search(self, **kwargs) -> dict:
+        key = search_key(**kwargs)
+        entry = self._entries.get(key)
+        if entry is not None:
+            created_at, result = entry
+            if time.monotonic() - created_at <= self.ttl:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return result
+            del self._entries[key]
+
+        task = self._inflight.get(key)
+        if task is not None:
+            self.coalesced += 1
+        else:
+            self.misses += 1
+            task = asyncio.ensure_future(self._fetch(key, kwargs))
+            # Failures with no waiter left must not be reported as unretrieved.
+            task.add_done_callback(lambda t: t.cancelled() or t.exception())
+            self._inflight[key] = task
+        # The fetch is shared, so one caller's cancellation must not cancel
+        # it for the others; the last caller to leave cancels it.
+        self._waiters[task] = self._waiters.get(task, 0) + 1
+        try:
+            return await asyncio.shield(task)
+        finally:
+            self._waiters[task] -= 1
+            if not self._waiters[task]:
+                del self._waiters[task]
+                task.cancel()  # no-op once it finished
+
+    async def _fetch(self, key: SearchKey, kwargs: dict) -> dict:
+        try:
+            result = await self.inner.search(**kwargs)
+        finally:
+            del self._inflight[key]
+            stale = key in self._invalidated
+            self._invalidated.discard(key)
+        if not stale:
+            self._remember(key, result)
+        return result
+
+    def invalidate(
+        self, user_id: str | None = None, group_id: str | None = None
+    ) -> int:
+        """Drop entries a new message from ``user_id`` in ``group_id`` may affect."""
+        touched = {None, ("user", user_id), ("group", group_id)}
+        self._invalidated.update(
+            k for k in self._inflight if touched & set(self._scopes(k))
+        )
+        stale = [k for k in self._entries if touched & set(self._scopes(k))]
+        for key in stale:
+            del self._entries[key]
+        self.invalidations += len(stale)
+        return len(stale)
+
+    def clear(self) -> None:
+        self._entries.clear()
+
+    def stats(self) -> dict:
+        lookups = self.hits + self.misses
+        return {
+            "entries": len(self._entries),
+            "hits": self.hits,
+            "misses": self.misses,
+            "coalesced": self.coalesced,
+            "invalidations": self.invalidations,
+            "hit_rate": round(self.hits / lookups, 3) if lookups else 0.0,
+        }
+
+    @staticmethod
+    def _scopes(key: SearchKey) -> list:
+        _, user_id, group_id = key[:3]
+        scopes = []
+        if user_id:
+            scopes.append(("user", user_id))
+        if group_id:
+            scopes.append(("group", group_id))
+        # Unscoped searches can match any message.
+        return scopes or [None]
+
+    def _remember(self, key: SearchKey, result: dict) -> None:
+        self._entries[key] = (time.monotonic(), result)
+        self._entries.move_to_end(key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
@@ -0,0 +1,155 @@
+"""In-process BM25 keyword index used by the mock EverOS client.
+
+Documents are tokenized once on insert into per-term postings lists, so a
+query only touches the postings of its own terms instead of scanning every
+stored message. Fields are weighted the way the original mock scoring
+weighted them (content counts double, meeting title and sender once),
+folded into a single BM25F-style term frequency.
+"""
+
+import heapq
+import math
+import re
+from collections import Counter
+
+TOKEN_RE = re.compile(r"\w+", re.UNICODE)
+
+
+def tokenize(text: str) -> list[str]:
+    return TOKEN_RE.findall(text.lower())
+
+
+class BM25Index:
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self._postings: dict[str, dict[int, float]] = {}  # term -> doc -> tf
+        self._lengths: dict[int, float] = {}
+        self._doc_terms: dict[int, list[str]] = {}
+        self._total_length = 0.0
+
+    def __len__(self) -> int:
+        return len(self._lengths)
+
+    def add(self, doc_id: int, fields: list[tuple[str, float]]) -> None:
+        """Index ``doc_id`` from weighted ``(text, weight)`` fields."""
+        if doc_id in self._lengths:
+            self.remove(doc_id)
+        tf: Counter[str] = Counter()
+        length = 0.0
+        for text, weight in fields:
+            for token in tokenize(text):
+                tf[token] += weight
+                length += weight
+        for term, freq in tf.items():
+            self._postings.setdefault(term, {})[doc_id] = freq
+        self._lengths[doc_id] = length
+        self._doc_terms[doc_id] = list(tf)
+        self._total_length += length
+
+    def remove(self, doc_id: int) -> None:
+        length = self._lengths.pop(doc_id, None)
+        if length is None:
+            return
+        self._total_length -= length
+        for term in self._doc_terms.pop(doc_id, ()):
+            docs = self._postings[term]
+            docs.pop(doc_id, None)
+            if not docs:
+                del self._postings[term]
+
+    def idf(self, term: str) -> float:
+        n = len(self._lengths)
+        df = len(self._postings.get(term, ()))
+        return math.log(1 + (n - df + 0.5) / (df + 0.5))
+
+    def search(
+        self,
+        query: str,
+        top_k: int = 10,
+        boosts: dict[int, float] | None = None,
+    ) -> list[tuple[int, float]]:
+        """Return ``(doc_id, score)`` pairs, best first.
+
+        ``boosts`` adds a fixed bonus to documents that already match.
+        """
+        if not self._lengths:
+            return []
+        k1, b = self.k1, self.b
+        lengths = self._lengths
+        avgdl = self._total_length / len(lengths) or 1.0
+        max_boost = max(boosts.values(), default=0.0) if boosts else 0.0
+
+        # MaxScore-style pruning: score rare terms first; once the remaining
+        # (common) terms cannot lift an unseen document into the top k, they
+        # only update documents that are already candidates.
+        terms = [t for t in set(tokenize(query)) if t in self._postings]
+        terms.sort(key=lambda t: len(self._postings[t]))
+        idfs = [self.idf(t) for t in terms]
+        bounds = [idf * (k1 + 1) for idf in idfs]
+        remaining = sum(bounds) + max_boost
+
+        scores: dict[int, float] = {}
+        for term, idf, bound in zip(terms, idfs, bounds):
+            postings = self._postings[term]
+            threshold = (
+                heapq.nlargest(top_k, scores.values())[-1]
+                if len(scores) >= top_k
+                else 0.0
+            )
+            if len(scores) >= top_k and remaining <= threshold:
+                docs = [(d, postings[d]) for d in scores if d in postings]
+            else:
+                docs = postings.items()
+            for doc_id, tf in docs:
+                norm = k1 * (1 - b + b * lengths[doc_id] / avgdl)
+                scores[doc_id] = scores.get(doc_id, 0.0) + idf * tf * (k1 + 1) / (
+                    tf + norm
+                )
+            remaining -= bound
+
+        if boosts:
+            for doc_id, bonus in boosts.items():
+                if doc_id in scores:
+                    scores[doc_id] += bonus
+        return heapq.nlargest(top_k, scores.items(), key=lambda kv: kv[1])
+
+    def rare_term_docs(self, query: str, limit: int) -> set[int]:
+        """Documents containing the query's rarest terms, taking whole
+        postings lists (rarest first) while they fit in ``limit``."""
+        terms = sorted(
+            (self._postings[t] for t in set(tokenize(query)) if t in self._postings),
+            key=len,
+        )
+        docs: set[int] = set()
+        for postings in terms:
+            if len(docs) + len(postings) > limit:
+                break
+            docs.update(postings)
+        return docs
+
+    def score_docs(self, query: str, doc_ids: set[int]) -> dict[int, float]:
+        """BM25 scores of just ``doc_ids``, for those matching any term."""
+        if not self._lengths:
+            return {}
+        k1, b = self.k1, self.b
+        lengths = self._lengths
+        avgdl = self._total_length / len(lengths) or 1.0
+        # norm = k1 * (1 - b + b * length / avgdl), hoisted out of the loop
+        base, slope = k1 * (1 - b), k1 * b / avgdl
+        scores: dict[int, float] = {}
+        for term in set(tokenize(query)):
+            postings = self._postings.get(term)
+            if not postings:
+                continue
+            weight = self.idf(term) * (k1 + 1)
+            # Walk whichever side is smaller.
+            if len(postings) < len(doc_ids):
+                docs = [(d, tf) for d, tf in postings.items() if d in doc_ids]
+            else:
+                docs = [(d, postings[d]) for d in doc_ids if d in postings]
+            for doc_id, tf in docs:
+                scores[doc_id] = scores.get(doc_id, 0.0) + weight * tf / (
+                    tf + base + slope * lengths[doc_id]
+                )
+        return scores
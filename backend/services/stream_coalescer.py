@@ -0,0 +1,87 @@
+"""Coalesce small streamed text deltas into fewer, larger SSE events.
+
+LLM streams (and the mock stream, one character at a time) produce many
+tiny deltas. Emitting each as its own event costs a JSON encode and a
+socket write per delta. ``coalesce`` forwards the first delta immediately
+(so time to first token is unchanged), then buffers deltas and flushes
+once ``window_ms`` has passed since the first buffered delta or the buffer
+reaches ``max_bytes``, whichever comes first.
+
+``replay_chunks`` splits stored text (a cached completion or briefing)
+back into word-sized deltas so it can be replayed as a stream.
+"""
+
+import asyncio
+import re
+import time
+from typing import AsyncIterator
+
+_END = object()
+
+
+def replay_chunks(text: str) -> list[str]:
+    """Split stored text into word-sized chunks for stream replay."""
+    return re.findall(r"\s*\S+\s*", text) or [text]
+
+
+async def coalesce(
+    source: AsyncIterator[str], window_ms: float = 40.0, max_bytes: int = 512
+) -> AsyncIterator[str]:
+    """Re-chunk ``source``; with ``window_ms <= 0`` it is passed through."""
+    if window_ms <= 0:
+        async for chunk in source:
+            yield chunk
+        return
+
+    # A pump task reads the source so the flush timer never has to cancel a
+    # pending read on the source generator.
+    queue: asyncio.Queue = asyncio.Queue()
+
+    async def pump() -> None:
+        try:
+            async for chunk in source:
+                await queue.put(chunk)
+        except Exception as e:
+            await queue.put(e)
+        await queue.put(_END)
+
+    task = asyncio.create_task(pump())
+    window = window_ms / 1000
+    try:
+        item = await queue.get()
+        if isinstance(item, Exception):
+            raise item
+        if item is _END:
+            return
+        yield item
+
+        buffer: list[str] = []
+        size = 0
+        deadline = 0.0
+        while True:
+            if buffer:
+                timeout = deadline - time.monotonic()
+                try:
+                    item = await asyncio.wait_for(queue.get(), max(timeout, 0))
+                except asyncio.TimeoutError:
+                    yield "".join(buffer)
+                    buffer, size = [], 0
+                    continue
+            else:
+                item = await queue.get()
+                deadline = time.monotonic() + window
+
+            if item is _END or isinstance(item, Exception):
+                if buffer:
+                    yield "".join(buffer)
+                if isinstance(item, Exception):
+                    raise item
+                return
+            buffer.append(item)
+            size += len(item.encode("utf-8"))
+            if max_bytes and size >= max_bytes:
+                yield "".join(buffer)
+                buffer, size = [], 0
+    finally:
+        task.cancel()
+        await asyncio.gather(task, return_exceptions=True)
@@ -0,0 +1,116 @@
+"""CPU-only local embeddings and vector search for the mock EverOS client.
+
+Texts are embedded without a model or network: word unigrams and
+boundary-marked character trigrams are hashed (signed feature hashing)
+into a fixed-size vector with sublinear term weighting, then L2-normalized.
+Character trigrams give partial credit for morphology and typos
+("deploy" vs "deployment"), which plain keyword matching misses.
+
+Vectors live in one contiguous float32 matrix, so a query (or a batch of
+queries) is a single matrix product followed by ``argpartition`` top-k.
+"""
+
+import zlib
+
+import numpy as np
+
+from backend.services.search_index import tokenize
+
+WORD_WEIGHT = 1.0
+TRIGRAM_WEIGHT = 0.5
+
+
+def _features(text: str) -> tuple[list[str], list[float]]:
+    feats, weights = [], []
+    for token in tokenize(text):
+        feats.append(token)
+        weights.append(WORD_WEIGHT)
+        padded = f"<{token}>"
+        for i in range(len(padded) - 2):
+            feats.append(padded[i : i + 3])
+            weights.append(TRIGRAM_WEIGHT)
+    return feats, weights
+
+
+class HashingEmbedder:
+    def __init__(self, dim: int = 128):
+        self.dim = dim
+
+    def embed(self, text: str) -> np.ndarray:
+        feats, weights = _features(text)
+        vec = np.zeros(self.dim, dtype=np.float32)
+        if not feats:
+            return vec
+        hashes = np.fromiter(
+            (zlib.crc32(f.encode("utf-8")) for f in feats),
+            dtype=np.uint32,
+            count=len(feats),
+        )
+        signs = np.where(hashes & 0x80000000, -1.0, 1.0)
+        vec += np.bincount(
+            hashes % self.dim,
+            weights=signs * np.asarray(weights),
+            minlength=self.dim,
+        ).astype(np.float32)
+        # Sublinear weighting keeps long notes from being dominated by
+        # repeated tokens, then unit length makes dot product == cosine.
+        vec = np.sign(vec) * np.log1p(np.abs(vec))
+        norm = np.linalg.norm(vec)
+        return vec / norm if norm else vec
+
+    def embed_many(self, texts: list[str]) -> np.ndarray:
+        return np.stack([self.embed(t) for t in texts]) if texts else np.zeros(
+            (0, self.dim), dtype=np.float32
+        )
+
+
+class VectorIndex:
+    """Append-only matrix of unit vectors addressed by row (= doc id)."""
+
+    def __init__(self, dim: int = 128, initial_capacity: int = 1024):
+        self.embedder = HashingEmbedder(dim)
+        self._matrix = np.zeros((initial_capacity, dim), dtype=np.float32)
+        self._size = 0
+
+    def __len__(self) -> int:
+        return self._size
+
+    def add(self, doc_id: int, text: str) -> None:
+        """Embed ``text`` as row ``doc_id``; ids must be assigned densely."""
+        if doc_id >= self._matrix.shape[0]:
+            capacity = max(doc_id + 1, self._matrix.shape[0] * 2)
+            grown = np.zeros((capacity, self._matrix.shape[1]), dtype=np.float32)
+            grown[: self._size] = self._matrix[: self._size]
+            self._matrix = grown
+        self._matrix[doc_id] = self.embedder.embed(text)
+        self._size = max(self._size, doc_id + 1)
+
+    def scores(self, queries: list[str]) -> np.ndarray:
+        """Cosine similarity of each query to every document, shape (q, n)."""
+        q = self.embedder.embed_many(queries)
+        return q @ self._matrix[: self._size].T
+
+    def search(
+        self,
+        queries: list[str],
+        top_k: int = 10,
+        boosts: dict[int, float] | None = None,
+    ) -> list[tuple[int, float]]:
+        """Top-k documents for a batch of queries, max-pooled over the batch."""
+        if not self._size or not queries:
+            return []
+        scores = self.scores(queries).max(axis=0)
+        if boosts:
+            ids = np.fromiter(boosts, dtype=np.int64, count=len(boosts))
+            scores[ids] += np.fromiter(boosts.values(), dtype=np.float32, count=len(ids))
+        return top_k_from(scores, top_k)
+
+
+def top_k_from(scores: np.ndarray, top_k: int) -> list[tuple[int, float]]:
+    """Best ``top_k`` positive (index, score) pairs via ``argpartition``."""
+    k = min(top_k, scores.shape[0])
+    if k <= 0:
+        return []
+    idx = np.argpartition(-scores, k - 1)[:k]
+    idx = idx[np.argsort(-scores[idx])]
+    return [(int(i), float(scores[i])) for i in idx if scores[i] > 0]
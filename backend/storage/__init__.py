@@ -0,0 +1,45 @@
+"""Pluggable storage for meetings and commitments.
+
+``STORAGE_BACKEND=memory`` (default) keeps everything in process-local dicts;
+``STORAGE_BACKEND=sqlite`` persists to ``STORAGE_PATH`` so data survives
+restarts and can be shared between uvicorn workers.
+"""
+
+from backend.config import settings
+from backend.storage.base import CommitmentRepository, MeetingRepository
+from backend.storage.memory import (
+    InMemoryCommitmentRepository,
+    InMemoryMeetingRepository,
+)
+from backend.storage.sqlite import (
+    SQLiteCommitmentRepository,
+    SQLiteDatabase,
+    SQLiteMeetingRepository,
+)
+
+
+def create_repositories(
+    backend: str, path: str = ""
+) -> tuple[MeetingRepository, CommitmentRepository]:
+    if backend == "sqlite":
+        db = SQLiteDatabase(path or "meetingmind.db")
+        return SQLiteMeetingRepository(db), SQLiteCommitmentRepository(db)
+    return InMemoryMeetingRepository(), InMemoryCommitmentRepository()
+
+
+meetings_store, commitments_store = create_repositories(
+    settings.storage_backend, settings.storage_path
+)
+
+__all__ = [
+    "CommitmentRepository",
+    "InMemoryCommitmentRepository",
+    "InMemoryMeetingRepository",
+    "MeetingRepository",
+    "SQLiteCommitmentRepository",
+    "SQLiteDatabase",
+    "SQLiteMeetingRepository",
+    "commitments_store",
+    "create_repositories",
+    "meetings_store",
+]
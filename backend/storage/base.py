@@ -0,0 +1,111 @@
+"""Repository interfaces for meetings and commitments."""
+
+import base64
+import json
+from datetime import datetime, timezone
+from typing import Iterable, NamedTuple, Protocol
+
+from backend.models.schemas import Commitment, CommitmentStatus, Meeting
+
+
+class Page(NamedTuple):
+    items: list
+    next_cursor: str | None
+
+
+class MeetingRepository(Protocol):
+    async def get(self, meeting_id: str) -> Meeting | None: ...
+
+    async def save(self, meeting: Meeting) -> None: ...
+
+    async def delete(self, meeting_id: str) -> None: ...
+
+    async def list(self, participant: str | None = None) -> list[Meeting]:
+        """Meetings, newest ``meeting_date`` first, optionally filtered by a
+        case-insensitive substring of any participant name."""
+        ...
+
+    async def page(
+        self,
+        participant: str | None = None,
+        limit: int | None = None,
+        cursor: str | None = None,
+        descending: bool = True,
+    ) -> Page:
+        """Keyset page of ``list()`` ordered by (meeting_date, id); pass the
+        returned ``next_cursor`` back to continue. Raises ValueError for a
+        malformed cursor."""
+        ...
+
+    async def count(self) -> int: ...
+
+
+class CommitmentRepository(Protocol):
+    async def get(self, commitment_id: str) -> Commitment | None: ...
+
+    async def save(self, commitment: Commitment) -> None: ...
+
+    async def save_many(self, commitments: Iterable[Commitment]) -> None: ...
+
+    async def list_due(self, now: datetime) -> list[Commitment]:
+        """Pending commitments whose due date is at or before ``now``."""
+        ...
+
+    async def list(
+        self,
+        status: CommitmentStatus | None = None,
+        contact: str | None = None,
+    ) -> list[Commitment]:
+        """Commitments ordered by due date (or creation time), optionally
+        filtered by status and a case-insensitive owner/recipient substring."""
+        ...
+
+    async def page(
+        self,
+        status: CommitmentStatus | None = None,
+        contact: str | None = None,
+        limit: int | None = None,
+        cursor: str | None = None,
+        descending: bool = False,
+    ) -> Page:
+        """Keyset page of ``list()`` ordered by (sort_key, id)."""
+        ...
+
+    async def count(self) -> int: ...
+
+
+def due_at(c: Commitment) -> str | None:
+    """UTC due timestamp used for overdue checks and the due_date index."""
+    if c.due_date is None:
+        return None
+    return c.due_date.replace(tzinfo=timezone.utc).isoformat()
+
+
+def sort_key(c: Commitment) -> str:
+    return (c.due_date or c.created_at).isoformat()
+
+
+def utc_iso(dt: datetime) -> str:
+    if dt.tzinfo is None:
+        dt = dt.replace(tzinfo=timezone.utc)
+    return dt.astimezone(timezone.utc).isoformat()
+
+
+def meeting_sort_key(m: Meeting) -> str:
+    return utc_iso(m.meeting_date)
+
+
+def encode_cursor(key: str, record_id: str) -> str:
+    raw = json.dumps([key, record_id], separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[str, str]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        key, record_id = json.loads(raw)
+    except (ValueError, TypeError) as e:
+        raise ValueError("Invalid cursor") from e
+    if not isinstance(key, str) or not isinstance(record_id, str):
+        raise ValueError("Invalid cursor")
+    return key, record_id
@@ -0,0 +1,143 @@
+"""Inverted index from normalized contact name to record IDs.
+
+Matching keeps the routers' original semantics: a query matches a record
+when it is a case-insensitive substring of any of the record's names. The
+index answers that without touching records: a trigram index over the
+*distinct* names narrows the candidates, each candidate name is verified
+with a plain substring test, and the postings of the surviving names are
+merged.
+
+Postings are kept sorted by the repository's list order (sort key, id), so
+``matches`` merges them lazily and a page stops after ``limit + 1`` hits
+instead of collecting and sorting every match.
+"""
+
+import heapq
+from bisect import bisect_left, bisect_right, insort
+from typing import Iterator
+
+MIN_QUERY = 3  # shorter queries have no trigrams to narrow the names
+
+
+def normalize_name(name: str) -> str:
+    return name.lower()
+
+
+def _trigrams(text: str) -> set[str]:
+    return {text[i : i + 3] for i in range(len(text) - 2)}
+
+
+def walk(
+    entries: list[tuple[str, str]],
+    after: tuple[str, str] | None,
+    descending: bool,
+) -> Iterator[tuple[str, str]]:
+    """Entries of an ascending (key, id) list past the ``after`` position."""
+    if descending:
+        end = bisect_left(entries, after) if after else len(entries)
+        return (entries[i] for i in range(end - 1, -1, -1))
+    start = bisect_right(entries, after) if after else 0
+    return (entries[i] for i in range(start, len(entries)))
+
+
+class ContactIndex:
+    def __init__(self):
+        self._postings: dict[str, list[tuple[str, str]]] = {}  # name -> (key, id)
+        self._names: dict[str, set[str]] = {}  # record id -> names
+        self._keys: dict[str, str] = {}  # record id -> sort key
+        self._grams: dict[str, set[str]] = {}  # trigram -> names
+
+    def __len__(self) -> int:
+        return len(self._postings)
+
+    def add(self, record_id: str, names: list[str], key: str = "") -> None:
+        """Index ``record_id`` under ``names`` at sort position ``key``,
+        replacing any previous names and key."""
+        new = {normalize_name(n) for n in names if n}
+        old = self._names.get(record_id, set())
+        if self._keys.get(record_id, key) != key:
+            self.remove(record_id)
+            old = set()
+        for name in old - new:
+            self._unlink(record_id, name)
+        for name in new - old:
+            postings = self._postings.get(name)
+            if postings is None:
+                postings = self._postings[name] = []
+                for gram in _trigrams(name):
+                    self._grams.setdefault(gram, set()).add(name)
+            insort(postings, (key, record_id))
+        if new:
+            self._names[record_id] = new
+            self._keys[record_id] = key
+        else:
+            self._names.pop(record_id, None)
+            self._keys.pop(record_id, None)
+
+    def remove(self, record_id: str) -> None:
+        for name in self._names.pop(record_id, set()):
+            self._unlink(record_id, name)
+        self._keys.pop(record_id, None)
+
+    def exact(self, name: str) -> set[str]:
+        return {i for _, i in self._postings.get(normalize_name(name), ())}
+
+    def lookup(self, query: str) -> set[str]:
+        """IDs of records with a name containing ``query`` (case-insensitive)."""
+        return {
+            i for name in self.matching_names(query) for _, i in self._postings[name]
+        }
+
+    def names(self, record_id: str) -> set[str]:
+        return self._names.get(record_id, set())
+
+    def match_count(self, names: list[str]) -> int:
+        """Upper bound on the records under ``names`` (with duplicates)."""
+        return sum(len(self._postings[name]) for name in names)
+
+    def matches(
+        self,
+        names: list[str],
+        after: tuple[str, str] | None = None,
+        descending: bool = False,
+    ) -> Iterator[tuple[str, str]]:
+        """(key, id) of records under ``names`` in list order, lazily."""
+        merged = heapq.merge(
+            *(walk(self._postings[name], after, descending) for name in names),
+            reverse=descending,
+        )
+        previous = None
+        for entry in merged:
+            if entry != previous:  # a record under two matching names
+                yield entry
+                previous = entry
+
+    def matching_names(self, query: str) -> list[str]:
+        query = query.lower()
+        grams = _trigrams(query)
+        if not grams:
+            # Too short for trigrams: scan the distinct names.
+            candidates = self._postings.keys()
+        else:
+            sets = sorted(
+                (self._grams.get(g, set()) for g in grams), key=len
+            )
+            candidates = set.intersection(*sets) if sets[0] else set()
+        return [name for name in candidates if query in name]
+
+    def _unlink(self, record_id: str, name: str) -> None:
+        postings = self._postings.get(name)
+        if postings is None:
+            return
+        entry = (self._keys[record_id], record_id)
+        i = bisect_left(postings, entry)
+        if i < len(postings) and postings[i] == entry:
+            del postings[i]
+        if not postings:
+            del self._postings[name]
+            for gram in _trigrams(name):
+                names = self._grams.get(gram)
+                if names is not None:
+                    names.discard(name)
+                    if not names:
+                        del self._grams[gram]
@@ -0,0 +1,189 @@
+"""In-memory repositories backed by plain dicts (the original hackathon store).
+
+Besides the dicts, each repository keeps its records pre-sorted by the list
+order, so a page costs O(log N + page size) instead of a full sort. Contact
+filters merge the index's sorted postings, or walk the list order testing
+each record when the query is too short or too broad for postings to help.
+"""
+
+from bisect import bisect_left, insort
+from datetime import datetime
+from itertools import islice
+from typing import Iterable, Iterator
+
+from backend.models.schemas import Commitment, CommitmentStatus, Meeting
+from backend.storage.base import (
+    Page,
+    decode_cursor,
+    due_at,
+    encode_cursor,
+    meeting_sort_key,
+    sort_key,
+)
+from backend.storage.contact_index import MIN_QUERY, ContactIndex, walk
+
+# Merge postings only while they cover less than 1/SCAN_RATIO of the
+# records; past that, walking the list order finds a page sooner.
+SCAN_RATIO = 8
+
+
+class SortedIndex:
+    """Ascending list of (sort key, id) pairs kept in order on every write."""
+
+    def __init__(self):
+        self.entries: list[tuple[str, str]] = []
+        self.keys: dict[str, str] = {}
+
+    def upsert(self, record_id: str, key: str) -> None:
+        old = self.keys.get(record_id)
+        if old == key:
+            return
+        if old is not None:
+            self._discard(old, record_id)
+        insort(self.entries, (key, record_id))
+        self.keys[record_id] = key
+
+    def remove(self, record_id: str) -> None:
+        old = self.keys.pop(record_id, None)
+        if old is not None:
+            self._discard(old, record_id)
+
+    def _discard(self, key: str, record_id: str) -> None:
+        i = bisect_left(self.entries, (key, record_id))
+        if i < len(self.entries) and self.entries[i] == (key, record_id):
+            del self.entries[i]
+
+
+def _take(
+    entries: Iterator[tuple[str, str]], limit: int | None
+) -> tuple[list[str], str | None]:
+    """Cut one keyset page off the front of a lazy (key, id) iterator."""
+    chunk = list(entries if limit is None else islice(entries, limit + 1))
+    more = limit is not None and len(chunk) > limit
+    if more:
+        chunk = chunk[:limit]
+    next_cursor = encode_cursor(*chunk[-1]) if more and chunk else None
+    return [record_id for _, record_id in chunk], next_cursor
+
+
+def _matching(
+    index: SortedIndex,
+    contacts: ContactIndex,
+    query: str,
+    after: tuple[str, str] | None,
+    descending: bool,
+) -> Iterator[tuple[str, str]]:
+    """Entries of ``index`` with a contact name containing ``query``."""
+    names = contacts.matching_names(query)
+    if (
+        len(query) >= MIN_QUERY
+        and contacts.match_count(names) * SCAN_RATIO < len(index.entries)
+    ):
+        entries = contacts.matches(names, after, descending)
+        return (e for e in entries if e[1] in index.keys)
+    matched = set(names)
+    entries = walk(index.entries, after, descending)
+    return (e for e in entries if not matched.isdisjoint(contacts.names(e[1])))
+
+
+class InMemoryMeetingRepository:
+    def __init__(self):
+        self.items: dict[str, Meeting] = {}
+        self.participants = ContactIndex()
+        self.order = SortedIndex()
+
+    async def get(self, meeting_id: str) -> Meeting | None:
+        return self.items.get(meeting_id)
+
+    async def save(self, meeting: Meeting) -> None:
+        self.items[meeting.id] = meeting
+        key = meeting_sort_key(meeting)
+        self.participants.add(meeting.id, meeting.participants, key)
+        self.order.upsert(meeting.id, key)
+
+    async def delete(self, meeting_id: str) -> None:
+        self.items.pop(meeting_id, None)
+        self.participants.remove(meeting_id)
+        self.order.remove(meeting_id)
+
+    async def list(self, participant: str | None = None) -> list[Meeting]:
+        return (await self.page(participant=participant)).items
+
+    async def page(
+        self,
+        participant: str | None = None,
+        limit: int | None = None,
+        cursor: str | None = None,
+        descending: bool = True,
+    ) -> Page:
+        after = decode_cursor(cursor) if cursor else None
+        if participant:
+            entries = _matching(
+                self.order, self.participants, participant, after, descending
+            )
+        else:
+            entries = walk(self.order.entries, after, descending)
+        ids, next_cursor = _take(entries, limit)
+        return Page([self.items[i] for i in ids], next_cursor)
+
+    async def count(self) -> int:
+        return len(self.items)
+
+
+class InMemoryCommitmentRepository:
+    def __init__(self):
+        self.items: dict[str, Commitment] = {}
+        self.contacts = ContactIndex()  # owner + recipient
+        self.order = SortedIndex()
+        self.by_status = {s: SortedIndex() for s in CommitmentStatus}
+
+    async def get(self, commitment_id: str) -> Commitment | None:
+        return self.items.get(commitment_id)
+
+    async def save(self, commitment: Commitment) -> None:
+        self.items[commitment.id] = commitment
+        key = sort_key(commitment)
+        self.contacts.add(commitment.id, [commitment.owner, commitment.recipient], key)
+        self.order.upsert(commitment.id, key)
+        for status, index in self.by_status.items():
+            if status == commitment.status:
+                index.upsert(commitment.id, key)
+            else:
+                index.remove(commitment.id)
+
+    async def save_many(self, commitments: Iterable[Commitment]) -> None:
+        for c in commitments:
+            await self.save(c)
+
+    async def list_due(self, now: datetime) -> list[Commitment]:
+        cutoff = now.isoformat()
+        pending = self.by_status[CommitmentStatus.PENDING].keys
+        due = ((self.items[i], due_at(self.items[i])) for i in pending)
+        return [c for c, at in due if at is not None and at <= cutoff]
+
+    async def list(
+        self,
+        status: CommitmentStatus | None = None,
+        contact: str | None = None,
+    ) -> list[Commitment]:
+        return (await self.page(status=status, contact=contact)).items
+
+    async def page(
+        self,
+        status: CommitmentStatus | None = None,
+        contact: str | None = None,
+        limit: int | None = None,
+        cursor: str | None = None,
+        descending: bool = False,
+    ) -> Page:
+        index = self.by_status[status] if status else self.order
+        after = decode_cursor(cursor) if cursor else None
+        if contact:
+            entries = _matching(index, self.contacts, contact, after, descending)
+        else:
+            entries = walk(index.entries, after, descending)
+        ids, next_cursor = _take(entries, limit)
+        return Page([self.items[i] for i in ids], next_cursor)
+
+    async def count(self) -> int:
+        return len(self.items)
@@ -0,0 +1,432 @@
+"""SQLite repositories (WAL mode) with secondary indexes for common filters.
+
+Each row keeps the full model as JSON plus the indexed columns that the
+list/filter queries need, so reads never deserialize rows they discard.
+Blocking sqlite3 calls run in a worker thread to keep the event loop free.
+
+Contact substring filters resolve the query against the small
+``contact_names`` table, then read one keyset page per matching name off a
+(name, sort key, id) index and merge those, so ORDER BY/LIMIT never sort
+every match. Queries too short for that to narrow anything, or matching
+too many names, walk the list order instead and stop at the page size.
+"""
+
+import asyncio
+import sqlite3
+import threading
+from datetime import datetime
+from typing import Iterable
+
+from backend.models.schemas import Commitment, CommitmentStatus, Meeting
+from backend.storage.base import (
+    Page,
+    decode_cursor,
+    due_at,
+    encode_cursor,
+    meeting_sort_key,
+    sort_key,
+)
+from backend.storage.contact_index import MIN_QUERY
+
+# Past this many matching names, walking the list order beats merging one
+# page per name.
+MAX_MERGED_NAMES = 64
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS meetings (
+    id TEXT PRIMARY KEY,
+    meeting_date TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_meetings_date ON meetings (meeting_date, id);
+
+CREATE TABLE IF NOT EXISTS meeting_participants (
+    meeting_id TEXT NOT NULL,
+    name TEXT NOT NULL,
+    meeting_date TEXT NOT NULL DEFAULT '',
+    PRIMARY KEY (meeting_id, name)
+);
+DROP INDEX IF EXISTS idx_participants_name;
+CREATE INDEX IF NOT EXISTS idx_participants_name_date
+    ON meeting_participants (name, meeting_date, meeting_id);
+
+-- Distinct lowercased participant/owner/recipient names. Substring filters
+-- scan this small table, then join through the name indexes.
+CREATE TABLE IF NOT EXISTS contact_names (name TEXT PRIMARY KEY);
+
+CREATE TABLE IF NOT EXISTS commitments (
+    id TEXT PRIMARY KEY,
+    status TEXT NOT NULL,
+    due_at TEXT,
+    sort_key TEXT NOT NULL,
+    owner TEXT NOT NULL,
+    recipient TEXT NOT NULL,
+    data TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS idx_commitments_status ON commitments (status, sort_key, id);
+CREATE INDEX IF NOT EXISTS idx_commitments_due ON commitments (due_at);
+CREATE INDEX IF NOT EXISTS idx_commitments_sort ON commitments (sort_key, id);
+DROP INDEX IF EXISTS idx_commitments_owner;
+DROP INDEX IF EXISTS idx_commitments_recipient;
+CREATE INDEX IF NOT EXISTS idx_commitments_owner_sort
+    ON commitments (owner, sort_key, id);
+CREATE INDEX IF NOT EXISTS idx_commitments_recipient_sort
+    ON commitments (recipient, sort_key, id);
+"""
+
+
+def _migrate(conn: sqlite3.Connection) -> None:
+    columns = {
+        row[1] for row in conn.execute("PRAGMA table_info(meeting_participants)")
+    }
+    if columns and "meeting_date" not in columns:  # databases from before paging
+        conn.execute(
+            "ALTER TABLE meeting_participants"
+            " ADD COLUMN meeting_date TEXT NOT NULL DEFAULT ''"
+        )
+        conn.execute(
+            "UPDATE meeting_participants SET meeting_date = ("
+            " SELECT meeting_date FROM meetings"
+            " WHERE meetings.id = meeting_participants.meeting_id)"
+        )
+        conn.commit()
+
+
+def _keyset(
+    sql: str,
+    params: list,
+    key_column: str,
+    limit: int | None,
+    cursor: str | None,
+    descending: bool,
+    id_column: str = "id",
+) -> tuple[str, list]:
+    """Extend a ``SELECT id, <key>, data ... WHERE`` query into one keyset page.
+
+    ``sql`` must end with a WHERE clause (use ``WHERE 1`` when unfiltered).
+    One extra row is fetched to tell whether another page follows.
+    """
+    if cursor:
+        op = "<" if descending else ">"
+        sql += f" AND ({key_column}, {id_column}) {op} (?, ?)"
+        params = params + list(decode_cursor(cursor))
+    direction = "DESC" if descending else "ASC"
+    sql += f" ORDER BY {key_column} {direction}, {id_column} {direction}"
+    if limit is not None:
+        sql += " LIMIT ?"
+        params = params + [limit + 1]
+    return sql, params
+
+
+def _contact_names(conn: sqlite3.Connection, query: str) -> list[str] | None:
+    """Known names containing ``query``, or None when the caller should scan."""
+    if len(query) < MIN_QUERY:
+        return None
+    names = [
+        row[0]
+        for row in conn.execute(
+            "SELECT name FROM contact_names WHERE instr(name, ?) > 0", (query,)
+        )
+    ]
+    return names if len(names) <= MAX_MERGED_NAMES else None
+
+
+def _per_name(
+    conn: sqlite3.Connection,
+    parts: list[tuple[str, list]],
+    table: str,
+    key_column: str,
+    id_column: str,
+    limit: int | None,
+    cursor: str | None,
+    descending: bool,
+) -> list:
+    """One keyset page of ``table`` merged from per-name index walks.
+
+    Each part is a ``SELECT <id>, <key> ... WHERE name = ?`` query that reads
+    a (name, key, id) index in order and stops after ``limit + 1`` rows, so
+    the final sort only sees a few rows per name.
+    """
+    if not parts:
+        return []
+    selects, params = [], []
+    for sql, part_params in parts:
+        sql, part_params = _keyset(
+            sql, part_params, key_column, limit, cursor, descending, id_column
+        )
+        selects.append(f"SELECT * FROM ({sql})")
+        params += part_params
+    sql = (
+        f"SELECT t.id, t.{key_column}, t.data"
+        f" FROM ({' UNION '.join(selects)}) AS n"
+        f" CROSS JOIN {table} AS t ON t.id = n.{id_column} WHERE 1"
+    )
+    sql, params = _keyset(
+        sql, params, f"t.{key_column}", limit, None, descending, "t.id"
+    )
+    return conn.execute(sql, params).fetchall()
+
+
+def _page(rows: list, limit: int | None, model) -> Page:
+    more = limit is not None and len(rows) > limit
+    rows = rows[:limit] if more else rows
+    next_cursor = encode_cursor(rows[-1][1], rows[-1][0]) if more else None
+    return Page([model.model_validate_json(r[2]) for r in rows], next_cursor)
+
+
+class SQLiteDatabase:
+    """One shared connection, opened lazily and serialized with a lock."""
+
+    def __init__(self, path: str):
+        self.path = path
+        self._conn: sqlite3.Connection | None = None
+        self._lock = threading.Lock()
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._conn is None:
+            conn = sqlite3.connect(self.path, check_same_thread=False)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            _migrate(conn)
+            conn.executescript(SCHEMA)
+            self._conn = conn
+        return self._conn
+
+    def _run(self, fn):
+        with self._lock:
+            conn = self._connect()
+            try:
+                result = fn(conn)
+                conn.commit()
+                return result
+            except Exception:
+                conn.rollback()
+                raise
+
+    async def run(self, fn):
+        return await asyncio.to_thread(self._run, fn)
+
+    def close(self) -> None:
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+
+class SQLiteMeetingRepository:
+    def __init__(self, db: SQLiteDatabase):
+        self.db = db
+
+    async def get(self, meeting_id: str) -> Meeting | None:
+        row = await self.db.run(
+            lambda conn: conn.execute(
+                "SELECT data FROM meetings WHERE id = ?", (meeting_id,)
+            ).fetchone()
+        )
+        return Meeting.model_validate_json(row[0]) if row else None
+
+    async def save(self, meeting: Meeting) -> None:
+        data = meeting.model_dump_json()
+        names = {p.lower() for p in meeting.participants}
+
+        def write(conn):
+            conn.execute(
+                "INSERT OR REPLACE INTO meetings (id, meeting_date, data)"
+                " VALUES (?, ?, ?)",
+                (meeting.id, meeting_sort_key(meeting), data),
+            )
+            conn.execute(
+                "DELETE FROM meeting_participants WHERE meeting_id = ?", (meeting.id,)
+            )
+            conn.executemany(
+                "INSERT INTO meeting_participants (meeting_id, name, meeting_date)"
+                " VALUES (?, ?, ?)",
+                [(meeting.id, n, meeting_sort_key(meeting)) for n in names],
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO contact_names (name) VALUES (?)",
+                [(n,) for n in names],
+            )
+
+        await self.db.run(write)
+
+    async def delete(self, meeting_id: str) -> None:
+        def remove(conn):
+            conn.execute("DELETE FROM meetings WHERE id = ?", (meeting_id,))
+            conn.execute(
+                "DELETE FROM meeting_participants WHERE meeting_id = ?", (meeting_id,)
+            )
+
+        await self.db.run(remove)
+
+    async def list(self, participant: str | None = None) -> list[Meeting]:
+        return (await self.page(participant=participant)).items
+
+    async def page(
+        self,
+        participant: str | None = None,
+        limit: int | None = None,
+        cursor: str | None = None,
+        descending: bool = True,
+    ) -> Page:
+        participant = participant.lower() if participant else None
+
+        def query(conn):
+            names = _contact_names(conn, participant) if participant else None
+            if names is not None:
+                parts = [
+                    (
+                        "SELECT meeting_id, meeting_date FROM meeting_participants"
+                        " WHERE name = ?",
+                        [name],
+                    )
+                    for name in names
+                ]
+                return _per_name(
+                    conn,
+                    parts,
+                    "meetings",
+                    "meeting_date",
+                    "meeting_id",
+                    limit,
+                    cursor,
+                    descending,
+                )
+            sql = "SELECT id, meeting_date, data FROM meetings WHERE 1"
+            params: list = []
+            if participant:
+                sql += (
+                    " AND EXISTS (SELECT 1 FROM meeting_participants p"
+                    " WHERE p.meeting_id = meetings.id AND instr(p.name, ?) > 0)"
+                )
+                params.append(participant)
+            sql, params = _keyset(
+                sql, params, "meeting_date", limit, cursor, descending
+            )
+            return conn.execute(sql, params).fetchall()
+
+        rows = await self.db.run(query)
+        return _page(rows, limit, Meeting)
+
+    async def count(self) -> int:
+        row = await self.db.run(
+            lambda conn: conn.execute("SELECT COUNT(*) FROM meetings").fetchone()
+        )
+        return row[0]
+
+
+class SQLiteCommitmentRepository:
+    def __init__(self, db: SQLiteDatabase):
+        self.db = db
+
+    async def get(self, commitment_id: str) -> Commitment | None:
+        row = await self.db.run(
+            lambda conn: conn.execute(
+                "SELECT data FROM commitments WHERE id = ?", (commitment_id,)
+            ).fetchone()
+        )
+        return Commitment.model_validate_json(row[0]) if row else None
+
+    async def save(self, commitment: Commitment) -> None:
+        await self.save_many([commitment])
+
+    async def save_many(self, commitments: Iterable[Commitment]) -> None:
+        rows = [
+            (
+                c.id,
+                c.status.value,
+                due_at(c),
+                sort_key(c),
+                c.owner.lower(),
+                c.recipient.lower(),
+                c.model_dump_json(),
+            )
+            for c in commitments
+        ]
+        names = {(r[4],) for r in rows} | {(r[5],) for r in rows}
+
+        def write(conn):
+            conn.executemany(
+                "INSERT OR REPLACE INTO commitments"
+                " (id, status, due_at, sort_key, owner, recipient, data)"
+                " VALUES (?, ?, ?, ?, ?, ?, ?)",
+                rows,
+            )
+            conn.executemany(
+                "INSERT OR IGNORE INTO contact_names (name) VALUES (?)", names
+            )
+
+        await self.db.run(write)
+
+    async def list_due(self, now: datetime) -> list[Commitment]:
+        # The unary + keeps the planner on idx_commitments_due (past-due rows
+        # only) instead of walking every pending commitment.
+        rows = await self.db.run(
+            lambda conn: conn.execute(
+                "SELECT data FROM commitments WHERE due_at <= ? AND +status = ?",
+                (now.isoformat(), CommitmentStatus.PENDING.value),
+            ).fetchall()
+        )
+        return [Commitment.model_validate_json(r[0]) for r in rows]
+
+    async def list(
+        self,
+        status: CommitmentStatus | None = None,
+        contact: str | None = None,
+    ) -> list[Commitment]:
+        return (await self.page(status=status, contact=contact)).items
+
+    async def page(
+        self,
+        status: CommitmentStatus | None = None,
+        contact: str | None = None,
+        limit: int | None = None,
+        cursor: str | None = None,
+        descending: bool = False,
+    ) -> Page:
+        contact = contact.lower() if contact else None
+
+        def query(conn):
+            names = _contact_names(conn, contact) if contact else None
+            if names is not None:
+                # The unary + keeps the planner on the name index.
+                status_sql = " AND +status = ?" if status else ""
+                status_params = [status.value] if status else []
+                parts = [
+                    (
+                        f"SELECT id, sort_key FROM commitments WHERE {column} = ?"
+                        + status_sql,
+                        [name] + status_params,
+                    )
+                    for name in names
+                    for column in ("owner", "recipient")
+                ]
+                return _per_name(
+                    conn,
+                    parts,
+                    "commitments",
+                    "sort_key",
+                    "id",
+                    limit,
+                    cursor,
+                    descending,
+                )
+            sql = "SELECT id, sort_key, data FROM commitments WHERE 1"
+            params: list = []
+            if status:
+                sql += " AND status = ?"
+                params.append(status.value)
+            if contact:
+                sql += " AND (instr(owner, ?) > 0 OR instr(recipient, ?) > 0)"
+                params += [contact, contact]
+            sql, params = _keyset(sql, params, "sort_key", limit, cursor, descending)
+            return conn.execute(sql, params).fetchall()
+
+        rows = await self.db.run(query)
+        return _page(rows, limit, Commitment)
+
+    async def count(self) -> int:
+        row = await self.db.run(
+            lambda conn: conn.execute("SELECT COUNT(*) FROM commitments").fetchone()
+        )
+        return row[0]
@@ -17,6 +17,7 @@ export default function BriefingPage() {
   const [content, setContent] = useState("");
   const [streaming, setStreaming] = useState(true);
   const [error, setError] = useState("");
+  const [stage, setStage] = useState("retrieving");
   const contentRef = useRef<HTMLDivElement>(null);
 
   useEffect(() => {
@@ -25,6 +26,7 @@ export default function BriefingPage() {
     setContent("");
     setStreaming(true);
     setError("");
+    setStage("retrieving");
 
     const cleanup = streamBriefing(
       contactName,
@@ -37,7 +39,8 @@ export default function BriefingPage() {
       (err) => {
         setError(err.message);
         setStreaming(false);
-      }
+      },
+      setStage
     );
 
     return cleanup;
@@ -112,7 +115,9 @@ export default function BriefingPage() {
             ) : streaming ? (
               <div className="flex items-center gap-2 text-sm text-muted-foreground">
                 <Loader2 className="h-4 w-4 animate-spin" />
-                Retrieving memories and preparing briefing...
+                {stage === "generating"
+                  ? "Preparing briefing..."
+                  : "Retrieving memories..."}
               </div>
             ) : (
               <p className="text-sm text-muted-foreground">
@@ -1,6 +1,6 @@
 "use client";
 
-import { useState } from "react";
+import { useEffect, useRef, useState } from "react";
 import { motion } from "framer-motion";
 import {
   Search as SearchIcon,
@@ -18,7 +18,7 @@ import { Card, CardContent } from "@/components/ui/card";
 import { Button } from "@/components/ui/button";
 import { Input } from "@/components/ui/input";
 import { Badge } from "@/components/ui/badge";
-import { searchMemories } from "@/lib/api";
+import { streamSearch } from "@/lib/api";
 import type { SearchResult, RetrieveMethod } from "@/lib/api";
 
 const RETRIEVE_METHODS: {
@@ -29,6 +29,7 @@ const RETRIEVE_METHODS: {
 }[] = [
   { value: "keyword", label: "Quick", desc: "<100ms", icon: Zap },
   { value: "hybrid", label: "Smart", desc: "~300ms", icon: Sparkles },
+  { value: "fusion", label: "Fused", desc: "~300ms", icon: Activity },
   { value: "agentic", label: "Deep", desc: "2-5s", icon: Layers },
 ];
 
@@ -83,27 +84,31 @@ export default function SearchPage() {
   const [searched, setSearched] = useState(false);
   const [error, setError] = useState("");
 
-  async function handleSearch(e: React.FormEvent) {
+  const closeStream = useRef<(() => void) | null>(null);
+
+  useEffect(() => () => closeStream.current?.(), []);
+
+  function handleSearch(e: React.FormEvent) {
     e.preventDefault();
     if (!query.trim()) return;
 
+    closeStream.current?.();
     setSearching(true);
     setError("");
     setSearched(true);
+    setResults([]);
 
-    try {
-      const data = await searchMemories(
-        query.trim(),
-        contact.trim() || undefined,
-        { retrieve_method: retrieveMethod },
-      );
-      setResults(data);
-    } catch {
-      setError("Search failed. Is the backend running?");
-      setResults([]);
-    } finally {
-      setSearching(false);
-    }
+    closeStream.current = streamSearch(
+      query.trim(),
+      contact.trim() || undefined,
+      retrieveMethod,
+      (batch) => setResults((prev) => [...prev, ...batch]),
+      () => setSearching(false),
+      () => {
+        setError("Search failed. Is the backend running?");
+        setSearching(false);
+      }
+    );
   }
 
   return (
@@ -23,14 +23,23 @@ export interface MeetingInput {
   notes: string;
 }
 
+export interface StageReport {
+  status: "pending" | "running" | "completed" | "failed";
+  duration_ms: number | null;
+  error: string | null;
+  attempts: number;
+}
+
 export interface Meeting {
   id: string;
   title: string;
   participants: string[];
   meeting_date: string;
-  notes: string;
+  notes?: string; // omitted from list views
   summary: string | null;
   status: "processing" | "completed" | "failed";
+  storage_errors: string[];
+  stages: Record<string, StageReport>;
   created_at: string;
 }
 
@@ -41,8 +50,12 @@ export async function submitMeeting(data: MeetingInput) {
   });
 }
 
+// List views skip the (up to 50KB) notes field
+const MEETING_LIST_FIELDS =
+  "id,title,participants,meeting_date,summary,status,storage_errors,stages,created_at";
+
 export async function getMeetings() {
-  return request<Meeting[]>("/api/meetings");
+  return request<Meeting[]>(`/api/meetings?fields=${MEETING_LIST_FIELDS}`);
 }
 
 export async function getMeeting(id: string) {
@@ -50,7 +63,9 @@ export async function getMeeting(id: string) {
 }
 
 export async function getMeetingsByParticipant(participant: string) {
-  return request<Meeting[]>(`/api/meetings?participant=${encodeURIComponent(participant)}`);
+  return request<Meeting[]>(
+    `/api/meetings?participant=${encodeURIComponent(participant)}&fields=${MEETING_LIST_FIELDS}`
+  );
 }
 
 // --- Commitments ---
@@ -90,7 +105,8 @@ export function streamBriefing(
   contactName: string,
   onToken: (token: string) => void,
   onDone: () => void,
-  onError: (err: Error) => void
+  onError: (err: Error) => void,
+  onStatus?: (stage: string) => void
 ) {
   const url = `${API_BASE}/api/briefings/${encodeURIComponent(contactName)}`;
   const eventSource = new EventSource(url);
@@ -100,6 +116,8 @@ export function streamBriefing(
       const data = JSON.parse(event.data);
       if (data.type === "token") {
         onToken(data.content);
+      } else if (data.type === "status") {
+        onStatus?.(data.stage);
       } else if (data.type === "done") {
         onDone();
         eventSource.close();
@@ -127,9 +145,15 @@ export interface SearchResult {
   participants: string[];
   memory_type: string;
   relevance_score: number | null;
+  meeting_id: string | null;
 }
 
-export type RetrieveMethod = "keyword" | "vector" | "hybrid" | "agentic";
+export type RetrieveMethod =
+  | "keyword"
+  | "vector"
+  | "hybrid"
+  | "agentic"
+  | "fusion";
 
 export async function getContactProfiles(contactName: string) {
   return request<SearchResult[]>(`/api/search/profiles/${encodeURIComponent(contactName)}`);
@@ -149,3 +173,40 @@ export async function searchMemories(
   if (options?.memory_types?.length) params.set("memory_types", options.memory_types.join(","));
   return request<SearchResult[]>(`/api/search?${params.toString()}`);
 }
+
+// Progressive search (SSE): quick keyword hits first, deeper results as
+// slower methods return. Each batch only contains results not yet sent.
+export function streamSearch(
+  query: string,
+  contact: string | undefined,
+  retrieveMethod: RetrieveMethod,
+  onResults: (results: SearchResult[], method: string) => void,
+  onDone: () => void,
+  onError: (err: Error) => void
+) {
+  const params = new URLSearchParams({ query, retrieve_method: retrieveMethod });
+  if (contact) params.set("contact", contact);
+  const eventSource = new EventSource(`${API_BASE}/api/search/stream?${params}`);
+
+  eventSource.onmessage = (event) => {
+    try {
+      const data = JSON.parse(event.data);
+      if (data.type === "results") {
+        onResults(data.results, data.method);
+      } else if (data.type === "done") {
+        onDone();
+        eventSource.close();
+      }
+    } catch {
+      onError(new Error("Failed to parse SSE data"));
+      eventSource.close();
+    }
+  };
+
+  eventSource.onerror = () => {
+    onError(new Error("SSE connection failed"));
+    eventSource.close();
+  };
+
+  return () => eventSource.close();
+}
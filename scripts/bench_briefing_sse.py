@@ -0,0 +1,104 @@
+"""Benchmark: N concurrent SSE briefing clients, per-delta vs coalesced events.
+
+Serves the backend app (mock EverOS and mock LLM stream) with uvicorn on a
+background thread and opens N concurrent briefing streams for each coalesce
+setting. Reports SSE events per briefing, process CPU time (server and
+clients share the process) and time to first token.
+
+    python scripts/bench_briefing_sse.py [--clients 50] [--windows 0,40]
+"""
+
+import argparse
+import asyncio
+import socket
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+
+import httpx
+import uvicorn
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from backend.config import settings  # noqa: E402
+
+settings.job_journal_path = ""
+settings.briefing_cache_enabled = False  # measure generation, not replay
+settings.briefing_prewarm_interval = 0
+
+from backend.main import app  # noqa: E402
+
+
+class AppServer:
+    def __init__(self):
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            self.port = sock.getsockname()[1]
+        self.base_url = f"http://127.0.0.1:{self.port}"
+        self._server = uvicorn.Server(
+            uvicorn.Config(app, host="127.0.0.1", port=self.port, log_level="warning")
+        )
+        self._thread = threading.Thread(target=self._server.run, daemon=True)
+
+    def __enter__(self) -> "AppServer":
+        self._thread.start()
+        while not self._server.started:
+            time.sleep(0.01)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._server.should_exit = True
+        self._thread.join(timeout=10)
+
+
+async def _client(
+    http: httpx.AsyncClient, i: int, window: float
+) -> tuple[int, float]:
+    events, ttft = 0, None
+    start = time.perf_counter()
+    async with http.stream(
+        "GET", f"/api/briefings/Contact {i}", params={"coalesce_ms": window}
+    ) as resp:
+        async for line in resp.aiter_lines():
+            if not line.startswith("data:"):
+                continue
+            events += 1
+            if ttft is None and '"token"' in line:
+                ttft = (time.perf_counter() - start) * 1000
+    return events, ttft or 0.0
+
+
+async def _run(base_url: str, clients: int, window: float) -> None:
+    limits = httpx.Limits(max_connections=clients)
+    async with httpx.AsyncClient(
+        base_url=base_url, limits=limits, timeout=120.0
+    ) as http:
+        cpu, wall = time.process_time(), time.perf_counter()
+        results = await asyncio.gather(
+            *(_client(http, i, window) for i in range(clients))
+        )
+        cpu, wall = time.process_time() - cpu, time.perf_counter() - wall
+
+    events = [e for e, _ in results]
+    ttfts = [t for _, t in results]
+    print(
+        f"coalesce_ms={window:<5g} events/briefing={statistics.mean(events):7.1f}  "
+        f"cpu={cpu:6.2f}s  cpu/briefing={cpu / clients * 1000:7.1f}ms  "
+        f"ttft p50={statistics.median(ttfts):6.1f}ms  wall={wall:5.1f}s"
+    )
+
+
+def main(clients: int, windows: list[float]) -> None:
+    with AppServer() as server:
+        for window in windows:
+            asyncio.run(_run(server.base_url, clients, window))
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clients", type=int, default=50)
+    parser.add_argument("--windows", default="0,40")
+    args = parser.parse_args()
+    main(args.clients, [float(w) for w in args.windows.split(",")])
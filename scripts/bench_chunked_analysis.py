@@ -0,0 +1,124 @@
+"""Benchmark: commitment extraction and summary for long notes, one prompt
+vs chunked map-reduce.
+
+Replaces the OpenAI client with a simulated model whose latency grows with
+prompt length and, mostly, with output length (decode time), and which
+stops at ``max_tokens`` like the real API. Requests still go through the
+LLM scheduler and the outbound governor. Synthetic notes contain a known
+number of commitments, so truncated output shows up as missed ones.
+
+    python scripts/bench_chunked_analysis.py [--chars 50000]
+"""
+
+import argparse
+import asyncio
+import json
+import re
+import sys
+import time
+from pathlib import Path
+from types import SimpleNamespace
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from backend.config import settings  # noqa: E402
+
+settings.openai_api_key = "sk-bench"
+settings.llm_cache_enabled = False
+
+from backend.services import llm_client  # noqa: E402
+from backend.services.context_builder import estimate_tokens  # noqa: E402
+
+PARTICIPANTS = ["Alice", "Bob", "Carol", "Dan"]
+COMMITMENT_RE = re.compile(r"^(\w+): I will deliver (item \d+) by March (\d+)\.", re.M)
+
+
+class SimulatedCompletions:
+    def __init__(self, prefill_ms: float, decode_ms: float):
+        self.prefill_ms = prefill_ms  # per prompt token
+        self.decode_ms = decode_ms  # per output token
+
+    async def create(self, model, messages, temperature, max_tokens, **kwargs):
+        prompt = messages[0]["content"]
+        if "Extract commitments" in prompt:
+            meeting = prompt.split("<meeting>", 1)[1]
+            text = json.dumps(
+                [
+                    {
+                        "description": f"Deliver {item}",
+                        "owner": owner,
+                        "recipient": "Team",
+                        "due_date": f"2026-03-{int(day):02d}",
+                        "direction": "owed_to_me",
+                    }
+                    for owner, item, day in COMMITMENT_RE.findall(meeting)
+                ]
+            )
+        else:
+            text = "The team reviewed deliverables and agreed on March deadlines. " * 3
+        output = estimate_tokens(text)
+        if output > max_tokens:  # cut off mid-answer, like finish_reason=length
+            text = text[: len(text) * max_tokens // output]
+            output = max_tokens
+        prompt_tokens = estimate_tokens(prompt)
+        await asyncio.sleep(
+            (prompt_tokens * self.prefill_ms + output * self.decode_ms) / 1000
+        )
+        return SimpleNamespace(
+            choices=[SimpleNamespace(message=SimpleNamespace(content=text))],
+            usage=SimpleNamespace(total_tokens=prompt_tokens + output),
+        )
+
+
+def _notes(chars: int) -> tuple[str, int]:
+    lines, count = [], 0
+    filler = (
+        "We went through the quarterly numbers, the hiring plan and the "
+        "open questions from the last review in some detail."
+    )
+    while sum(len(line) + 1 for line in lines) < chars:
+        speaker = PARTICIPANTS[len(lines) % len(PARTICIPANTS)]
+        if len(lines) % 5 == 0:
+            count += 1
+            lines.append(
+                f"{speaker}: I will deliver item {count} by March {count % 28 + 1}."
+            )
+        else:
+            lines.append(f"{speaker}: {filler}")
+    return "\n".join(lines), count
+
+
+async def _run(label: str, chunk_tokens: int, notes: str, expected: int) -> None:
+    settings.llm_chunk_tokens = chunk_tokens
+    start = time.perf_counter()
+    summary, commitments = await asyncio.gather(
+        llm_client.summarize_meeting(notes, PARTICIPANTS),
+        llm_client.extract_commitments(notes, PARTICIPANTS),
+    )
+    elapsed = time.perf_counter() - start
+    print(
+        f"{label:<18} {elapsed:6.2f}s  commitments={len(commitments)}/{expected}  "
+        f"summary={len(summary)} chars"
+    )
+
+
+async def main(chars: int, prefill_ms: float, decode_ms: float) -> None:
+    completions = SimulatedCompletions(prefill_ms, decode_ms)
+    llm_client._client = SimpleNamespace(chat=SimpleNamespace(completions=completions))
+    notes, expected = _notes(chars)
+    print(
+        f"{len(notes)} chars (~{estimate_tokens(notes)} tokens), "
+        f"{expected} commitments"
+    )
+    await _run("single prompt", 10**9, notes, expected)
+    for chunk_tokens in (3000, 1500):
+        await _run(f"chunks of {chunk_tokens}", chunk_tokens, notes, expected)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--chars", type=int, default=50000)
+    parser.add_argument("--prefill-ms", type=float, default=0.05)
+    parser.add_argument("--decode-ms", type=float, default=10.0)
+    args = parser.parse_args()
+    asyncio.run(main(args.chars, args.prefill_ms, args.decode_ms))
@@ -0,0 +1,117 @@
+"""Benchmark: participant filtering at 50k meetings, linear scan vs indexes.
+
+The "scan" column is the original list_meetings filter (substring test over
+every participant of every meeting). "list" fetches every match, "page" the
+first PAGE rows. Results from each store are checked against the scan so the
+index keeps the same matching semantics and order. Pages cost O(page) in
+both stores; the SQLite "list" column for broad queries is mostly JSON
+decoding of the thousands of rows it returns.
+
+    python scripts/bench_contact_index.py [--meetings 50000]
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from backend.models.schemas import Meeting, MeetingStatus  # noqa: E402
+from backend.storage import create_repositories  # noqa: E402
+
+FIRST = ["Alice", "Bob", "Charlie", "Diana", "Eve", "Frank", "Grace", "Heidi"]
+LAST = [f"Surname{i:03d}" for i in range(400)]
+QUERIES = ["Alice Surname007", "surname12", "ali", "e s", "nobody"]
+PAGE = 20
+
+
+def _make_meetings(n: int) -> list[Meeting]:
+    rng = random.Random(7)
+    base = datetime(2025, 1, 1, tzinfo=timezone.utc)
+    return [
+        Meeting(
+            id=str(uuid.uuid4()),
+            title=f"Meeting {i}",
+            participants=[
+                f"{rng.choice(FIRST)} {rng.choice(LAST)}"
+                for _ in range(rng.randint(2, 6))
+            ],
+            meeting_date=base + timedelta(minutes=rng.randint(0, 1_000_000)),
+            notes="",
+            status=MeetingStatus.COMPLETED,
+            created_at=base,
+        )
+        for i in range(n)
+    ]
+
+
+def _scan(meetings: list[Meeting], participant: str) -> list[Meeting]:
+    p_lower = participant.lower()
+    results = [
+        m for m in meetings if any(p_lower in p.lower() for p in m.participants)
+    ]
+    return sorted(results, key=lambda m: m.meeting_date, reverse=True)
+
+
+async def _median_ms(fn, repeat: int) -> tuple[float, list]:
+    samples, result = [], []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = await fn()
+        samples.append((time.perf_counter() - start) * 1000)
+    return statistics.median(samples), result
+
+
+async def main(n: int, repeat: int) -> None:
+    meetings = _make_meetings(n)
+    memory, _ = create_repositories("memory")
+    sqlite, _ = create_repositories(
+        "sqlite", os.path.join(tempfile.mkdtemp(), "bench.db")
+    )
+    for m in meetings:
+        await memory.save(m)
+    for m in meetings:
+        await sqlite.save(m)
+
+    async def scan(q):
+        return _scan(meetings, q)
+
+    print(f"{n} meetings, median of {repeat} runs")
+    print(
+        f"{'query':<18} {'rows':>6} {'scan':>9} {'memory list':>12} "
+        f"{'memory page':>12} {'sqlite list':>12} {'sqlite page':>12}"
+    )
+    for q in QUERIES:
+        scan_ms, expected = await _median_ms(lambda: scan(q), repeat)
+        want = [m.id for m in expected]
+        timings = []
+        for name, repo in (("memory", memory), ("sqlite", sqlite)):
+            ms, rows = await _median_ms(lambda: repo.list(participant=q), repeat)
+            assert {m.id for m in rows} == set(want), f"{name} mismatch for {q!r}"
+            timings.append(ms)
+            ms, page = await _median_ms(
+                lambda: repo.page(participant=q, limit=PAGE), repeat
+            )
+            got = [m.id for m in page.items]
+            assert set(got) == set(want[:PAGE]), f"{name} page mismatch for {q!r}"
+            timings.append(ms)
+        print(
+            f"{q!r:<18} {len(expected):>6} {scan_ms:>7.2f}ms "
+            + " ".join(f"{ms:>10.2f}ms" for ms in timings)
+        )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--meetings", type=int, default=50_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.meetings, args.repeat))
@@ -0,0 +1,109 @@
+"""Benchmark: EverOS calls against a flaky and a failing upstream, with and
+without the outbound call governor.
+
+Runs concurrent searches against the local EverOS stand-in, first with a
+fraction of requests answered 503, then during a full outage with slow
+failures. "bare" is a pass-through governor (no retries, no breaker, no
+rate limit); "governed" uses the Settings defaults. Times are summed over
+calls: throttled and backoff are what the governor added, saved is the
+estimated failing time avoided by rejecting calls while the circuit was open.
+
+    python scripts/bench_everos_governor.py [--calls 400] [--fail-rate 0.2]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from backend.config import settings  # noqa: E402
+from backend.services.everos_client import CloudClient  # noqa: E402
+from backend.services.governor import Governor  # noqa: E402
+from scripts.everos_standin import StandInServer  # noqa: E402
+
+
+def _governor(governed: bool) -> Governor:
+    if not governed:
+        return Governor("bare", max_retries=0, failure_threshold=10**9)
+    return Governor(
+        "governed",
+        rate=settings.everos_rate_limit,
+        burst=settings.everos_rate_burst,
+        deadline=settings.everos_call_deadline,
+        max_retries=settings.upstream_max_retries,
+        retry_base=settings.upstream_retry_base,
+        retry_max=settings.upstream_retry_max,
+        failure_threshold=settings.upstream_breaker_threshold,
+        reset_timeout=settings.upstream_breaker_reset,
+    )
+
+
+async def _run(label: str, governed: bool, calls: int, concurrency: int) -> None:
+    client = CloudClient()
+    client.governor = _governor(governed)
+    await client.open()
+    sem = asyncio.Semaphore(concurrency)
+    latencies, errors = [], 0
+
+    async def one(i: int) -> None:
+        nonlocal errors
+        async with sem:
+            start = time.perf_counter()
+            try:
+                await client.search(query=f"roadmap {i}", user_id="alice")
+            except Exception:
+                errors += 1
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    wall = time.perf_counter()
+    try:
+        await asyncio.gather(*(one(i) for i in range(calls)))
+    finally:
+        await client.aclose()
+    wall = time.perf_counter() - wall
+    latencies.sort()
+    stats = client.governor.stats()
+    print(
+        f"  {label:<9} ok={calls - errors:4d}/{calls}  "
+        f"p50={statistics.median(latencies):7.1f}ms  "
+        f"p95={latencies[int(len(latencies) * 0.95)]:7.1f}ms  wall={wall:5.2f}s  "
+        f"retries={stats['retries']} short_circuited={stats['short_circuited']}  "
+        f"throttled={stats['throttled_ms'] / 1000:.1f}s "
+        f"backoff={stats['backoff_ms'] / 1000:.1f}s "
+        f"saved={stats['saved_ms'] / 1000:.1f}s"
+    )
+
+
+async def main(calls: int, concurrency: int, fail_rate: float, latency: float):
+    with StandInServer(latency=latency) as server:
+        settings.everos_base_url = server.base_url
+        settings.everos_api_key = "bench"
+
+        server.app.state.fail_rate = fail_rate
+        print(
+            f"flaky: {fail_rate:.0%} of requests fail, "
+            f"latency={latency * 1000:.0f}ms"
+        )
+        for label, governed in (("bare", False), ("governed", True)):
+            await _run(label, governed, calls, concurrency)
+
+        server.app.state.fail_rate = 1.0
+        server.app.state.latency = 0.5
+        outage_calls = calls // 4
+        print("outage: every request fails after 500ms")
+        for label, governed in (("bare", False), ("governed", True)):
+            await _run(label, governed, outage_calls, concurrency)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--calls", type=int, default=400)
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--fail-rate", type=float, default=0.2)
+    parser.add_argument("--latency", type=float, default=0.02, help="seconds")
+    args = parser.parse_args()
+    asyncio.run(main(args.calls, args.concurrency, args.fail_rate, args.latency))
@@ -0,0 +1,89 @@
+"""Benchmark: EverOS message ingestion, one request per message vs batched.
+
+Stores messages from many concurrently processed meetings against a local
+EverOS stand-in and reports messages/sec and HTTP requests sent, with
+BatchingIngestClient off and on.
+
+    python scripts/bench_everos_ingest.py [--meetings 200] [--participants 4]
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from backend.config import settings  # noqa: E402
+from backend.services.everos_client import CloudClient  # noqa: E402
+from backend.services.ingest_batcher import BatchingIngestClient  # noqa: E402
+from scripts.everos_standin import StandInServer  # noqa: E402
+
+
+async def _ingest(client, meetings: int, participants: int, concurrency: int) -> None:
+    # Same shape as process_meeting: each meeting stores one message per
+    # participant, with a bounded number of meetings in flight.
+    sem = asyncio.Semaphore(concurrency)
+
+    async def meeting(m: int) -> None:
+        async with sem:
+            await asyncio.gather(
+                *(
+                    client.store_message(
+                        message_id=f"m{m}_{p}",
+                        timestamp="2026-02-01T10:00:00Z",
+                        sender_id=f"person_{p}",
+                        content=f"Notes for meeting {m}: roadmap, budget, hiring",
+                        meeting_id=f"m{m}",
+                        meeting_name=f"Meeting {m}",
+                        sender_name=f"Person {p}",
+                    )
+                    for p in range(participants)
+                )
+            )
+
+    await asyncio.gather(*(meeting(m) for m in range(meetings)))
+
+
+async def main(meetings: int, participants: int, concurrency: int, latency: float):
+    with StandInServer(latency=latency) as server:
+        settings.everos_base_url = server.base_url
+        settings.everos_api_key = "bench"
+        total = meetings * participants
+        print(
+            f"{total} messages ({meetings} meetings x {participants}), "
+            f"{concurrency} meetings in flight, server latency={latency * 1000:.0f}ms"
+        )
+        for label, batched in (("unbatched", False), ("batched", True)):
+            client = CloudClient()
+            if batched:
+                client = BatchingIngestClient(
+                    client,
+                    max_batch=settings.everos_batch_max_size,
+                    max_delay=settings.everos_batch_max_delay,
+                )
+            await client.open()
+            requests = server.app.state.requests
+            start = time.perf_counter()
+            try:
+                await _ingest(client, meetings, participants, concurrency)
+            finally:
+                await client.aclose()
+            elapsed = time.perf_counter() - start
+            print(
+                f"{label:<10} {total / elapsed:8.1f} msg/s  "
+                f"requests={server.app.state.requests - requests}"
+            )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--meetings", type=int, default=200)
+    parser.add_argument("--participants", type=int, default=4)
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--latency", type=float, default=0.02, help="seconds")
+    args = parser.parse_args()
+    asyncio.run(
+        main(args.meetings, args.participants, args.concurrency, args.latency)
+    )
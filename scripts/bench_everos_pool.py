@@ -0,0 +1,94 @@
+"""Benchmark: per-request httpx clients vs the pooled CloudClient transport.
+
+Runs concurrent searches against a local EverOS stand-in and prints p50/p99
+latency for both strategies.
+
+    python scripts/bench_everos_pool.py [--requests 500] [--concurrency 50]
+"""
+
+import argparse
+import asyncio
+import statistics
+import sys
+import time
+from pathlib import Path
+
+import httpx
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from backend.config import settings  # noqa: E402
+from backend.services.everos_client import CloudClient  # noqa: E402
+from scripts.everos_standin import StandInServer  # noqa: E402
+
+PAYLOAD = {"query": "roadmap search", "top_k": 10, "retrieve_method": "keyword"}
+
+
+async def _unpooled_search(base_url: str) -> None:
+    # The pre-pooling behaviour: a fresh client (and connection) per call.
+    async with httpx.AsyncClient() as client:
+        resp = await client.request(
+            "GET", f"{base_url}/api/v0/memories/search", json=PAYLOAD, timeout=30.0
+        )
+        resp.raise_for_status()
+
+
+async def _run(label: str, call, total: int, concurrency: int) -> None:
+    sem = asyncio.Semaphore(concurrency)
+    latencies: list[float] = []
+
+    async def one():
+        async with sem:
+            start = time.perf_counter()
+            await call()
+            latencies.append((time.perf_counter() - start) * 1000)
+
+    wall = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(total)))
+    wall = time.perf_counter() - wall
+
+    latencies.sort()
+    p50 = statistics.median(latencies)
+    p99 = latencies[min(len(latencies) - 1, int(len(latencies) * 0.99))]
+    print(
+        f"{label:<10} p50={p50:7.2f}ms  p99={p99:7.2f}ms  "
+        f"throughput={total / wall:8.1f} req/s"
+    )
+
+
+async def main(total: int, concurrency: int, latency: float) -> None:
+    with StandInServer(latency=latency) as server:
+        settings.everos_base_url = server.base_url
+        settings.everos_api_key = "bench"
+        print(f"{total} searches, concurrency={concurrency}, server latency={latency * 1000:.0f}ms")
+
+        # Warm up the server's event loop before measuring.
+        await _run("warmup", lambda: _unpooled_search(server.base_url), 20, 5)
+
+        await _run(
+            "unpooled",
+            lambda: _unpooled_search(server.base_url),
+            total,
+            concurrency,
+        )
+
+        client = CloudClient()
+        await client.open()
+        try:
+            await _run(
+                "pooled",
+                lambda: client.search(query=PAYLOAD["query"], retrieve_method="keyword"),
+                total,
+                concurrency,
+            )
+        finally:
+            await client.aclose()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--concurrency", type=int, default=50)
+    parser.add_argument("--latency", type=float, default=0.005, help="seconds")
+    args = parser.parse_args()
+    asyncio.run(main(args.requests, args.concurrency, args.latency))
@@ -0,0 +1,124 @@
+"""Benchmark: live briefing latency during a bulk import, with and without
+the LLM scheduler's priority lanes.
+
+Simulates one model whose latency grows with the number of requests in
+flight (as a shared quota does under load): a bulk import submits many
+batch analyses at once while interactive briefings arrive at a steady
+rate. Reports interactive time to first token and how long the batch
+work took to drain.
+
+    python scripts/bench_llm_scheduler.py [--batch 60] [--interactive 20]
+"""
+
+import argparse
+import asyncio
+import contextlib
+import statistics
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from backend.services.llm_scheduler import (  # noqa: E402
+    BATCH,
+    INTERACTIVE,
+    ModelScheduler,
+)
+
+
+class SimulatedModel:
+    """Time to first token and generation time scale with load."""
+
+    def __init__(self, ttft: float, duration: float, knee: int):
+        self.ttft = ttft
+        self.duration = duration
+        self.knee = knee  # requests in flight before latency starts climbing
+        self.in_flight = 0
+
+    def _slowdown(self) -> float:
+        return max(1.0, self.in_flight / self.knee)
+
+    async def stream(self, on_first_token) -> None:
+        self.in_flight += 1
+        try:
+            await asyncio.sleep(self.ttft * self._slowdown())
+            on_first_token()
+            await asyncio.sleep(self.duration * self._slowdown())
+        finally:
+            self.in_flight -= 1
+
+
+async def _run(label: str, scheduler: ModelScheduler | None, args) -> None:
+    model = SimulatedModel(args.ttft, args.duration, args.knee)
+    ttfts: list[float] = []
+
+    def slot(priority: int):
+        if scheduler is None:
+            return contextlib.nullcontext()
+        return scheduler.slot(priority, tokens=1000)
+
+    async def request(priority: int) -> None:
+        start = time.perf_counter()
+        async with slot(priority) as lease:
+
+            def first_token() -> None:
+                if priority == INTERACTIVE:
+                    ttfts.append((time.perf_counter() - start) * 1000)
+                if lease is not None:
+                    lease.first_token()
+
+            await model.stream(first_token)
+
+    async def interactive() -> None:
+        briefings = []
+        for _ in range(args.interactive):
+            briefings.append(asyncio.create_task(request(INTERACTIVE)))
+            await asyncio.sleep(args.interval)
+        await asyncio.gather(*briefings)
+
+    start = time.perf_counter()
+    batch = asyncio.gather(*(request(BATCH) for _ in range(args.batch)))
+    await asyncio.sleep(0.05)  # the import is already running
+    await interactive()
+    await batch
+    drained = time.perf_counter() - start
+    ttfts.sort()
+    print(
+        f"{label:<12} interactive ttft p50={statistics.median(ttfts):7.0f}ms  "
+        f"p95={ttfts[int(len(ttfts) * 0.95)]:7.0f}ms  batch drained in {drained:5.1f}s"
+    )
+    if scheduler is not None:
+        print(f"{'':<12} {scheduler.stats()}")
+
+
+async def main(args) -> None:
+    print(
+        f"{args.batch} batch + {args.interactive} interactive requests, "
+        f"knee={args.knee} in flight"
+    )
+    await _run("unscheduled", None, args)
+    await _run(
+        "scheduled",
+        ModelScheduler(
+            "sim",
+            max_concurrency=args.concurrency,
+            interactive_reserved=args.reserved,
+            target_ms=args.target_ms,
+        ),
+        args,
+    )
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--batch", type=int, default=60)
+    parser.add_argument("--interactive", type=int, default=20)
+    parser.add_argument("--interval", type=float, default=0.2, help="seconds")
+    parser.add_argument("--ttft", type=float, default=0.3, help="seconds")
+    parser.add_argument("--duration", type=float, default=1.0, help="seconds")
+    parser.add_argument("--knee", type=int, default=8)
+    parser.add_argument("--concurrency", type=int, default=8)
+    parser.add_argument("--reserved", type=int, default=2)
+    parser.add_argument("--target-ms", type=float, default=1500.0)
+    asyncio.run(main(parser.parse_args()))
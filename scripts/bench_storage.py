@@ -0,0 +1,111 @@
+"""Benchmark: list/filter/page latency of the memory vs SQLite commitment stores.
+
+    python scripts/bench_storage.py [--commitments 100000]
+"""
+
+import argparse
+import asyncio
+import os
+import random
+import statistics
+import sys
+import tempfile
+import time
+import uuid
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+from backend.models.schemas import (  # noqa: E402
+    Commitment,
+    CommitmentDirection,
+    CommitmentStatus,
+)
+from backend.storage import create_repositories  # noqa: E402
+
+NAMES = [f"Contact {i:04d}" for i in range(2000)]
+
+
+def _make_commitments(n: int) -> list[Commitment]:
+    rng = random.Random(42)
+    base = datetime(2026, 1, 1, tzinfo=timezone.utc)
+    items = []
+    for _ in range(n):
+        owner, recipient = rng.sample(NAMES, 2)
+        items.append(
+            Commitment(
+                id=str(uuid.uuid4()),
+                description="Send the updated proposal and pricing sheet",
+                owner=owner,
+                recipient=recipient,
+                direction=CommitmentDirection.OWED_TO_ME,
+                due_date=base + timedelta(days=rng.randint(0, 720))
+                if rng.random() < 0.7
+                else None,
+                status=rng.choice(list(CommitmentStatus)),
+                meeting_id=str(uuid.uuid4()),
+                meeting_title="Weekly sync",
+                created_at=base + timedelta(minutes=rng.randint(0, 500000)),
+            )
+        )
+    return items
+
+
+async def _items(page_coro) -> list:
+    return (await page_coro).items
+
+
+async def _time(fn, repeat: int) -> tuple[float, int]:
+    samples, size = [], 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = await fn()
+        samples.append((time.perf_counter() - start) * 1000)
+        size = len(result) if isinstance(result, list) else result
+    return statistics.median(samples), size
+
+
+async def bench(backend: str, commitments: list[Commitment], repeat: int) -> None:
+    tmp = tempfile.mkdtemp()
+    _, store = create_repositories(backend, os.path.join(tmp, "bench.db"))
+    start = time.perf_counter()
+    for i in range(0, len(commitments), 5000):
+        await store.save_many(commitments[i : i + 5000])
+    load = time.perf_counter() - start
+    print(f"\n[{backend}] loaded {len(commitments)} commitments in {load:.1f}s")
+
+    contact = NAMES[7]
+    cases = [
+        ("list all", lambda: store.list()),
+        ("status=completed", lambda: store.list(status=CommitmentStatus.COMPLETED)),
+        ("contact", lambda: store.list(contact=contact)),
+        (
+            "status+contact",
+            lambda: store.list(status=CommitmentStatus.PENDING, contact=contact),
+        ),
+        ("page of 50", lambda: _items(store.page(limit=50))),
+        (
+            "status page of 50",
+            lambda: _items(store.page(status=CommitmentStatus.PENDING, limit=50)),
+        ),
+        ("get by id", lambda: store.get(commitments[len(commitments) // 2].id)),
+    ]
+    for label, fn in cases:
+        ms, size = await _time(fn, repeat)
+        rows = size if isinstance(size, int) else 1
+        print(f"  {label:<18} {ms:9.2f}ms  ({rows} rows)")
+
+
+async def main(n: int, repeat: int) -> None:
+    commitments = _make_commitments(n)
+    for backend in ("memory", "sqlite"):
+        await bench(backend, [c.model_copy() for c in commitments], repeat)
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--commitments", type=int, default=100_000)
+    parser.add_argument("--repeat", type=int, default=5)
+    args = parser.parse_args()
+    asyncio.run(main(args.commitments, args.repeat))
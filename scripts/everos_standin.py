@@ -0,0 +1,104 @@
+"""Local stand-in for the EverOS Cloud API, used by the benchmarks.
+
+Implements the subset of /api/v0 that CloudClient talks to, with a
+configurable per-request latency to imitate network and server time.
+``app.state.latency`` and ``app.state.fail_rate`` (fraction of requests
+answered with a 503) can be changed while the server runs.
+"""
+
+import asyncio
+import random
+import socket
+import threading
+import time
+
+import uvicorn
+from fastapi import FastAPI, Request
+from fastapi.responses import JSONResponse
+
+
+def create_app(latency: float = 0.005) -> FastAPI:
+    app = FastAPI(title="EverOS stand-in")
+    app.state.memories = []
+    app.state.requests = 0
+    app.state.latency = latency
+    app.state.fail_rate = 0.0
+
+    @app.middleware("http")
+    async def inject_failures(request: Request, call_next):
+        if random.random() < app.state.fail_rate:
+            app.state.requests += 1
+            await asyncio.sleep(app.state.latency)
+            return JSONResponse({"status": "unavailable"}, status_code=503)
+        return await call_next(request)
+
+    @app.post("/api/v0/memories")
+    async def store(request: Request):
+        app.state.requests += 1
+        body = await request.json()
+        messages = body.get("messages", [body])
+        app.state.memories.extend(messages)
+        await asyncio.sleep(app.state.latency)
+        return {
+            "status": "ok",
+            "result": {"count": len(messages), "status_info": "stand-in"},
+        }
+
+    @app.get("/api/v0/memories/search")
+    async def search(request: Request):
+        app.state.requests += 1
+        body = await request.json()
+        await asyncio.sleep(app.state.latency)
+        query = body.get("query", "").lower()
+        items = [
+            {
+                "memory_type": "episodic_memory",
+                "summary": m.get("content", "")[:200],
+                "timestamp": m.get("create_time", ""),
+                "group_id": m.get("group_id", ""),
+                "group_name": m.get("group_name", ""),
+                "sender_name": m.get("sender_name", ""),
+            }
+            for m in app.state.memories
+            if query.split()[0:1] and query.split()[0] in m.get("content", "").lower()
+        ][: body.get("top_k", 10)]
+        return {"status": "ok", "result": {"memories": items, "total_count": len(items)}}
+
+    @app.get("/api/v0/memories")
+    async def list_memories(limit: int = 40):
+        app.state.requests += 1
+        await asyncio.sleep(app.state.latency)
+        return {"status": "ok", "result": {"memories": app.state.memories[:limit]}}
+
+    return app
+
+
+class StandInServer:
+    """Run the stand-in app with uvicorn on a background thread."""
+
+    def __init__(self, latency: float = 0.005):
+        self.app = create_app(latency)
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            self.port = sock.getsockname()[1]
+        self.base_url = f"http://127.0.0.1:{self.port}"
+        self._server = uvicorn.Server(
+            uvicorn.Config(
+                self.app,
+                host="127.0.0.1",
+                port=self.port,
+                log_level="warning",
+                backlog=4096,
+            )
+        )
+        self._thread = threading.Thread(target=self._server.run, daemon=True)
+
+    def __enter__(self) -> "StandInServer":
+        self._thread.start()
+        while not self._server.started:
+            time.sleep(0.01)
+        return self
+
+    def __exit__(self, *exc) -> None:
+        self._server.should_exit = True
+        self._thread.join(timeout=5)